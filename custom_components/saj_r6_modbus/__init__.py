@@ -7,13 +7,40 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.util import slugify
+from pymodbus.exceptions import ModbusException
 
 from .const import (
+    CAPTURE_MAX_BYTES,
+    CONF_CAPABILITIES,
+    CONF_CLOSE_AFTER_POLL,
+    CONF_DEVICE_IDS,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_INVERTER_CLOCK,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_READ_REQUEST_COST,
+    CONF_RECORD_FRAMES,
+    CONF_ROLLUP_STATISTICS,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_CLOSE_AFTER_POLL,
+    DEFAULT_DEVICE_ID,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_INVERTER_CLOCK,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_READ_REQUEST_COST,
+    DEFAULT_RECORD_FRAMES,
+    DEFAULT_ROLLUP_STATISTICS,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
     DOMAIN,
+    SERVICE_REFRESH_CAPABILITIES,
 )
+from .capture import SajFrameRecorder
+from .connection import SAJModbusConnection
 from .hub import SAJModbusHub
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,6 +53,36 @@ SAJ_MODBUS_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
         ): cv.positive_int,
+        vol.Optional(
+            CONF_FAST_SCAN_INTERVAL, default=DEFAULT_FAST_SCAN_INTERVAL
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_SLOW_SCAN_INTERVAL, default=DEFAULT_SLOW_SCAN_INTERVAL
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_MIN_SCAN_INTERVAL, default=DEFAULT_MIN_SCAN_INTERVAL
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_CLOSE_AFTER_POLL, default=DEFAULT_CLOSE_AFTER_POLL
+        ): cv.boolean,
+        vol.Optional(
+            CONF_READ_REQUEST_COST, default=DEFAULT_READ_REQUEST_COST
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_RECORD_FRAMES, default=DEFAULT_RECORD_FRAMES
+        ): cv.boolean,
+        vol.Optional(
+            CONF_INVERTER_CLOCK, default=DEFAULT_INVERTER_CLOCK
+        ): cv.boolean,
+        vol.Optional(
+            CONF_ROLLUP_STATISTICS, default=DEFAULT_ROLLUP_STATISTICS
+        ): cv.boolean,
+        vol.Optional(CONF_DEVICE_IDS, default=[DEFAULT_DEVICE_ID]): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=247))]
+        ),
     }
 )
 
@@ -33,32 +90,143 @@ CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: vol.Schema({cv.slug: SAJ_MODBUS_SCHEMA})}, extra=vol.ALLOW_EXTRA
 )
 
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "binary_sensor"]
 
 
 async def async_setup(hass, config):
     """Set up the SAJ R6 modbus component."""
     hass.data[DOMAIN] = {}
+
+    async def async_refresh_capabilities(call: ServiceCall) -> None:
+        """Probe the inverters again and reload their entries."""
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            hubs = hass.data[DOMAIN].get(entry.data[CONF_NAME], {}).get("hubs", ())
+            if not hubs:
+                continue
+            if await async_probe_hubs(hass, entry, hubs):
+                await hass.config_entries.async_reload(entry.entry_id)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH_CAPABILITIES, async_refresh_capabilities
+    )
+    return True
+
+
+async def async_probe_hubs(
+    hass: HomeAssistant, entry: ConfigEntry, hubs: list[SAJModbusHub]
+) -> bool:
+    """Probe the inverters of the hubs, return True if a stored profile changed."""
+    capabilities = dict(entry.data.get(CONF_CAPABILITIES, {}))
+    for hub in hubs:
+        try:
+            capabilities[str(hub.device_id)] = await hub.async_probe_capabilities()
+        except (ModbusException, OSError) as err:
+            """E.g. asleep, keep the profile it has"""
+            _LOGGER.warning(
+                "Probing the capabilities of %s failed: %s", hub.name, err
+            )
+    if capabilities == entry.data.get(CONF_CAPABILITIES, {}):
+        return False
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_CAPABILITIES: capabilities}
+    )
     return True
 
 
+async def _async_probe_unprobed(
+    hass: HomeAssistant, entry: ConfigEntry, hubs: list[SAJModbusHub]
+) -> None:
+    """Probe the inverters the probe missed before, reload once one answered."""
+    if await async_probe_hubs(hass, entry, hubs):
+        # Reloading cancels the background tasks of the entry, this one included.
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up a SAJ R6 mobus."""
     host = entry.data[CONF_HOST]
     name = entry.data[CONF_NAME]
     port = entry.data[CONF_PORT]
     scan_interval = entry.data[CONF_SCAN_INTERVAL]
+    close_after_poll = entry.data.get(
+        CONF_CLOSE_AFTER_POLL, DEFAULT_CLOSE_AFTER_POLL)
+    # Entries created before tiered polling read everything at scan_interval.
+    fast_scan_interval = entry.data.get(CONF_FAST_SCAN_INTERVAL, scan_interval)
+    slow_scan_interval = entry.data.get(CONF_SLOW_SCAN_INTERVAL, scan_interval)
+    min_scan_interval = entry.data.get(
+        CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+    max_scan_interval = entry.data.get(
+        CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+    read_request_cost = entry.data.get(
+        CONF_READ_REQUEST_COST, DEFAULT_READ_REQUEST_COST)
+    device_ids = entry.data.get(CONF_DEVICE_IDS, [DEFAULT_DEVICE_ID])
+    record_frames = entry.data.get(CONF_RECORD_FRAMES, DEFAULT_RECORD_FRAMES)
+    inverter_clock = entry.data.get(CONF_INVERTER_CLOCK, DEFAULT_INVERTER_CLOCK)
+    # Entries created before the capability probe read everything.
+    capabilities = entry.data.get(CONF_CAPABILITIES, {})
+    # External statistics go through the recorder.
+    rollup_statistics = "recorder" in hass.config.components and entry.data.get(
+        CONF_ROLLUP_STATISTICS, DEFAULT_ROLLUP_STATISTICS)
 
     _LOGGER.debug("Setup %s.%s", DOMAIN, name)
 
-    hub = SAJModbusHub(hass, name, host, port, scan_interval)
-    await hub.async_config_entry_first_refresh()
+    """All inverters behind the gateway share one connection."""
+    connection = SAJModbusConnection(host, port)
+    entry.async_on_unload(connection.close)
 
-    """Register the hub."""
-    hass.data[DOMAIN][name] = {"hub": hub}
+    """Raw frames of all inverters go to one capture file."""
+    frame_recorder = None
+    if record_frames:
+        frame_recorder = SajFrameRecorder(
+            hass.config.path(f"{DOMAIN}.{slugify(name)}.frames"), CAPTURE_MAX_BYTES
+        )
+
+    hubs = []
+    for device_id in device_ids:
+        hub = SAJModbusHub(
+            hass,
+            name if device_id == DEFAULT_DEVICE_ID else f"{name} {device_id}",
+            connection,
+            device_id,
+            scan_interval,
+            close_after_poll,
+            fast_scan_interval,
+            slow_scan_interval,
+            read_request_cost,
+            frame_recorder,
+            min_scan_interval,
+            max_scan_interval,
+            inverter_clock,
+            rollup_statistics,
+            capabilities.get(str(device_id)),
+        )
+        entry.async_on_unload(hub.async_track_enabled_entities())
+        if rollup_statistics:
+            entry.async_on_unload(hub.async_track_rollups())
+        await hub.async_restore_snapshot()
+        hubs.append(hub)
+
+    """Register the hubs."""
+    hass.data[DOMAIN][name] = {"hubs": hubs}
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    """Entities show the snapshot until the first poll, which may time out"""
+    for hub in hubs:
+        entry.async_create_background_task(
+            hass, hub.async_refresh(), f"{DOMAIN} {hub.name} first refresh"
+        )
+
+    """Inverters the probe missed, e.g. asleep when the entry was created"""
+    if CONF_CAPABILITIES in entry.data:
+        unprobed = [hub for hub in hubs if str(hub.device_id) not in capabilities]
+        if unprobed:
+            entry.async_create_background_task(
+                hass,
+                _async_probe_unprobed(hass, entry, unprobed),
+                f"{DOMAIN} {name} capability probe",
+            )
+
     return True
 
 
@@ -0,0 +1,81 @@
+"""String current anomaly detection for SAJ R6 Inverter Modbus."""
+
+from array import array
+from collections.abc import Iterable
+
+
+class SajStringAnomalyDetector:
+    """Detect PV strings that drift below their sibling string.
+
+    Both strings of a PV input see the same irradiance, so the ratio of a
+    string current to the mean of the pair cancels out the weather. Each
+    string keeps an EWMA of that ratio in a fixed slot, which makes a
+    sample O(1) in time and memory. A string is anomalous once its EWMA
+    drops below 1 - threshold and recovers above 1 - threshold / 2.
+    """
+
+    def __init__(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        alpha: float,
+        threshold: float,
+        min_current: float,
+        min_samples: int,
+    ):
+        """Initialize the detector."""
+        self.keys = [key for pair in pairs for key in pair]
+        self._index = {key: index for index, key in enumerate(self.keys)}
+        self._alpha = alpha
+        self._threshold = threshold
+        self._min_current = min_current
+        self._min_samples = min_samples
+
+        size = len(self.keys)
+        self._ewma = array("d", [1.0] * size)
+        self._samples = array("L", [0] * size)
+        # Strings that never carried current are not connected.
+        self._seen = array("B", [0] * size)
+        self._anomalous = array("B", [0] * size)
+
+    def add(self, data: dict) -> list[tuple[str, bool]]:
+        """Add the currents of one poll, return the strings whose state changed."""
+        changes = []
+        for index in range(0, len(self.keys), 2):
+            currents = data.get(self.keys[index]), data.get(self.keys[index + 1])
+            if not all(isinstance(current, (int, float)) for current in currents):
+                continue
+            for offset, current in enumerate(currents):
+                if current >= self._min_current:
+                    self._seen[index + offset] = 1
+            mean = sum(currents) / 2
+            if not (self._seen[index] and self._seen[index + 1]) or mean < self._min_current:
+                continue
+
+            for offset, current in enumerate(currents):
+                slot = index + offset
+                self._ewma[slot] += self._alpha * (current / mean - self._ewma[slot])
+                self._samples[slot] += 1
+                if self._samples[slot] < self._min_samples:
+                    continue
+                limit = 1 - (self._threshold / 2 if self._anomalous[slot] else self._threshold)
+                anomalous = self._ewma[slot] < limit
+                if anomalous != self._anomalous[slot]:
+                    self._anomalous[slot] = anomalous
+                    changes.append((self.keys[slot], anomalous))
+        return changes
+
+    def ratio(self, key: str) -> float | None:
+        """Return the smoothed ratio of a string to its pair, None while learning."""
+        slot = self._index[key]
+        if self._samples[slot] < self._min_samples:
+            return None
+        return self._ewma[slot]
+
+    def states(self) -> dict[str, bool | None]:
+        """Return the anomaly state per string, None while learning."""
+        return {
+            f"{key}anomaly": bool(self._anomalous[slot])
+            if self._samples[slot] >= self._min_samples
+            else None
+            for slot, key in enumerate(self.keys)
+        }
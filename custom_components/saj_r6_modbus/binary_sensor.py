@@ -0,0 +1,71 @@
+"""Binary Sensor Platform Device for SAJ R6 Inverter Modbus."""
+
+from __future__ import annotations
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.components.binary_sensor import BinarySensorEntity
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    STRING_ANOMALY_SENSOR_TYPES,
+    SajModbusBinarySensorEntityDescription,
+)
+
+from .hub import SAJModbusHub
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up entry for hub."""
+    entities = []
+    for hub in hass.data[DOMAIN][entry.data[CONF_NAME]]["hubs"]:
+        for description in STRING_ANOMALY_SENSOR_TYPES.values():
+            if description.key in hub.absent_keys:
+                continue
+            entities.append(
+                SajStringAnomalySensor(hub.name, hub, hub.device_info, description)
+            )
+
+    async_add_entities(entities)
+    return True
+
+
+class SajStringAnomalySensor(CoordinatorEntity, BinarySensorEntity):
+    """Representation of a SAJ R6 PV string anomaly."""
+
+    def __init__(
+        self,
+        platform_name: str,
+        hub: SAJModbusHub,
+        device_info,
+        description: SajModbusBinarySensorEntityDescription,
+    ):
+        """Initialize the binary sensor."""
+        self._attr_name = f"{platform_name} {description.name}"
+        self._attr_unique_id = f"{platform_name}_{description.key}"
+        self._attr_device_info = device_info
+        self.entity_description: SajModbusBinarySensorEntityDescription = description
+
+        super().__init__(coordinator=hub, context=description.key)
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state."""
+        await super().async_added_to_hass()
+        self._update_from_data(self.coordinator.data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the state once per coordinator update."""
+        self._update_from_data(self.coordinator.data)
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self, data: dict) -> None:
+        """Update the anomaly state and the smoothed current ratio."""
+        self._attr_is_on = data.get(self.entity_description.key)
+        ratio = self.coordinator.string_anomalies.ratio(
+            self.entity_description.key.removesuffix("anomaly")
+        )
+        self._attr_extra_state_attributes = {
+            "current_ratio": round(ratio, 3) if ratio is not None else None
+        }
@@ -0,0 +1,67 @@
+"""Circuit breaker for SAJ R6 Inverter Modbus."""
+
+import random
+import time
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling an unreachable inverter until a backoff delay has passed.
+
+    The breaker opens after failure_threshold failed polls in a row. While
+    open no request is sent; once the jittered, exponentially growing delay
+    has passed it turns half-open and lets one probe through. A successful
+    probe closes it again, a failed one reopens it with a doubled delay.
+    """
+
+    def __init__(
+        self, failure_threshold: int, backoff_initial: float, backoff_max: float
+    ):
+        """Initialize the breaker."""
+        self._failure_threshold = failure_threshold
+        self._backoff_initial = backoff_initial
+        self._backoff_max = backoff_max
+        self._backoff = 0.0
+        self._retry_at = 0.0
+
+        self.state = BREAKER_CLOSED
+        self.failure_count = 0
+        self.open_count = 0
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds left before the next probe."""
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return True if the inverter may be polled."""
+        if self.state == BREAKER_OPEN and time.monotonic() >= self._retry_at:
+            self.state = BREAKER_HALF_OPEN
+        return self.state != BREAKER_OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.state = BREAKER_CLOSED
+        self.failure_count = 0
+        self._backoff = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failed poll, opening the breaker when needed."""
+        self.failure_count += 1
+        if (
+            self.state != BREAKER_HALF_OPEN
+            and self.failure_count < self._failure_threshold
+        ):
+            return
+
+        self._backoff = min(
+            max(self._backoff * 2, self._backoff_initial), self._backoff_max
+        )
+        self._retry_at = time.monotonic() + random.uniform(
+            self._backoff / 2, self._backoff
+        )
+        self.open_count += 1
+        self.state = BREAKER_OPEN
@@ -0,0 +1,209 @@
+"""Raw register frame capture and replay for SAJ R6 Inverter Modbus.
+
+A capture file is a sequence of fixed-size records of CAPTURE_RECORD_WORDS
+little-endian uint16 words, so it can be memory mapped and indexed directly:
+
+    words 0-3   capture time in milliseconds since the epoch, low word first
+    word  4     Modbus device ID
+    word  5     start address of the read
+    word  6     number of registers read
+    words 7-    the registers, zero padded to MAX_READ_COUNT
+"""
+
+import asyncio
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+import mmap
+import os
+import sys
+import threading
+import time
+
+from .const import MAX_READ_COUNT
+
+CAPTURE_HEADER_WORDS = 7
+CAPTURE_RECORD_WORDS = CAPTURE_HEADER_WORDS + MAX_READ_COUNT
+CAPTURE_RECORD_SIZE = CAPTURE_RECORD_WORDS * 2
+
+
+@dataclass
+class CapturedFrame:
+    """A register frame read from a capture file."""
+
+    timestamp: float
+    device_id: int
+    address: int
+    registers: list[int]
+
+
+def _record_header(device_id: int, address: int, count: int) -> tuple[int, ...]:
+    """Return the header words of a record captured now."""
+    timestamp = int(time.time() * 1000)
+    return (
+        timestamp & 0xFFFF,
+        timestamp >> 16 & 0xFFFF,
+        timestamp >> 32 & 0xFFFF,
+        timestamp >> 48 & 0xFFFF,
+        device_id,
+        address,
+        count,
+    )
+
+
+def _unpack_record(record: array) -> CapturedFrame:
+    """Return the frame held by the words of a record."""
+    timestamp = record[0] | record[1] << 16 | record[2] << 32 | record[3] << 48
+    return CapturedFrame(
+        timestamp / 1000,
+        record[4],
+        record[5],
+        record[CAPTURE_HEADER_WORDS:CAPTURE_HEADER_WORDS + record[6]].tolist(),
+    )
+
+
+class SajFrameRingBuffer:
+    """Keep the last frames in a preallocated array of capture records."""
+
+    def __init__(self, size: int):
+        """Initialize the buffer."""
+        self._size = size
+        self._records = array("H", bytes(size * CAPTURE_RECORD_SIZE))
+        self._next = 0
+        self._count = 0
+
+    def record(self, device_id: int, address: int, registers: list[int]) -> None:
+        """Store one frame, overwriting the oldest one when full."""
+        offset = self._next * CAPTURE_RECORD_WORDS
+        end = offset + CAPTURE_RECORD_WORDS
+        self._records[offset:offset + CAPTURE_HEADER_WORDS] = array(
+            "H", _record_header(device_id, address, len(registers))
+        )
+        self._records[offset + CAPTURE_HEADER_WORDS:end] = array(
+            "H", registers + [0] * (MAX_READ_COUNT - len(registers))
+        )
+        self._next = (self._next + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def frames(self) -> list[CapturedFrame]:
+        """Return the stored frames, oldest first."""
+        first = (self._next - self._count) % self._size
+        return [
+            _unpack_record(
+                self._records[offset:offset + CAPTURE_RECORD_WORDS])
+            for offset in (
+                (first + index) % self._size * CAPTURE_RECORD_WORDS
+                for index in range(self._count)
+            )
+        ]
+
+
+class SajFrameRecorder:
+    """Append raw register frames to a size rotated capture file."""
+
+    def __init__(self, path: str, max_bytes: int):
+        """Initialize the recorder."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self._buffer = array("H")
+        # The hubs of all inverters behind a gateway write from executor threads.
+        self._write_lock = threading.Lock()
+
+    def record(self, device_id: int, address: int, registers: list[int]) -> None:
+        """Buffer one frame, call from the event loop."""
+        self._buffer.extend(_record_header(device_id, address, len(registers)))
+        self._buffer.extend(registers)
+        self._buffer.extend([0] * (MAX_READ_COUNT - len(registers)))
+
+    def take(self) -> array:
+        """Return and reset the buffered frames."""
+        buffer, self._buffer = self._buffer, array("H")
+        return buffer
+
+    def write(self, buffer: array) -> None:
+        """Append the frames to the capture file, runs in the executor."""
+        if not buffer:
+            return
+        if sys.byteorder != "little":
+            buffer.byteswap()
+        with self._write_lock:
+            if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                os.replace(self.path, f"{self.path}.1")
+            with open(self.path, "ab") as capture:
+                buffer.tofile(capture)
+
+
+def read_capture(path: str) -> Iterator[CapturedFrame]:
+    """Iterate over the frames of a capture file without loading it."""
+    with open(path, "rb") as capture:
+        size = os.fstat(capture.fileno()).st_size
+        size -= size % CAPTURE_RECORD_SIZE
+        if not size:
+            return
+        with mmap.mmap(capture.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(0, size, CAPTURE_RECORD_SIZE):
+                record = array("H", mapped[offset:offset + CAPTURE_RECORD_SIZE])
+                if sys.byteorder != "little":
+                    record.byteswap()
+                yield _unpack_record(record)
+
+
+@dataclass
+class ReplayResponse:
+    """Read response served from a capture file."""
+
+    registers: list[int]
+
+    def isError(self) -> bool:
+        """Return True if no frame matched the request."""
+        return not self.registers
+
+
+class SajReplayConnection:
+    """Serve reads from a capture file instead of an inverter.
+
+    Drop-in replacement for SAJModbusConnection, e.g. to benchmark the decoder
+    or reproduce a bug offline. Frames are served in capture order, at the
+    original pace when realtime is set or as fast as possible otherwise.
+    """
+
+    def __init__(self, path: str, realtime: bool = False):
+        """Initialize the replay."""
+        self._frames = read_capture(path)
+        self._realtime = realtime
+        self._offset: float | None = None
+
+        self.max_read_count = MAX_READ_COUNT
+        self.connect_count = 1
+        self.connected = True
+        self.last_rtt = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """Return connection statistics."""
+        return {"connect_count": self.connect_count}
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+    async def async_close_when_idle(self) -> None:
+        """Nothing to close."""
+
+    async def read_holding_registers(
+        self, unit: int, address: int, count: int
+    ) -> ReplayResponse:
+        """Return the next captured frame matching the request."""
+        for frame in self._frames:
+            if (frame.device_id, frame.address, len(frame.registers)) != (
+                unit,
+                address,
+                count,
+            ):
+                continue
+            if self._realtime:
+                if self._offset is None:
+                    self._offset = time.time() - frame.timestamp
+                await asyncio.sleep(
+                    max(0, frame.timestamp + self._offset - time.time()))
+            return ReplayResponse(frame.registers)
+        return ReplayResponse([])
@@ -1,6 +1,7 @@
 """Config flow for SAJ R6 Inverter Modbus."""
 
 import ipaddress
+import logging
 import re
 
 import voluptuous as vol
@@ -8,15 +9,56 @@ from homeassistant import config_entries
 
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant, callback
+from pymodbus.exceptions import ModbusException
+
+from .const import (
+    CONF_CAPABILITIES,
+    CONF_CLOSE_AFTER_POLL,
+    CONF_DEVICE_IDS,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_INVERTER_CLOCK,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_READ_REQUEST_COST,
+    CONF_RECORD_FRAMES,
+    CONF_ROLLUP_STATISTICS,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_CLOSE_AFTER_POLL,
+    DEFAULT_DEVICE_ID,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_INVERTER_CLOCK,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DEFAULT_READ_REQUEST_COST,
+    DEFAULT_RECORD_FRAMES,
+    DEFAULT_ROLLUP_STATISTICS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .connection import SAJModbusConnection
+from .hub import async_probe_inverter
 
-from .const import DEFAULT_NAME, DEFAULT_PORT, DEFAULT_SCAN_INTERVAL, DOMAIN
+_LOGGER = logging.getLogger(__name__)
 
 DATA_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
         vol.Required(CONF_HOST): str,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Optional(CONF_DEVICE_IDS, default=str(DEFAULT_DEVICE_ID)): str,
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        vol.Optional(CONF_FAST_SCAN_INTERVAL, default=DEFAULT_FAST_SCAN_INTERVAL): int,
+        vol.Optional(CONF_SLOW_SCAN_INTERVAL, default=DEFAULT_SLOW_SCAN_INTERVAL): int,
+        vol.Optional(CONF_MIN_SCAN_INTERVAL, default=DEFAULT_MIN_SCAN_INTERVAL): int,
+        vol.Optional(CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL): int,
+        vol.Optional(CONF_CLOSE_AFTER_POLL, default=DEFAULT_CLOSE_AFTER_POLL): bool,
+        vol.Optional(CONF_READ_REQUEST_COST, default=DEFAULT_READ_REQUEST_COST): int,
+        vol.Optional(CONF_RECORD_FRAMES, default=DEFAULT_RECORD_FRAMES): bool,
+        vol.Optional(CONF_INVERTER_CLOCK, default=DEFAULT_INVERTER_CLOCK): bool,
+        vol.Optional(CONF_ROLLUP_STATISTICS, default=DEFAULT_ROLLUP_STATISTICS): bool,
     }
 )
 
@@ -31,6 +73,39 @@ def host_valid(host):
         return all(x and not disallowed.search(x) for x in host.split("."))
 
 
+def parse_device_ids(device_ids: str) -> list[int] | None:
+    """Return the Modbus device IDs of a comma separated list, None if invalid."""
+    try:
+        parsed = [int(device_id) for device_id in device_ids.split(",")]
+    except ValueError:
+        return None
+    if not parsed or len(set(parsed)) != len(parsed):
+        return None
+    if not all(1 <= device_id <= 247 for device_id in parsed):
+        return None
+    return parsed
+
+
+async def async_probe_capabilities(host: str, port: int, device_ids: list[int]) -> dict:
+    """Return the capability profile per device ID, of the devices that answered."""
+    connection = SAJModbusConnection(host, port)
+    capabilities = {}
+    try:
+        for device_id in device_ids:
+            try:
+                capabilities[str(device_id)] = await async_probe_inverter(
+                    connection, device_id
+                )
+            except (ModbusException, OSError) as err:
+                # E.g. the inverter is asleep, it is probed again at setup.
+                _LOGGER.warning(
+                    "Probing the capabilities of device %s failed: %s", device_id, err
+                )
+    finally:
+        connection.close()
+    return capabilities
+
+
 @callback
 def saj_modbus_entries(hass: HomeAssistant):
     """Return the hosts already configured."""
@@ -58,16 +133,27 @@ class SAJModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             host = user_input[CONF_HOST]
+            device_ids = parse_device_ids(user_input[CONF_DEVICE_IDS])
 
             if self._host_in_configuration_exists(host):
                 errors[CONF_HOST] = "already_configured"
             elif not host_valid(user_input[CONF_HOST]):
                 errors[CONF_HOST] = "invalid host IP"
+            elif device_ids is None:
+                errors[CONF_DEVICE_IDS] = "invalid_device_ids"
             else:
                 await self.async_set_unique_id(user_input[CONF_HOST])
                 self._abort_if_unique_id_configured()
+                capabilities = await async_probe_capabilities(
+                    host, user_input[CONF_PORT], device_ids
+                )
                 return self.async_create_entry(
-                    title=user_input[CONF_NAME], data=user_input
+                    title=user_input[CONF_NAME],
+                    data={
+                        **user_input,
+                        CONF_DEVICE_IDS: device_ids,
+                        CONF_CAPABILITIES: capabilities,
+                    },
                 )
 
         return self.async_show_form(
@@ -0,0 +1,151 @@
+"""SAJ R6 Modbus TCP connection manager."""
+
+import asyncio
+import logging
+import random
+import socket
+import time
+
+from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.exceptions import ConnectionException
+
+from .const import (
+    CONNECT_BACKOFF_INITIAL,
+    CONNECT_BACKOFF_MAX,
+    CONNECTION_IDLE_CHECK,
+    MAX_READ_COUNT,
+    MODBUS_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SAJModbusConnection:
+    """Long-lived Modbus TCP connection with lazy reconnect."""
+
+    def __init__(self, host: str, port: int):
+        """Initialize the connection."""
+        self._host = host
+        # Reconnects are handled here, so disable the pymodbus auto reconnect.
+        self._client = AsyncModbusTcpClient(
+            host=host, port=port, timeout=MODBUS_TIMEOUT, reconnect_delay=0
+        )
+        # Requests of all inverters behind the gateway wait here in FIFO order.
+        self._lock = asyncio.Lock()
+        self._queued = 0
+
+        self._backoff = 0.0
+        self._next_connect = 0.0
+        self._last_used = 0.0
+
+        # Lowered when the gateway turns out to reject large reads.
+        self.max_read_count = MAX_READ_COUNT
+        self.connect_count = 0
+        self.connect_time = 0.0
+        self.request_count = 0
+        self.reused_count = 0
+        self.last_rtt = 0.0
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the socket is open."""
+        return self._client.connected
+
+    @property
+    def stats(self) -> dict:
+        """Return connection statistics."""
+        return {
+            "connect_count": self.connect_count,
+            "connect_time": round(self.connect_time, 3),
+            "request_count": self.request_count,
+            "max_read_count": self.max_read_count,
+            "reuse_rate": round(self.reused_count / self.request_count, 3)
+            if self.request_count
+            else None,
+        }
+
+    def close(self) -> None:
+        """Disconnect client."""
+        self._client.close()
+
+    async def async_close_when_idle(self) -> None:
+        """Disconnect after the request in flight, unless more are queued."""
+        async with self._lock:
+            if not self._queued:
+                self._client.close()
+
+    async def _async_connect(self) -> None:
+        """Open the socket, honouring the reconnect backoff."""
+        now = time.monotonic()
+        if now < self._next_connect:
+            raise ConnectionException(
+                f"{self._host}: reconnect backoff, retry in {self._next_connect - now:.1f}s"
+            )
+
+        start = time.monotonic()
+        connected = await self._client.connect()
+        self.connect_time += time.monotonic() - start
+
+        if not connected:
+            self._backoff = min(
+                max(self._backoff * 2, CONNECT_BACKOFF_INITIAL), CONNECT_BACKOFF_MAX
+            )
+            self._next_connect = time.monotonic() + random.uniform(
+                self._backoff / 2, self._backoff
+            )
+            raise ConnectionException(f"{self._host}: failed to connect")
+
+        self.connect_count += 1
+        self._backoff = 0.0
+        self._enable_keepalive()
+        _LOGGER.debug("Connected to %s (%s)", self._host, self.stats)
+
+    def _enable_keepalive(self) -> None:
+        """Let the OS probe the idle socket so a dead peer is detected."""
+        transport = self._client.ctx.transport
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, CONNECTION_IDLE_CHECK
+            )
+
+    async def read_holding_registers(self, unit: int, address: int, count: int):
+        """Read holding registers, reusing the open socket when possible."""
+        self._queued += 1
+        try:
+            await self._lock.acquire()
+        finally:
+            self._queued -= 1
+
+        try:
+            transport = self._client.ctx.transport
+            if (
+                transport is not None
+                and time.monotonic() - self._last_used > CONNECTION_IDLE_CHECK
+                and transport.is_closing()
+            ):
+                # Peer closed the socket while idle.
+                self._client.close()
+
+            self.request_count += 1
+            if self._client.connected:
+                self.reused_count += 1
+            else:
+                await self._async_connect()
+
+            start = time.monotonic()
+            try:
+                return await self._client.read_holding_registers(
+                    address=address, count=count, device_id=unit
+                )
+            except ConnectionException:
+                self._client.close()
+                raise
+            finally:
+                self._last_used = time.monotonic()
+                self.last_rtt = self._last_used - start
+        finally:
+            self._lock.release()
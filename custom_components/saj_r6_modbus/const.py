@@ -1,7 +1,12 @@
 """Constants for SAJ R6 Inverter Modbus."""
 
 from dataclasses import dataclass
+from datetime import timedelta
 
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntityDescription,
+)
 from homeassistant.components.number import NumberEntityDescription
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -9,6 +14,7 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.const import (
+    PERCENTAGE,
     UnitOfReactivePower,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
@@ -23,15 +29,382 @@ from homeassistant.helpers.entity import EntityCategory
 DOMAIN = "saj_r6_modbus"
 DEFAULT_NAME = "SAJ R6"
 DEFAULT_SCAN_INTERVAL = 60
+DEFAULT_FAST_SCAN_INTERVAL = 10
+DEFAULT_SLOW_SCAN_INTERVAL = 600
+DEFAULT_MIN_SCAN_INTERVAL = 5
+DEFAULT_MAX_SCAN_INTERVAL = 300
 DEFAULT_PORT = 502
+DEFAULT_DEVICE_ID = 1
+DEFAULT_RECORD_FRAMES = False
+DEFAULT_CLOSE_AFTER_POLL = False
+DEFAULT_INVERTER_CLOCK = False
+DEFAULT_ROLLUP_STATISTICS = False
+# Cost of an extra read request, expressed in registers transferred.
+DEFAULT_READ_REQUEST_COST = 24
 CONF_SAJ_HUB = "saj_r6_hub"
+CONF_CLOSE_AFTER_POLL = "close_after_poll"
+CONF_DEVICE_IDS = "device_ids"
+CONF_RECORD_FRAMES = "record_frames"
+CONF_INVERTER_CLOCK = "inverter_clock"
+CONF_ROLLUP_STATISTICS = "rollup_statistics"
+CONF_CAPABILITIES = "capabilities"
+CONF_FAST_SCAN_INTERVAL = "fast_scan_interval"
+CONF_SLOW_SCAN_INTERVAL = "slow_scan_interval"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_READ_REQUEST_COST = "read_request_cost"
 ATTR_MANUFACTURER = "SAJ Electric"
 
+STORAGE_VERSION = 1
+INVERTER_DATA_REFRESH_INTERVAL = timedelta(days=1)
+# Seconds between saves of the last realtime data.
+SNAPSHOT_SAVE_DELAY = 60
+
+# Size at which a raw frame capture file is rotated.
+CAPTURE_MAX_BYTES = 16 * 1024 * 1024
+
+# Number of polls the diagnostic percentiles are computed over.
+POLL_STATS_WINDOW = 100
+# Number of raw frames kept for the diagnostics download.
+DIAGNOSTICS_FRAMES = 20
+# Upper bounds of the request latency histogram buckets in seconds.
+LATENCY_HISTOGRAM_BOUNDS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+MODBUS_TIMEOUT = 5
+# Largest register count of a single read request.
+MAX_READ_COUNT = 125
+# Failed reads of one size in a row, each with both halves readable, before
+# the block size is halved; and successful polls before it is doubled again.
+READ_LIMIT_FAILURES = 3
+READ_LIMIT_RECOVERY_POLLS = 100
+# Failures of a single register before it is skipped, unless the inverter
+# reports it as an illegal address right away.
+REGISTER_FAILURE_LIMIT = 3
+MODBUS_ILLEGAL_ADDRESS = 0x02
+# Illegal address or count: the request itself is refused, so a smaller one may pass.
+MODBUS_REQUEST_EXCEPTIONS = frozenset({0x02, 0x03})
+# Device busy, gateway path unavailable, gateway target failed to respond:
+# say nothing about the registers, so the read is not split.
+MODBUS_TRANSIENT_EXCEPTIONS = frozenset({0x06, 0x0A, 0x0B})
+CONNECTION_IDLE_CHECK = 60
+CONNECT_BACKOFF_INITIAL = 1.0
+CONNECT_BACKOFF_MAX = 300.0
+# Failed polls in a row after which an unreachable inverter is left alone.
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_BACKOFF_INITIAL = 30.0
+BREAKER_BACKOFF_MAX = 1800.0
+# Single register read to check an unreachable inverter answers again.
+PROBE_ADDRESS = 0x6013
+
+# EWMA smoothing, trip level and minimum current of the string anomaly detector.
+STRING_ANOMALY_ALPHA = 0.05
+STRING_ANOMALY_THRESHOLD = 0.2
+STRING_ANOMALY_MIN_CURRENT = 0.5
+STRING_ANOMALY_MIN_SAMPLES = 30
+EVENT_STRING_ANOMALY = f"{DOMAIN}_string_anomaly"
+
+# Number of PV (MPPT) inputs and strings per input the register map covers.
+PV_INPUTS = 6
+PV_INPUT_STRINGS = 2
+SERVICE_REFRESH_CAPABILITIES = "refresh_capabilities"
+
+# Fields the hub itself uses (adaptive scan interval, clock drift), read on every poll.
+ALWAYS_READ_KEYS = ("time", "mpvmode", "power")
+# Relative change of the output power that is polled at the minimum interval.
+ADAPTIVE_POWER_CHANGE = 0.1
+
+
+DATA_TYPE_NUMBER = "number"
+DATA_TYPE_VERSION = "version"
+DATA_TYPE_STRING = "string"
+DATA_TYPE_DATETIME = "datetime"
+DATA_TYPE_FAULT = "fault"
+
+POLL_GROUP_FAST = "fast"
+POLL_GROUP_DEFAULT = "default"
+POLL_GROUP_SLOW = "slow"
+POLL_GROUPS = (POLL_GROUP_FAST, POLL_GROUP_DEFAULT, POLL_GROUP_SLOW)
+
+REALTIME_DATA_ADDRESS = 0x6000
+REALTIME_DATA_COUNT = 99
+INVERTER_DATA_ADDRESS = 0x8F00
+INVERTER_DATA_COUNT = 29
+
+DEVICE_STATUSSES = {
+    1: "Wait",
+    2: "Grid connected",
+    3: "Fault",
+}
+
+
+@dataclass(frozen=True)
+class PublishFilter:
+    """When a changed measurement is passed on to its entity.
+
+    A change is published once it exceeds the larger of the absolute and
+    the relative deadband, but not sooner than min_interval seconds after
+    the previous publish. Smaller changes are published anyway after
+    heartbeat seconds, so the state never lags for long.
+    """
+
+    deadband: float = 0
+    relative_deadband: float = 0
+    min_interval: float = 0
+    heartbeat: float | None = None
+
+
+# Publish filters of measurements without a filter of their own.
+PUBLISH_HEARTBEAT = 300
+DEFAULT_PUBLISH_FILTERS = {
+    SensorDeviceClass.VOLTAGE: PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    SensorDeviceClass.CURRENT: PublishFilter(
+        deadband=0.05, relative_deadband=0.02, heartbeat=PUBLISH_HEARTBEAT
+    ),
+    SensorDeviceClass.FREQUENCY: PublishFilter(deadband=0.02, heartbeat=PUBLISH_HEARTBEAT),
+    SensorDeviceClass.POWER: PublishFilter(
+        deadband=5, relative_deadband=0.01, heartbeat=PUBLISH_HEARTBEAT
+    ),
+    SensorDeviceClass.REACTIVE_POWER: PublishFilter(
+        deadband=5, relative_deadband=0.01, heartbeat=PUBLISH_HEARTBEAT
+    ),
+    SensorDeviceClass.POWER_FACTOR: PublishFilter(deadband=0.01, heartbeat=PUBLISH_HEARTBEAT),
+    SensorDeviceClass.TEMPERATURE: PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    SensorDeviceClass.DURATION: PublishFilter(
+        relative_deadband=0.1, heartbeat=PUBLISH_HEARTBEAT
+    ),
+}
+
 
 @dataclass
 class SajModbusSensorEntityDescription(SensorEntityDescription):
     """A class that describes SAJ R6 sensor entities."""
 
+    address: int | None = None
+    count: int = 1
+    signed: bool = False
+    scale: float = 1
+    precision: int | None = None
+    sentinel: int | None = None
+    data_type: str = DATA_TYPE_NUMBER
+    value_map: dict[int, str] | None = None
+    poll_group: str = POLL_GROUP_DEFAULT
+    publish_filter: PublishFilter | None = None
+    depends_on: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        """Apply the default publish filter of the device class to measurements."""
+        if self.publish_filter is None and self.state_class == SensorStateClass.MEASUREMENT:
+            object.__setattr__(
+                self, "publish_filter", DEFAULT_PUBLISH_FILTERS.get(self.device_class)
+            )
+
+
+@dataclass
+class SajModbusBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """A class that describes SAJ R6 binary sensor entities."""
+
+    depends_on: tuple[str, ...] = ()
+
+
+# Strings whose current drifts below the other string of their PV input.
+STRING_ANOMALY_SENSOR_TYPES: dict[str, SajModbusBinarySensorEntityDescription] = {
+    "PV1Str1Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV1 String 1 anomaly",
+        key="pv1strcurr1anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        depends_on=("pv1strcurr1", "pv1strcurr2"),
+    ),
+    "PV1Str2Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV1 String 2 anomaly",
+        key="pv1strcurr2anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        depends_on=("pv1strcurr1", "pv1strcurr2"),
+    ),
+    "PV2Str1Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV2 String 1 anomaly",
+        key="pv2strcurr1anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        depends_on=("pv2strcurr1", "pv2strcurr2"),
+    ),
+    "PV2Str2Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV2 String 2 anomaly",
+        key="pv2strcurr2anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        depends_on=("pv2strcurr1", "pv2strcurr2"),
+    ),
+    "PV3Str1Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV3 String 1 anomaly",
+        key="pv3strcurr1anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv3strcurr1", "pv3strcurr2"),
+    ),
+    "PV3Str2Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV3 String 2 anomaly",
+        key="pv3strcurr2anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv3strcurr1", "pv3strcurr2"),
+    ),
+    "PV4Str1Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV4 String 1 anomaly",
+        key="pv4strcurr1anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv4strcurr1", "pv4strcurr2"),
+    ),
+    "PV4Str2Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV4 String 2 anomaly",
+        key="pv4strcurr2anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv4strcurr1", "pv4strcurr2"),
+    ),
+    "PV5Str1Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV5 String 1 anomaly",
+        key="pv5strcurr1anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv5strcurr1", "pv5strcurr2"),
+    ),
+    "PV5Str2Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV5 String 2 anomaly",
+        key="pv5strcurr2anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv5strcurr1", "pv5strcurr2"),
+    ),
+    "PV6Str1Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV6 String 1 anomaly",
+        key="pv6strcurr1anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv6strcurr1", "pv6strcurr2"),
+    ),
+    "PV6Str2Anomaly": SajModbusBinarySensorEntityDescription(
+        name="PV6 String 2 anomaly",
+        key="pv6strcurr2anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon="mdi:solar-panel",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        depends_on=("pv6strcurr1", "pv6strcurr2"),
+    ),
+}
+
+
+INVERTER_DATA_TYPES: dict[str, SajModbusSensorEntityDescription] = {
+    "Type": SajModbusSensorEntityDescription(
+        name="Inverter type",
+        key="type",
+        address=0x8F00,
+    ),
+    "SubType": SajModbusSensorEntityDescription(
+        name="Inverter sub type",
+        key="subtype",
+        address=0x8F01,
+        scale=0.001,
+        precision=3,
+    ),
+    "CommProVersion": SajModbusSensorEntityDescription(
+        name="Communication protocol version",
+        key="commproversion",
+        address=0x8F02,
+        scale=0.001,
+        precision=3,
+    ),
+    "SN": SajModbusSensorEntityDescription(
+        name="Serial number",
+        key="sn",
+        address=0x8F03,
+        count=10,
+        data_type=DATA_TYPE_STRING,
+    ),
+    "PC": SajModbusSensorEntityDescription(
+        name="Product code",
+        key="pc",
+        address=0x8F0D,
+        count=10,
+        data_type=DATA_TYPE_STRING,
+    ),
+    "DV": SajModbusSensorEntityDescription(
+        name="Display board software version",
+        key="dv",
+        address=0x8F17,
+        scale=0.001,
+        precision=3,
+        sentinel=0xFFFF,
+        data_type=DATA_TYPE_VERSION,
+    ),
+    "MCV": SajModbusSensorEntityDescription(
+        name="Master control board software version",
+        key="mcv",
+        address=0x8F18,
+        scale=0.001,
+        precision=3,
+        sentinel=0xFFFF,
+        data_type=DATA_TYPE_VERSION,
+    ),
+    "SCV": SajModbusSensorEntityDescription(
+        name="Slave control board software version",
+        key="scv",
+        address=0x8F19,
+        scale=0.001,
+        precision=3,
+        sentinel=0xFFFF,
+        data_type=DATA_TYPE_VERSION,
+    ),
+    "DispHWVersion": SajModbusSensorEntityDescription(
+        name="Display board hardware version",
+        key="disphwversion",
+        address=0x8F1A,
+        scale=0.001,
+        precision=3,
+        sentinel=0xFFFF,
+        data_type=DATA_TYPE_VERSION,
+    ),
+    "CtrlHWVersion": SajModbusSensorEntityDescription(
+        name="Control board hardware version",
+        key="ctrlhwversion",
+        address=0x8F1B,
+        scale=0.001,
+        precision=3,
+        sentinel=0xFFFF,
+        data_type=DATA_TYPE_VERSION,
+    ),
+    "PowerHWVersion": SajModbusSensorEntityDescription(
+        name="Power board hardware version",
+        key="powerhwversion",
+        address=0x8F1C,
+        scale=0.001,
+        precision=3,
+        sentinel=0xFFFF,
+        data_type=DATA_TYPE_VERSION,
+    ),
+}
+
 
 TOTAL_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
     "TotalEnergy": SajModbusSensorEntityDescription(
@@ -41,6 +414,10 @@ TOTAL_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:solar-power",
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
+        address=0x6004,
+        count=2,
+        scale=0.01,
+        precision=2,
     ),
     "TotalHour": SajModbusSensorEntityDescription(
         name="Total working hours of the inverter",
@@ -50,6 +427,11 @@ TOTAL_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_registry_enabled_default=False,
+        address=0x600C,
+        count=2,
+        scale=0.1,
+        precision=1,
+        poll_group=POLL_GROUP_SLOW,
     ),
 }
 
@@ -61,6 +443,10 @@ DAY_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:solar-power",
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
+        address=0x600A,
+        count=2,
+        scale=0.01,
+        precision=2,
     ),
     "TodayHour": SajModbusSensorEntityDescription(
         name="Daily working hours of the inverter",
@@ -70,6 +456,9 @@ DAY_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL,
         entity_registry_enabled_default=False,
+        address=0x600E,
+        scale=0.1,
+        precision=1,
     ),
 }
 
@@ -82,6 +471,11 @@ MONTH_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
         entity_registry_enabled_default=False,
+        address=0x6008,
+        count=2,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_SLOW,
     ),
 }
 
@@ -94,6 +488,178 @@ YEAR_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
         entity_registry_enabled_default=False,
+        address=0x6006,
+        count=2,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_SLOW,
+    ),
+}
+
+# Metrics computed by the hub from the decoded fields in depends_on.
+DERIVED_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
+    "DCPower": SajModbusSensorEntityDescription(
+        name="PV total power",
+        key="dcpower",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        icon="mdi:solar-power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        depends_on=tuple(f"pv{index}power" for index in range(1, 7)),
+    ),
+    "Efficiency": SajModbusSensorEntityDescription(
+        name="Conversion efficiency",
+        key="efficiency",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:percent-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        depends_on=("power", "dcpower"),
+        publish_filter=PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    ),
+    "PV1StrImbalance": SajModbusSensorEntityDescription(
+        name="PV1 String current imbalance",
+        key="pv1strimbalance",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:scale-unbalanced",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        depends_on=("pv1strcurr1", "pv1strcurr2"),
+        publish_filter=PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    ),
+    "PV2StrImbalance": SajModbusSensorEntityDescription(
+        name="PV2 String current imbalance",
+        key="pv2strimbalance",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:scale-unbalanced",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        depends_on=("pv2strcurr1", "pv2strcurr2"),
+        publish_filter=PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    ),
+    "PV3StrImbalance": SajModbusSensorEntityDescription(
+        name="PV3 String current imbalance",
+        key="pv3strimbalance",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:scale-unbalanced",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        depends_on=("pv3strcurr1", "pv3strcurr2"),
+        publish_filter=PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    ),
+    "PV4StrImbalance": SajModbusSensorEntityDescription(
+        name="PV4 String current imbalance",
+        key="pv4strimbalance",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:scale-unbalanced",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        depends_on=("pv4strcurr1", "pv4strcurr2"),
+        publish_filter=PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    ),
+    "PV5StrImbalance": SajModbusSensorEntityDescription(
+        name="PV5 String current imbalance",
+        key="pv5strimbalance",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:scale-unbalanced",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        depends_on=("pv5strcurr1", "pv5strcurr2"),
+        publish_filter=PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    ),
+    "PV6StrImbalance": SajModbusSensorEntityDescription(
+        name="PV6 String current imbalance",
+        key="pv6strimbalance",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:scale-unbalanced",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        depends_on=("pv6strcurr1", "pv6strcurr2"),
+        publish_filter=PublishFilter(deadband=0.5, heartbeat=PUBLISH_HEARTBEAT),
+    ),
+}
+
+FAULT_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
+    "FaultMSG": SajModbusSensorEntityDescription(
+        name="Fault message",
+        key="faultmsg",
+        icon="mdi:message-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6014,
+        count=6,
+        data_type=DATA_TYPE_FAULT,
+    ),
+}
+
+DIAGNOSTIC_SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
+    "PollDuration": SajModbusSensorEntityDescription(
+        name="Poll duration",
+        key="pollduration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    "ModbusRTT": SajModbusSensorEntityDescription(
+        name="Modbus round trip time",
+        key="modbusrtt",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:swap-horizontal",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    "DecodeTime": SajModbusSensorEntityDescription(
+        name="Decode time",
+        key="decodetime",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-cog-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    "SuccessRate": SajModbusSensorEntityDescription(
+        name="Poll success rate",
+        key="successrate",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:check-network-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "ReconnectCount": SajModbusSensorEntityDescription(
+        name="Reconnect count",
+        key="reconnectcount",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "ClockDrift": SajModbusSensorEntityDescription(
+        name="Inverter clock drift",
+        key="clockdrift",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        icon="mdi:clock-alert-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "SuppressedUpdates": SajModbusSensorEntityDescription(
+        name="Suppressed updates",
+        key="suppressedupdates",
+        icon="mdi:filter-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    "ScanInterval": SajModbusSensorEntityDescription(
+        name="Scan interval",
+        key="scaninterval",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        icon="mdi:timer-sync-outline",
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
 }
 
@@ -105,6 +671,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:clock-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6000,
+        count=4,
+        data_type=DATA_TYPE_DATETIME,
     ),
     "Energy": SajModbusSensorEntityDescription(
         name="Cumulative value of power generation",
@@ -114,6 +683,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
         entity_registry_enabled_default=False,
+        address=0x601B,
+        count=2,
+        scale=0.01,
+        precision=2,
     ),
     "ErrorCount": SajModbusSensorEntityDescription(
         name="Number of errors of inverter",
@@ -122,6 +695,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_registry_enabled_default=False,
+        address=0x600F,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "ErrorSN": SajModbusSensorEntityDescription(
         name="Historical error fault serial number",
@@ -129,6 +704,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:information-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6010,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "SettingDataSN": SajModbusSensorEntityDescription(
         name="The serial number of the setting parameter area",
@@ -136,18 +713,16 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:information-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6011,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "MPVMode": SajModbusSensorEntityDescription(
         name="Inverter operating mode",
         key="mpvmode",
         icon="mdi:information-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    "FaultMSG": SajModbusSensorEntityDescription(
-        name="Fault message",
-        key="faultmsg",
-        icon="mdi:message-alert-outline",
-        entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6013,
+        value_map=DEVICE_STATUSSES,
     ),
     "ConnTime": SajModbusSensorEntityDescription(
         name="Inverter countdown",
@@ -157,6 +732,7 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:timer-sand",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x601A,
     ),
     "Power": SajModbusSensorEntityDescription(
         name="The inverter outputs active power",
@@ -165,6 +741,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:solar-power",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        address=0x601D,
+        count=2,
+        poll_group=POLL_GROUP_FAST,
     ),
     "QPower": SajModbusSensorEntityDescription(
         name="The inverter outputs reactive power",
@@ -174,6 +753,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.REACTIVE_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x601F,
+        count=2,
+        signed=True,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PF": SajModbusSensorEntityDescription(
         name="Inverter output power factor",
@@ -182,6 +765,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6021,
+        signed=True,
+        scale=0.001,
+        precision=3,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L1Volt": SajModbusSensorEntityDescription(
         name="L1 phase voltage",
@@ -191,6 +779,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6022,
+        scale=0.1,
+        precision=1,
     ),
     "L1Curr": SajModbusSensorEntityDescription(
         name="L1 phase current",
@@ -200,6 +791,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6023,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L1Freq": SajModbusSensorEntityDescription(
         name="L1 phrase frequency",
@@ -209,6 +804,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6024,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L1DCI": SajModbusSensorEntityDescription(
         name="L1 phase DC component",
@@ -219,6 +818,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6025,
+        signed=True,
     ),
     "L1Power": SajModbusSensorEntityDescription(
         name="L1 power",
@@ -229,6 +830,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6026,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L1PF": SajModbusSensorEntityDescription(
         name="L1 Power factor",
@@ -238,6 +841,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6027,
+        signed=True,
+        scale=0.001,
+        precision=3,
     ),
     "L2Volt": SajModbusSensorEntityDescription(
         name="L2 phase voltage",
@@ -247,6 +854,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6028,
+        scale=0.1,
+        precision=1,
     ),
     "L2Curr": SajModbusSensorEntityDescription(
         name="L2 phase current",
@@ -256,6 +866,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6029,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L2Freq": SajModbusSensorEntityDescription(
         name="L2 phrase frequency",
@@ -265,6 +879,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x602A,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L2DCI": SajModbusSensorEntityDescription(
         name="L2 phase DC component",
@@ -275,6 +893,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x602B,
+        signed=True,
     ),
     "L2Power": SajModbusSensorEntityDescription(
         name="L2 power",
@@ -285,6 +905,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x602C,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L2PF": SajModbusSensorEntityDescription(
         name="L2 Power factor",
@@ -294,6 +916,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x602D,
+        signed=True,
+        scale=0.001,
+        precision=3,
     ),
     "L3Volt": SajModbusSensorEntityDescription(
         name="L3 phase voltage",
@@ -303,6 +929,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x602E,
+        scale=0.1,
+        precision=1,
     ),
     "L3Curr": SajModbusSensorEntityDescription(
         name="L3 phase current",
@@ -312,6 +941,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x602F,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L3Freq": SajModbusSensorEntityDescription(
         name="L3 phrase frequency",
@@ -321,6 +954,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        address=0x6030,
+        scale=0.01,
+        precision=2,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L3DCI": SajModbusSensorEntityDescription(
         name="L3 phase DC component",
@@ -331,6 +968,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6031,
+        signed=True,
     ),
     "L3Power": SajModbusSensorEntityDescription(
         name="L3 power",
@@ -341,6 +980,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6032,
+        poll_group=POLL_GROUP_FAST,
     ),
     "L3PF": SajModbusSensorEntityDescription(
         name="L3 Power factor",
@@ -350,6 +991,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6033,
+        signed=True,
+        scale=0.001,
+        precision=3,
     ), "NEVolt": SajModbusSensorEntityDescription(
         name="N-line voltage to earth",
         key="nevolt",
@@ -359,6 +1004,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6034,
+        scale=0.1,
+        precision=1,
     ),
     "GFCI": SajModbusSensorEntityDescription(
         name="Earth Leakage Current",
@@ -369,6 +1017,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6035,
+        signed=True,
     ),
     "BusVolt": SajModbusSensorEntityDescription(
         name="BUS voltage",
@@ -379,6 +1029,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6036,
+        scale=0.1,
+        precision=1,
     ),
     "BusVoltM": SajModbusSensorEntityDescription(
         name="BUS mid-point voltage",
@@ -389,6 +1042,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6037,
+        scale=0.1,
+        precision=1,
     ),
     "InvTempC1": SajModbusSensorEntityDescription(
         name="Radiator temperature",
@@ -399,6 +1055,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6038,
+        signed=True,
+        scale=0.1,
+        precision=1,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "InvTempCL1": SajModbusSensorEntityDescription(
         name="L1 phase temperature",
@@ -409,6 +1070,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6039,
+        signed=True,
+        scale=0.1,
+        precision=1,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "InvTempCL2": SajModbusSensorEntityDescription(
         name="L2 phase temperature",
@@ -419,6 +1085,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x603A,
+        signed=True,
+        scale=0.1,
+        precision=1,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "InvTempCL3": SajModbusSensorEntityDescription(
         name="L3 phase temperature",
@@ -429,6 +1100,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x603B,
+        signed=True,
+        scale=0.1,
+        precision=1,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "InvTempCCavity": SajModbusSensorEntityDescription(
         name="Cavity temperature",
@@ -439,6 +1115,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x603C,
+        signed=True,
+        scale=0.1,
+        precision=1,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "ISO1": SajModbusSensorEntityDescription(
         name="PV1+_ISO",
@@ -448,6 +1129,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6041,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "ISO2": SajModbusSensorEntityDescription(
         name="PV2+_ISO",
@@ -457,6 +1140,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6042,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "ISO3": SajModbusSensorEntityDescription(
         name="PV3+_ISO",
@@ -466,6 +1151,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6043,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "ISO4": SajModbusSensorEntityDescription(
         name="PV__ISO",
@@ -475,6 +1162,8 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        address=0x6044,
+        poll_group=POLL_GROUP_SLOW,
     ),
     "PV1Volt": SajModbusSensorEntityDescription(
         name="PV1 voltage",
@@ -483,6 +1172,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:current-dc",
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        address=0x6045,
+        scale=0.1,
+        precision=1,
+        sentinel=0xFFFF,
     ),
     "PV1Curr": SajModbusSensorEntityDescription(
         name="PV1 current",
@@ -491,6 +1184,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:current-dc",
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
+        address=0x6046,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV1Power": SajModbusSensorEntityDescription(
         name="PV1 power",
@@ -500,6 +1198,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6047,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV2Volt": SajModbusSensorEntityDescription(
         name="PV2 voltage",
@@ -508,6 +1209,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:current-dc",
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        address=0x6048,
+        scale=0.1,
+        precision=1,
+        sentinel=0xFFFF,
     ),
     "PV2Curr": SajModbusSensorEntityDescription(
         name="PV2 current",
@@ -516,6 +1221,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         icon="mdi:current-dc",
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
+        address=0x6049,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV2Power": SajModbusSensorEntityDescription(
         name="PV2 power",
@@ -525,6 +1235,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x604A,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV3Volt": SajModbusSensorEntityDescription(
         name="PV3 voltage",
@@ -534,6 +1247,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x604B,
+        scale=0.1,
+        precision=1,
+        sentinel=0xFFFF,
     ),
     "PV3Curr": SajModbusSensorEntityDescription(
         name="PV3 current",
@@ -543,6 +1260,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x604C,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV3Power": SajModbusSensorEntityDescription(
         name="PV3 power",
@@ -552,6 +1274,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x604D,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV4Volt": SajModbusSensorEntityDescription(
         name="PV4 voltage",
@@ -561,6 +1286,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x604E,
+        scale=0.1,
+        precision=1,
+        sentinel=0xFFFF,
     ),
     "PV4Curr": SajModbusSensorEntityDescription(
         name="PV4 current",
@@ -570,6 +1299,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x604F,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV4Power": SajModbusSensorEntityDescription(
         name="PV4 power",
@@ -579,6 +1313,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6050,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV5Volt": SajModbusSensorEntityDescription(
         name="PV5 voltage",
@@ -588,6 +1325,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6051,
+        scale=0.1,
+        precision=1,
+        sentinel=0xFFFF,
     ),
     "PV5Curr": SajModbusSensorEntityDescription(
         name="PV5 current",
@@ -597,6 +1338,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6052,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV5Power": SajModbusSensorEntityDescription(
         name="PV5 power",
@@ -606,6 +1352,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6053,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV6Volt": SajModbusSensorEntityDescription(
         name="PV6 voltage",
@@ -615,6 +1364,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6054,
+        scale=0.1,
+        precision=1,
+        sentinel=0xFFFF,
     ),
     "PV6Curr": SajModbusSensorEntityDescription(
         name="PV6 current",
@@ -624,6 +1377,11 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6055,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV6Power": SajModbusSensorEntityDescription(
         name="PV6 power",
@@ -633,6 +1391,9 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6056,
+        sentinel=0xFFFF,
+        poll_group=POLL_GROUP_FAST,
     ),
     "PV1StrCurr1": SajModbusSensorEntityDescription(
         name="PV1 String current 1",
@@ -642,6 +1403,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6057,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
 
     "PV1StrCurr2": SajModbusSensorEntityDescription(
@@ -652,6 +1417,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6058,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV2StrCurr1": SajModbusSensorEntityDescription(
         name="PV2 String current 1",
@@ -661,6 +1430,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6059,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV2StrCurr2": SajModbusSensorEntityDescription(
         name="PV2 String current 2",
@@ -670,6 +1443,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x605A,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV3StrCurr1": SajModbusSensorEntityDescription(
         name="PV3 String current 1",
@@ -679,6 +1456,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x605B,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV3StrCurr2": SajModbusSensorEntityDescription(
         name="PV3 String current 2",
@@ -688,6 +1469,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x605C,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
 
     "PV4StrCurr1": SajModbusSensorEntityDescription(
@@ -698,6 +1483,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x605D,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV4StrCurr2": SajModbusSensorEntityDescription(
         name="PV4 String current 2",
@@ -707,6 +1496,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x605E,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV5StrCurr1": SajModbusSensorEntityDescription(
         name="PV5 String current 1",
@@ -716,6 +1509,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x605F,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV5StrCurr2": SajModbusSensorEntityDescription(
         name="PV5 String current 2",
@@ -725,6 +1522,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6060,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV6StrCurr1": SajModbusSensorEntityDescription(
         name="PV6 String current 1",
@@ -734,6 +1535,10 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6061,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
     "PV6StrCurr2": SajModbusSensorEntityDescription(
         name="PV6 String current 2",
@@ -743,15 +1548,13 @@ SENSOR_TYPES: dict[str, list[SajModbusSensorEntityDescription]] = {
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        address=0x6062,
+        scale=0.01,
+        precision=2,
+        sentinel=0xFFFF,
     ),
 }
 
-DEVICE_STATUSSES = {
-    1: "Wait",
-    2: "Grid connected",
-    3: "Fault",
-}
-
 FAULT_MESSAGES = {
     0: {
         0x80000000: "Code 81: Lost Communication D<->C",
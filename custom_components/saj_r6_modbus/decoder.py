@@ -0,0 +1,269 @@
+"""Register map decoder for SAJ R6 Inverter Modbus."""
+
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+import re
+import struct
+import sys
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .const import (
+    DATA_TYPE_DATETIME,
+    DATA_TYPE_FAULT,
+    DATA_TYPE_NUMBER,
+    DATA_TYPE_STRING,
+    DATA_TYPE_VERSION,
+    FAULT_MESSAGES,
+    SajModbusSensorEntityDescription,
+)
+
+
+def _fault_tables() -> list[list[tuple[tuple[int, str], ...]]]:
+    """Build one 256 entry lookup table per byte of each fault word.
+
+    Bytes are listed from most to least significant so faults keep the
+    order of FAULT_MESSAGES.
+    """
+    tables = []
+    for fault_messages in FAULT_MESSAGES.values():
+        faults = [
+            (mask, int(re.match(r"Code (\d+)", message).group(1)), message)
+            for mask, message in fault_messages.items()
+        ]
+        for shift in (24, 16, 8, 0):
+            tables.append(
+                [
+                    tuple(
+                        (code, message)
+                        for mask, code, message in faults
+                        if (value << shift) & mask
+                    )
+                    for value in range(256)
+                ]
+            )
+    return tables
+
+
+FAULT_TABLES = _fault_tables()
+
+
+@lru_cache(maxsize=64)
+def translate_fault_words(fault_words: tuple[int, ...]) -> tuple[tuple[int, str], ...]:
+    """Translate the fault words to (code, message) pairs."""
+    faults = ()
+    for index, fault_word in enumerate(fault_words):
+        if not fault_word:
+            continue
+        for table, shift in zip(FAULT_TABLES[index * 4:index * 4 + 4], (24, 16, 8, 0)):
+            faults += table[(fault_word >> shift) & 0xFF]
+    return faults
+
+
+def parse_datetime(registers: list[int]) -> datetime | None:
+    """Extract date and time values from registers, None if not set."""
+
+    year = registers[0]  # yyyy
+    month = registers[1] >> 8  # MM
+    day = registers[1] & 0xFF  # dd
+    hour = registers[2] >> 8  # HH
+    minute = registers[2] & 0xFF  # mm
+    second = registers[3] >> 8  # ss
+
+    # Convert to datetime object
+    try:
+        date_time_obj = datetime(year, month, day, hour, minute, second).astimezone()
+    except ValueError:
+        return None
+
+    return (date_time_obj)
+
+
+def parse_string(registers: list[int]) -> str:
+    """Extract an ASCII string, two characters per register."""
+    return ''.join(chr(r >> 8) + chr(r & 0xFF) for r in registers).rstrip('\x00')
+
+
+class SajModbusBlockDecoder:
+    """Decoder for one contiguous register block, built from the register map.
+
+    All numeric fields are unpacked in a single pass with one precompiled
+    struct format; only the few composite fields are decoded one by one.
+    """
+
+    def __init__(
+        self,
+        address: int,
+        count: int,
+        descriptions: Iterable[SajModbusSensorEntityDescription],
+    ):
+        """Precompute the field decoders of the block."""
+        self.address = address
+        self.count = count
+        self.descriptions = sorted(
+            (
+                description
+                for description in descriptions
+                if description.address is not None
+                and address <= description.address
+                and description.address + description.count <= address + count
+            ),
+            key=lambda description: description.address,
+        )
+
+        self._frame = struct.Struct(f">{count}H")
+        fmt = ">"
+        position = address
+        self._numeric = []
+        self._converted = []
+        self._composite = []
+        for description in self.descriptions:
+            if description.data_type not in (DATA_TYPE_NUMBER, DATA_TYPE_VERSION):
+                self._composite.append(
+                    (description.key, self._compile(description)))
+                continue
+
+            fmt += "x" * 2 * (description.address - position)
+            fmt += ("i" if description.signed else "I") if description.count == 2 else (
+                "h" if description.signed else "H")
+            position = description.address + description.count
+
+            sentinel = description.sentinel
+            if sentinel is not None and description.signed:
+                sentinel -= 1 << (16 * description.count)
+            factor = divisor = None
+            if description.scale != 1:
+                # round(value * scale, precision) as exact integer arithmetic
+                # followed by a single correctly rounded division.
+                divisor = 10 ** description.precision
+                factor = round(description.scale * divisor)
+                if abs(factor - description.scale * divisor) > 1e-9:
+                    raise ValueError(
+                        f"Scale of {description.key} needs more than {description.precision} digits")
+            self._numeric.append((description.key, factor, divisor, sentinel))
+            if description.value_map is not None or description.data_type == DATA_TYPE_VERSION:
+                self._converted.append(
+                    (description.key, self._converter(description)))
+        fmt += "x" * 2 * (address + count - position)
+        self._struct = struct.Struct(fmt)
+
+    def _compile(
+        self, description: SajModbusSensorEntityDescription
+    ) -> Callable[[Sequence[int]], Any]:
+        """Return a function decoding a composite field from the block registers."""
+        start = description.address - self.address
+        end = start + description.count
+        data_type = description.data_type
+
+        if data_type == DATA_TYPE_DATETIME:
+            return lambda registers: parse_datetime(registers[start:end])
+
+        if data_type == DATA_TYPE_STRING:
+            return lambda registers: parse_string(
+                registers[start:end]) if registers[start] != 0x00 else STATE_UNAVAILABLE
+
+        if data_type == DATA_TYPE_FAULT:
+            # One 32 bit fault word per register pair, translated by the hub.
+            return lambda registers: tuple(
+                registers[i] << 16 | registers[i + 1] for i in range(start, end, 2)
+            )
+
+        raise ValueError(f"Unsupported data type {data_type} for {description.key}")
+
+    @staticmethod
+    def _converter(description: SajModbusSensorEntityDescription) -> Callable[[Any], Any]:
+        """Return the conversion applied on top of the scaled value."""
+        if description.value_map is not None:
+            value_map = description.value_map
+            return lambda value: value_map.get(value, STATE_UNAVAILABLE)
+
+        precision = description.precision
+        return lambda value: f"{value:.{precision}f}" if value != STATE_UNAVAILABLE else value
+
+    def _scale(self, values: Sequence[int]) -> dict:
+        """Apply sentinels and scales to the unpacked numeric values."""
+        data = {
+            key: STATE_UNAVAILABLE if value == sentinel else (
+                value if divisor is None else value * factor / divisor)
+            for (key, factor, divisor, sentinel), value in zip(self._numeric, values)
+        }
+        for key, convert in self._converted:
+            data[key] = convert(data[key])
+        return data
+
+    def decode(self, registers: Sequence[int]) -> dict:
+        """Decode the registers of the block."""
+        data = self._scale(self._struct.unpack(self._frame.pack(*registers)))
+        for key, decode in self._composite:
+            data[key] = decode(registers)
+        return data
+
+    def decode_frames(self, frames: Sequence[Sequence[int]]) -> dict[str, Sequence]:
+        """Decode many frames at once, e.g. for replay or backfill.
+
+        Returns one column per key. With NumPy available the numeric columns
+        are float arrays holding NaN for sentinel values.
+        """
+        if np is not None:
+            return self._decode_frames_numpy(frames)
+
+        registers = array("H", chain.from_iterable(frames))
+        if sys.byteorder == "little":
+            registers.byteswap()
+        # Scale column by column, rather than building a dict per frame.
+        columns = {}
+        for (key, factor, divisor, sentinel), values in zip(
+            self._numeric, zip(*self._struct.iter_unpack(registers.tobytes()))
+        ):
+            if divisor is None:
+                columns[key] = [
+                    STATE_UNAVAILABLE if value == sentinel else value for value in values]
+            else:
+                columns[key] = [
+                    STATE_UNAVAILABLE if value == sentinel else value * factor / divisor
+                    for value in values
+                ]
+        for key, convert in self._converted:
+            columns[key] = [convert(value) for value in columns[key]]
+        for key, decode in self._composite:
+            columns[key] = [decode(frame) for frame in frames]
+        return columns
+
+    def _decode_frames_numpy(self, frames: Sequence[Sequence[int]]) -> dict[str, Sequence]:
+        """Decode many frames with NumPy."""
+        registers = np.asarray(frames, dtype=np.uint16).reshape(-1, self.count)
+        columns = {}
+        for description in self.descriptions:
+            if description.data_type not in (DATA_TYPE_NUMBER, DATA_TYPE_VERSION):
+                continue
+            start = description.address - self.address
+            if description.count == 2:
+                raw = (registers[:, start].astype(np.uint32) << 16) | registers[:, start + 1]
+                values = raw.view(np.int32) if description.signed else raw
+            else:
+                raw = registers[:, start]
+                values = raw.view(np.int16) if description.signed else raw
+
+            column = values.astype(np.float64)
+            if description.scale != 1:
+                divisor = 10 ** description.precision
+                column = column * round(description.scale * divisor) / divisor
+            if description.sentinel is not None:
+                column[raw == description.sentinel] = np.nan
+            if description.value_map is not None:
+                column = [description.value_map.get(value, STATE_UNAVAILABLE)
+                          for value in raw.tolist()]
+            columns[description.key] = column
+
+        for key, decode in self._composite:
+            columns[key] = [decode(frame) for frame in registers.tolist()]
+        return columns
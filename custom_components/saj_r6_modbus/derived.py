@@ -0,0 +1,73 @@
+"""Derived PV metrics for SAJ R6 Inverter Modbus."""
+
+from collections.abc import Callable, Iterable
+from graphlib import TopologicalSorter
+from typing import Any
+
+from .const import SajModbusSensorEntityDescription
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for a measured value, False for None or STATE_UNAVAILABLE."""
+    return isinstance(value, (int, float))
+
+
+def _dc_power(*powers: Any) -> float | None:
+    """Return the total power of the PV inputs that report one."""
+    powers = [power for power in powers if _is_number(power)]
+    return sum(powers) if powers else None
+
+
+def _efficiency(power: Any, dc_power: Any) -> float | None:
+    """Return the AC output power as percentage of the DC input power."""
+    if not _is_number(power) or not _is_number(dc_power) or dc_power <= 0:
+        return None
+    return round(power / dc_power * 100, 1)
+
+
+def _imbalance(current1: Any, current2: Any) -> float | None:
+    """Return the difference of two string currents as percentage of the largest."""
+    if not _is_number(current1) or not _is_number(current2):
+        return None
+    largest = max(current1, current2)
+    if largest <= 0:
+        return None
+    return round(abs(current1 - current2) / largest * 100, 1)
+
+
+DERIVED_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "dcpower": _dc_power,
+    "efficiency": _efficiency,
+    **{f"pv{index}strimbalance": _imbalance for index in range(1, 7)},
+}
+
+
+class SajDerivedMetrics:
+    """Compute derived metrics from decoded data in dependency order."""
+
+    def __init__(self, descriptions: Iterable[SajModbusSensorEntityDescription]):
+        """Precompute the evaluation order of the metrics."""
+        graph = {description.key: description.depends_on for description in descriptions}
+        self._graph = graph
+        self._order = [
+            (key, DERIVED_FUNCTIONS[key], graph[key])
+            for key in TopologicalSorter(graph).static_order()
+            if key in graph
+        ]
+
+    def dependencies(self, keys: Iterable[str]) -> frozenset[str]:
+        """Return the decoded fields the given metrics are computed from."""
+        dependencies = set()
+        pending = [key for key in keys if key in self._graph]
+        while pending:
+            for dependency in self._graph[pending.pop()]:
+                if dependency in self._graph:
+                    pending.append(dependency)
+                else:
+                    dependencies.add(dependency)
+        return frozenset(dependencies)
+
+    def compute(self, data: dict) -> None:
+        """Add the derived metrics to the data."""
+        for key, function, depends_on in self._order:
+            data[key] = function(*(data.get(dependency) for dependency in depends_on))
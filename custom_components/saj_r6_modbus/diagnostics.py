@@ -0,0 +1,68 @@
+"""Diagnostics support for SAJ R6 Inverter Modbus."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .capture import CapturedFrame
+from .const import DOMAIN, INVERTER_DATA_TYPES
+
+TO_REDACT = {CONF_HOST, "sn"}
+# The raw inverter info frames hold the redacted fields too.
+REGISTERS_TO_REDACT = frozenset(
+    register
+    for description in INVERTER_DATA_TYPES.values()
+    if description.key in TO_REDACT
+    for register in range(description.address, description.address + description.count)
+)
+
+
+def _redact_frame(frame: CapturedFrame) -> dict[str, Any]:
+    """Return the frame with the registers of redacted fields zeroed."""
+    data = asdict(frame)
+    data["registers"] = [
+        0 if frame.address + index in REGISTERS_TO_REDACT else register
+        for index, register in enumerate(frame.registers)
+    ]
+    return data
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hubs = hass.data[DOMAIN][entry.data[CONF_NAME]]["hubs"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "inverters": [
+            {
+                "device_id": hub.device_id,
+                "inverter_data": async_redact_data(hub.inverter_data, TO_REDACT),
+                "connection": hub.connection_stats,
+                "breaker": {
+                    "state": hub.breaker.state,
+                    "failure_count": hub.breaker.failure_count,
+                    "open_count": hub.breaker.open_count,
+                },
+                "errors": {
+                    "error_responses": hub.error_count,
+                    "timeouts": hub.timeout_count,
+                    "connection_errors": hub.connection_error_count,
+                },
+                "publishes_suppressed": hub.publishes_suppressed,
+                "poll_stats": {
+                    key: stats.summary() for key, stats in hub.poll_stats.items()
+                },
+                "latency_histogram": hub.latency_histogram.as_dict(),
+                "frames": [_redact_frame(frame) for frame in hub.frames.frames()],
+            }
+            for hub in hubs
+        ],
+    }
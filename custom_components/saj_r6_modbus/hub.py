@@ -1,50 +1,425 @@
 """SAJ R6 Modbus Hub."""
 
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from voluptuous.validators import Number
+from collections.abc import Callable
 import logging
-import threading
+import time
 from datetime import datetime, timedelta
-from homeassistant.core import CALLBACK_TYPE, callback, HomeAssistant
+from functools import lru_cache
+from typing import Any
 from homeassistant.const import STATE_UNAVAILABLE
-from homeassistant.helpers import entity_registry
+from homeassistant.core import CALLBACK_TYPE, Event, callback, HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
 from homeassistant.components.number import DOMAIN as NUMBER_DOMAIN
-from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ConnectionException, ModbusException
+from homeassistant.components.sensor import SensorStateClass
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 from pymodbus.pdu import ModbusPDU
 
+from .anomaly import SajStringAnomalyDetector
+from .breaker import BREAKER_HALF_OPEN, CircuitBreaker
+from .capture import SajFrameRecorder, SajFrameRingBuffer
+from .connection import SAJModbusConnection
 from .const import (
+    ADAPTIVE_POWER_CHANGE,
+    ALWAYS_READ_KEYS,
+    ATTR_MANUFACTURER,
+    BREAKER_BACKOFF_INITIAL,
+    BREAKER_BACKOFF_MAX,
+    BREAKER_FAILURE_THRESHOLD,
+    DAY_SENSOR_TYPES,
+    DERIVED_SENSOR_TYPES,
     DEVICE_STATUSSES,
-    FAULT_MESSAGES,
+    DIAGNOSTIC_SENSOR_TYPES,
+    DOMAIN,
+    EVENT_STRING_ANOMALY,
+    FAULT_SENSOR_TYPES,
+    INVERTER_DATA_ADDRESS,
+    INVERTER_DATA_COUNT,
+    INVERTER_DATA_REFRESH_INTERVAL,
+    INVERTER_DATA_TYPES,
+    LATENCY_HISTOGRAM_BOUNDS,
+    MAX_READ_COUNT,
+    MODBUS_ILLEGAL_ADDRESS,
+    MODBUS_REQUEST_EXCEPTIONS,
+    MODBUS_TRANSIENT_EXCEPTIONS,
+    DEFAULT_READ_REQUEST_COST,
+    DIAGNOSTICS_FRAMES,
+    MONTH_SENSOR_TYPES,
+    POLL_GROUP_DEFAULT,
+    POLL_GROUP_FAST,
+    POLL_GROUP_SLOW,
+    POLL_GROUPS,
+    POLL_STATS_WINDOW,
+    PV_INPUT_STRINGS,
+    PV_INPUTS,
+    PROBE_ADDRESS,
+    READ_LIMIT_FAILURES,
+    READ_LIMIT_RECOVERY_POLLS,
+    REALTIME_DATA_ADDRESS,
+    REALTIME_DATA_COUNT,
+    REGISTER_FAILURE_LIMIT,
+    SENSOR_TYPES,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+    STRING_ANOMALY_ALPHA,
+    STRING_ANOMALY_MIN_CURRENT,
+    STRING_ANOMALY_MIN_SAMPLES,
+    STRING_ANOMALY_SENSOR_TYPES,
+    STRING_ANOMALY_THRESHOLD,
+    TOTAL_SENSOR_TYPES,
+    YEAR_SENSOR_TYPES,
 )
+from .derived import SajDerivedMetrics
+from .decoder import SajModbusBlockDecoder, translate_fault_words
+from .planner import plan_reads
+from .rollup import SajStatisticsRollup
+from .stats import LatencyHistogram, RollingStats
 
 _LOGGER = logging.getLogger(__name__)
 
+# Failures of a block read besides the Modbus exception codes.
+READ_FAILED = 0
+READ_TIMEOUT = -1
+
+REALTIME_DATA_DECODER = SajModbusBlockDecoder(
+    REALTIME_DATA_ADDRESS,
+    REALTIME_DATA_COUNT,
+    [
+        *SENSOR_TYPES.values(),
+        *FAULT_SENSOR_TYPES.values(),
+        *TOTAL_SENSOR_TYPES.values(),
+        *DAY_SENSOR_TYPES.values(),
+        *MONTH_SENSOR_TYPES.values(),
+        *YEAR_SENSOR_TYPES.values(),
+    ],
+)
+INVERTER_DATA_DECODER = SajModbusBlockDecoder(
+    INVERTER_DATA_ADDRESS, INVERTER_DATA_COUNT, INVERTER_DATA_TYPES.values()
+)
+DERIVED_METRICS = SajDerivedMetrics(DERIVED_SENSOR_TYPES.values())
+
+# High rate measurements, the candidates for bulk imported statistics.
+ROLLUP_DESCRIPTIONS = [
+    description
+    for description in REALTIME_DATA_DECODER.descriptions
+    if description.poll_group == POLL_GROUP_FAST
+    and description.state_class == SensorStateClass.MEASUREMENT
+]
+DIAGNOSTIC_KEYS = frozenset(
+    description.key for description in DIAGNOSTIC_SENSOR_TYPES.values())
+DAY_KEYS = frozenset(description.key for description in DAY_SENSOR_TYPES.values())
+MONTH_KEYS = frozenset(description.key for description in MONTH_SENSOR_TYPES.values())
+YEAR_KEYS = frozenset(description.key for description in YEAR_SENSOR_TYPES.values())
+PUBLISH_FILTERS = {
+    description.key: description.publish_filter
+    for description in (
+        *REALTIME_DATA_DECODER.descriptions,
+        *DERIVED_SENSOR_TYPES.values(),
+        *DIAGNOSTIC_SENSOR_TYPES.values(),
+    )
+    if description.publish_filter is not None
+}
+
+
+@lru_cache(maxsize=32)
+def realtime_data_decoder(keys: frozenset[str]) -> SajModbusBlockDecoder:
+    """Return the decoder for the given realtime fields."""
+    return SajModbusBlockDecoder(
+        REALTIME_DATA_ADDRESS,
+        REALTIME_DATA_COUNT,
+        [
+            description
+            for description in REALTIME_DATA_DECODER.descriptions
+            if description.key in keys
+        ],
+    )
+
+
+async def async_probe_inverter(connection: SAJModbusConnection, device_id: int) -> dict:
+    """Work out which PV inputs, strings and registers an inverter has.
+
+    Unpopulated inputs and strings report the 0xFFFF sentinel; ranges the
+    inverter refuses as illegal are split until the refused registers are
+    found. Timeouts and other errors are raised without splitting, as a
+    sleeping inverter tells nothing; so is a block in which no PV input
+    reports. The returned profile is JSON serializable, to be kept in the
+    config entry.
+    """
+    registers = [0] * REALTIME_DATA_COUNT
+    unreadable: set[int] = set()
+    max_read_count = connection.max_read_count
+
+    async def read(address: int, count: int) -> None:
+        nonlocal max_read_count
+        result = await connection.read_holding_registers(device_id, address, count)
+        if not result.isError() and len(result.registers) == count:
+            offset = address - REALTIME_DATA_ADDRESS
+            registers[offset:offset + count] = result.registers
+            return
+        error = getattr(result, "exception_code", READ_FAILED)
+        if error not in MODBUS_REQUEST_EXCEPTIONS:
+            raise ModbusException(
+                f"Inverter did not answer the capability probe ({error})")
+        if count == 1:
+            unreadable.add(address)
+            return
+        half = (count + 1) // 2
+        if error != MODBUS_ILLEGAL_ADDRESS:
+            max_read_count = min(max_read_count, half)
+        await read(address, half)
+        await read(address + half, count - half)
+
+    end = REALTIME_DATA_ADDRESS + REALTIME_DATA_COUNT
+    for address in range(REALTIME_DATA_ADDRESS, end, max_read_count):
+        await read(address, min(max_read_count, end - address))
+
+    data = REALTIME_DATA_DECODER.decode(registers)
+    if all(
+        data.get(f"pv{index}volt") == STATE_UNAVAILABLE
+        for index in range(1, PV_INPUTS + 1)
+    ):
+        """No input reports, e.g. at night, that tells nothing about them"""
+        raise ModbusException("No PV input reports a voltage, probe again later")
+    absent = set()
+    for index in range(1, PV_INPUTS + 1):
+        prefix = f"pv{index}"
+        if data.get(f"{prefix}volt") == STATE_UNAVAILABLE:
+            absent.update(
+                description.key
+                for description in (
+                    *REALTIME_DATA_DECODER.descriptions,
+                    *DERIVED_SENSOR_TYPES.values(),
+                    *STRING_ANOMALY_SENSOR_TYPES.values(),
+                )
+                if description.key.startswith(prefix)
+            )
+            continue
+        for string in range(1, PV_INPUT_STRINGS + 1):
+            if data.get(f"{prefix}strcurr{string}") == STATE_UNAVAILABLE:
+                """A single string input has nothing to compare"""
+                absent.add(f"{prefix}strcurr{string}")
+                absent.add(f"{prefix}strimbalance")
+                absent.update(
+                    f"{prefix}strcurr{other}anomaly"
+                    for other in range(1, PV_INPUT_STRINGS + 1)
+                )
+
+    _LOGGER.debug(
+        "Capabilities of device %s: %s absent fields, %s unreadable registers",
+        device_id,
+        len(absent),
+        len(unreadable),
+    )
+    return {
+        "absent_keys": sorted(absent),
+        "unreadable_registers": sorted(unreadable),
+        "max_read_count": max_read_count,
+    }
+
 
 class SAJModbusHub(DataUpdateCoordinator[dict]):
-    """Thread safe wrapper class for pymodbus."""
+    """Coordinator polling one inverter over a shared Modbus connection."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         name: str,
-        host: str,
-        port: Number,
+        connection: SAJModbusConnection,
+        device_id: int,
         scan_interval: Number,
+        close_after_poll: bool = False,
+        fast_scan_interval: Number | None = None,
+        slow_scan_interval: Number | None = None,
+        read_request_cost: int = DEFAULT_READ_REQUEST_COST,
+        frame_recorder: SajFrameRecorder | None = None,
+        min_scan_interval: Number | None = None,
+        max_scan_interval: Number | None = None,
+        inverter_clock: bool = False,
+        rollup_statistics: bool = False,
+        capabilities: dict | None = None,
     ):
         """Initialize the Modbus hub."""
+        self._poll_intervals = {
+            POLL_GROUP_FAST: fast_scan_interval or scan_interval,
+            POLL_GROUP_DEFAULT: scan_interval,
+            POLL_GROUP_SLOW: max(slow_scan_interval or scan_interval, scan_interval),
+        }
+        self._scan_interval = min(self._poll_intervals.values())
+        self._min_scan_interval = min(
+            min_scan_interval or self._scan_interval, self._scan_interval)
+        self._max_scan_interval = max(
+            max_scan_interval or self._scan_interval, self._scan_interval)
         super().__init__(
             hass,
             _LOGGER,
             name=name,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=self._scan_interval),
+        )
+
+        self._connection = connection
+        self.device_id = device_id
+        self._close_after_poll = close_after_poll
+        # Holds the inverter info and a snapshot of the last realtime data.
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{slugify(name)}.inverter_data"
+        )
+        self._inverter_data_updated: datetime | None = None
+        self._data_updated: datetime | None = None
+        self._connect_count = 0
+        self._last_poll: dict[str, float] = {}
+        self._registers = [0] * REALTIME_DATA_COUNT
+        self._read_request_cost = read_request_cost
+        self._frame_recorder = frame_recorder
+
+        """Leave out what the capability probe did not find"""
+        capabilities = capabilities or {}
+        self.absent_keys = frozenset(capabilities.get("absent_keys", ()))
+        self._unsupported_registers = frozenset(
+            capabilities.get("unreadable_registers", ()))
+        self._unreadable_registers: set[int] = set(self._unsupported_registers)
+        self._register_failures: dict[int, int] = {}
+        self._oversize_count = 0
+        self._oversize_failures = 0
+        self._limited_polls = 0
+        if "max_read_count" in capabilities:
+            connection.max_read_count = min(
+                connection.max_read_count, capabilities["max_read_count"])
+
+        self._enabled_keys = self._dependent_keys(
+            frozenset(
+                description.key
+                for description in (
+                    *REALTIME_DATA_DECODER.descriptions,
+                    *DERIVED_SENSOR_TYPES.values(),
+                    *STRING_ANOMALY_SENSOR_TYPES.values(),
+                )
+                if description.entity_registry_enabled_default
+            )
         )
 
-        self._client = ModbusTcpClient(host=host, port=port, timeout=5)
-        self._lock = threading.Lock()
+        self._key_listeners: dict[Any, list[CALLBACK_TYPE]] = {}
+        self._published: dict[str, tuple[Any, float]] = {}
+        self._notified_success = True
+        self._active_faults: dict[int, str] = {}
+        self._standby = False
+        self.breaker = CircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD, BREAKER_BACKOFF_INITIAL, BREAKER_BACKOFF_MAX
+        )
 
         self.inverter_data: dict = {}
+        self.inverter_clock = inverter_clock
+        self.clock_drift: float | None = None
+        self.string_anomalies = SajStringAnomalyDetector(
+            [
+                description.depends_on
+                for description in STRING_ANOMALY_SENSOR_TYPES.values()
+                if description.key.endswith("1anomaly")
+            ],
+            STRING_ANOMALY_ALPHA,
+            STRING_ANOMALY_THRESHOLD,
+            STRING_ANOMALY_MIN_CURRENT,
+            STRING_ANOMALY_MIN_SAMPLES,
+        )
+        self.rollup = (
+            SajStatisticsRollup(name, ROLLUP_DESCRIPTIONS) if rollup_statistics else None
+        )
         self.data: dict = {}
+        self.listeners_updated = 0
+        self.listeners_skipped = 0
+        self.publishes_suppressed = 0
+        self.poll_stats = {
+            "pollduration": RollingStats(POLL_STATS_WINDOW),
+            "modbusrtt": RollingStats(POLL_STATS_WINDOW),
+            "decodetime": RollingStats(POLL_STATS_WINDOW),
+            "dispatchtime": RollingStats(POLL_STATS_WINDOW),
+            "success": RollingStats(POLL_STATS_WINDOW),
+        }
+        self.latency_histogram = LatencyHistogram(LATENCY_HISTOGRAM_BOUNDS)
+        self.frames = SajFrameRingBuffer(DIAGNOSTICS_FRAMES)
+        self.error_count = 0
+        self.timeout_count = 0
+        self.connection_error_count = 0
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by the data key in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._key_listeners.setdefault(context, []).append(update_callback)
+
+        @callback
+        def remove_key_listener() -> None:
+            """Remove update listener."""
+            remove_listener()
+            self._key_listeners[context].remove(update_callback)
+
+        return remove_key_listener
+
+    def _publish(self, key: str, value: Any, now: float) -> bool:
+        """Return True if a changed value passes the publish filter of its key."""
+        last_value, last_time = self._published.get(key, (None, float("-inf")))
+        if value == last_value:
+            return False
+
+        publish_filter = PUBLISH_FILTERS.get(key)
+        if (
+            publish_filter is not None
+            and isinstance(value, (int, float))
+            and isinstance(last_value, (int, float))
+        ):
+            elapsed = now - last_time
+            deadband = max(
+                publish_filter.deadband,
+                publish_filter.relative_deadband * abs(last_value),
+            )
+            if elapsed < publish_filter.min_interval or (
+                abs(value - last_value) <= deadband
+                and (publish_filter.heartbeat is None or elapsed < publish_filter.heartbeat)
+            ):
+                self.publishes_suppressed += 1
+                return False
+
+        self._published[key] = (value, now)
+        return True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of the keys whose change passes the publish filter."""
+        data = self.data or {}
+        now = time.monotonic()
+
+        if self.last_update_success != self._notified_success:
+            """Availability changed, update everybody"""
+            self._notified_success = self.last_update_success
+            self._published = {key: (value, now) for key, value in data.items()}
+            update_callbacks = [
+                update_callback for update_callback, _ in self._listeners.values()
+            ]
+        else:
+            update_callbacks = [
+                update_callback
+                for key in self._published.keys() | data.keys()
+                if self._publish(key, data.get(key), now)
+                for update_callback in self._key_listeners.get(key, ())
+            ]
+            update_callbacks.extend(self._key_listeners.get(None, ()))
+
+        self.listeners_updated = len(update_callbacks)
+        self.listeners_skipped = len(self._listeners) - len(update_callbacks)
+        _LOGGER.debug(
+            "Updating %s listeners, %s unchanged",
+            self.listeners_updated,
+            self.listeners_skipped,
+        )
+        start = time.monotonic()
+        for update_callback in update_callbacks:
+            update_callback()
+        self.poll_stats["dispatchtime"].add(time.monotonic() - start)
 
     @callback
     def async_remove_listener(self, update_callback: CALLBACK_TYPE) -> None:
@@ -55,266 +430,599 @@ class SAJModbusHub(DataUpdateCoordinator[dict]):
         if not self._listeners:
             self.close()
 
+    @property
+    def device_info(self) -> dict:
+        """Return the device info of the inverter."""
+        device_data = self.inverter_data
+        return {
+            "identifiers": {(DOMAIN, self.name)},
+            "name": self.name,
+            "manufacturer": ATTR_MANUFACTURER,
+            "sw_version": device_data.get("dv"),
+            "hw_version": device_data.get("mcv"),
+            "serial_number": device_data.get("sn"),
+        }
+
+    @property
+    def connection_stats(self) -> dict:
+        """Return the statistics of the shared connection."""
+        return self._connection.stats
+
     def close(self) -> None:
         """Disconnect client."""
-        with self._lock:
-            self._client.close()
+        self._connection.close()
 
-    def _read_holding_registers(self, unit, address, count):
+    async def _read_holding_registers(self, unit, address, count):
         """Read holding registers."""
-        with self._lock:
-            return self._client.read_holding_registers(
-                address=address, count=count, device_id=unit
+        try:
+            result = await self._connection.read_holding_registers(unit, address, count)
+        except ModbusIOException:
+            self.timeout_count += 1
+            raise
+        except ConnectionException:
+            self.connection_error_count += 1
+            raise
+
+        self.poll_stats["modbusrtt"].add(self._connection.last_rtt)
+        self.latency_histogram.add(self._connection.last_rtt)
+        if result.isError() or len(result.registers) != count:
+            self.error_count += 1
+            return result
+
+        self.frames.record(unit, address, result.registers)
+        if self._frame_recorder is not None:
+            self._frame_recorder.record(unit, address, result.registers)
+        return result
+
+    @callback
+    def async_track_enabled_entities(self) -> CALLBACK_TYPE:
+        """Keep the set of read registers in line with the enabled entities."""
+        self._async_update_enabled_keys()
+
+        @callback
+        def _async_entity_registry_updated(event: Event) -> None:
+            if event.data["action"] != "update" or "disabled_by" in event.data.get(
+                "changes", {}
+            ):
+                self._async_update_enabled_keys()
+
+        return self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated
+        )
+
+    def _dependent_keys(self, keys: frozenset[str]) -> frozenset[str]:
+        """Add the fields the derived metrics and anomaly flags are computed from."""
+        return (keys | DERIVED_METRICS.dependencies(keys) | frozenset(
+            dependency
+            for description in STRING_ANOMALY_SENSOR_TYPES.values()
+            if description.key in keys
+            for dependency in description.depends_on
+        )) - self.absent_keys
+
+    @callback
+    def _async_update_enabled_keys(self) -> None:
+        """Work out the realtime keys behind enabled entities."""
+        enabled = {
+            description.key: description.entity_registry_enabled_default
+            for description in (
+                *REALTIME_DATA_DECODER.descriptions,
+                *DERIVED_SENSOR_TYPES.values(),
+                *STRING_ANOMALY_SENSOR_TYPES.values(),
             )
+        }
+        prefix = f"{self.name}_"
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(self.hass), self.config_entry.entry_id
+        ):
+            key = entity.unique_id.removeprefix(prefix)
+            if key in enabled:
+                enabled[key] = entity.disabled_by is None
 
-    def convert_to_signed16(self, value):
-        """Convert unsigned 16 bit integers to signed integers."""
-        if value >= 0x8000:
-            return value - 0x10000
-        else:
-            return value
+        enabled_keys = self._dependent_keys(
+            frozenset(key for key, value in enabled.items() if value)
+        )
+        if enabled_keys != self._enabled_keys:
+            _LOGGER.debug(
+                "Reading %s of %s realtime fields",
+                len(enabled_keys),
+                len(REALTIME_DATA_DECODER.descriptions),
+            )
+            self._enabled_keys = enabled_keys
+
+    @callback
+    def async_track_rollups(self) -> CALLBACK_TYPE:
+        """Import the rollups of every passed hour as external statistics."""
 
-    def convert_to_signed32(self, value):
-        """Convert unsigned 32 bit integers to signed integers."""
-        if value >= 0x80000000:
-            return value - 0x100000000
+        @callback
+        def _async_hour_passed(now: datetime) -> None:
+            # Statistics start at a full UTC hour, local hours may not.
+            start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+            self.rollup.async_import(self.hass, start)
+
+        return async_track_utc_time_change(
+            self.hass, _async_hour_passed, minute=0, second=0
+        )
+
+    async def async_restore_snapshot(self) -> None:
+        """Restore the cached inverter info and realtime data of the known device."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        inverter_data = stored.get("inverter_data", {})
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, self.name)}
+        )
+        if device is None or device.serial_number != inverter_data.get("sn"):
+            return
+
+        self.inverter_data = inverter_data
+        self._inverter_data_updated = dt_util.parse_datetime(stored["updated"])
+        if stored.get("data_updated"):
+            self._data_updated = dt_util.parse_datetime(stored["data_updated"])
+            ended = self._ended_period_keys(self._data_updated)
         else:
-            return value
+            """The period the totals were counted in is unknown"""
+            ended = DAY_KEYS | MONTH_KEYS | YEAR_KEYS
+        self.data = {
+            key: value
+            for key, value in stored.get("data", {}).items()
+            if key not in ended
+        }
+
+    def _ended_period_keys(self, updated: datetime) -> frozenset[str]:
+        """Return the day, month and year totals counted in a period that has ended."""
+        # Periods follow the inverter clock when configured, like the sensors.
+        offset = self.period_offset
+        then = (dt_util.as_local(updated) + offset).date()
+        today = (dt_util.now() + offset).date()
+        keys = frozenset()
+        if then != today:
+            keys |= DAY_KEYS
+        if (then.year, then.month) != (today.year, today.month):
+            keys |= MONTH_KEYS
+        if then.year != today.year:
+            keys |= YEAR_KEYS
+        return keys
+
+    @callback
+    def _data_to_store(self) -> dict:
+        """Return the inverter info and the JSON serializable realtime data."""
+        return {
+            "inverter_data": self.inverter_data,
+            "updated": self._inverter_data_updated.isoformat(),
+            "data_updated": self._data_updated and self._data_updated.isoformat(),
+            # Timestamps would be restored as strings, they are read again.
+            "data": {
+                key: value
+                for key, value in self.data.items()
+                if key not in DIAGNOSTIC_KEYS
+                and isinstance(value, (bool, int, float, str, list, type(None)))
+            },
+        }
+
+    def _inverter_data_outdated(self) -> bool:
+        """Return True if the static inverter info must be read again."""
+        if not self.inverter_data or self._inverter_data_updated is None:
+            return True
+        if dt_util.utcnow() - self._inverter_data_updated > INVERTER_DATA_REFRESH_INTERVAL:
+            return True
+
+        """A reconnect may follow a reboot after a firmware update"""
+        connect_count = self._connection.connect_count
+        reconnected = 0 < self._connect_count < connect_count
+        self._connect_count = connect_count
+        return reconnected and not self._close_after_poll
+
+    async def _async_refresh_inverter_data(self) -> None:
+        """Read the static inverter info and store it."""
+        inverter_data = await self.read_modbus_inverter_data()
+        if not inverter_data:
+            return
+
+        if self.inverter_data and self.inverter_data.get("sn") != inverter_data["sn"]:
+            _LOGGER.info(
+                "Inverter serial number changed from %s to %s",
+                self.inverter_data.get("sn"),
+                inverter_data["sn"],
+            )
+
+        self.inverter_data = inverter_data
+        self._inverter_data_updated = dt_util.utcnow()
+        self._unreadable_registers = set(self._unsupported_registers)
+        self._register_failures.clear()
+        self._connect_count = self._connection.connect_count
+        await self._store.async_save(self._data_to_store())
+
+        """Entities may have been created before the inverter info was read"""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, self.name)})
+        if device is not None:
+            device_registry.async_update_device(
+                device.id,
+                sw_version=inverter_data["dv"],
+                hw_version=inverter_data["mcv"],
+                serial_number=inverter_data["sn"],
+            )
+
+    def _due_poll_groups(self) -> frozenset[str]:
+        """Return the poll groups whose scan interval has elapsed."""
+        # Allow half a tick of jitter so a group is not pushed to the next tick.
+        now = time.monotonic() + self.update_interval.total_seconds() / 2
+        return frozenset(
+            poll_group
+            for poll_group, interval in self._poll_intervals.items()
+            if now - self._last_poll.get(poll_group, float("-inf")) >= interval
+        )
+
+    def _next_scan_interval(self, previous: dict, data: dict) -> Number:
+        """Return the scan interval suiting the operating mode of the inverter."""
+        if not data:
+            """The AIO3 module may stop answering while the inverter is in standby"""
+            return self._max_scan_interval if self._standby else self._scan_interval
+
+        mode = data.get("mpvmode")
+        power = data.get("power")
+        previous_power = previous.get("power")
+        pv_power = data.get("dcpower")
+        if pv_power is None:
+            pv_power = power
+        # Keep polling a faulted inverter, it may recover or report more faults.
+        self._standby = mode == DEVICE_STATUSSES[1] or not pv_power
 
-    def parse_datetime(self, registers: list[int]) -> datetime:
-        """Extract date and time values from registers."""
+        if previous and mode != previous.get("mpvmode"):
+            return self._min_scan_interval
+        if self._standby:
+            return self._max_scan_interval
+        if None not in (power, previous_power) and abs(power - previous_power) > (
+            ADAPTIVE_POWER_CHANGE * max(power, previous_power)
+        ):
+            return self._min_scan_interval
+        return self._scan_interval
 
-        year = registers[0]  # yyyy
-        month = registers[1] >> 8  # MM
-        day = registers[1] & 0xFF  # dd
-        hour = registers[2] >> 8  # HH
-        minute = registers[2] & 0xFF  # mm
-        second = registers[3] >> 8  # ss
+    def _update_clock_drift(self, inverter_time: datetime | None) -> None:
+        """Work out how far the inverter clock runs ahead of Home Assistant."""
+        if inverter_time is None:
+            return
+        # The inverter clock has no time zone, compare the wall clock times.
+        self.clock_drift = (
+            inverter_time.replace(tzinfo=None) - dt_util.now().replace(tzinfo=None)
+        ).total_seconds()
+
+    @property
+    def period_offset(self) -> timedelta:
+        """Return how much earlier than Home Assistant a period starts."""
+        if not self.inverter_clock or self.clock_drift is None:
+            return timedelta()
+        return timedelta(seconds=self.clock_drift)
+
+    def _poll_stats_data(self) -> dict:
+        """Return the values of the diagnostic sensors."""
+        data = {
+            key: round(stats.percentile(50) * 1000, 1) if len(stats) else None
+            for key, stats in self.poll_stats.items()
+            if key in ("pollduration", "modbusrtt", "decodetime")
+        }
+        success = self.poll_stats["success"].mean()
+        data["successrate"] = round(success * 100, 1) if success is not None else None
+        data["reconnectcount"] = max(self._connection.connect_count - 1, 0)
+        data["scaninterval"] = self.update_interval.total_seconds()
+        data["suppressedupdates"] = self.publishes_suppressed
+        data["clockdrift"] = round(self.clock_drift) if self.clock_drift is not None else None
+        return data
+
+    @callback
+    def _async_publish_poll_stats(self) -> None:
+        """Update the diagnostic sensors after a failed poll.
 
-        timevalues = f"{year:04}{month:02}{day:02}{hour:02}{minute:02}{second:02}"
-        # Convert to datetime object
-        date_time_obj = datetime.astimezone(
-            datetime.strptime(timevalues, '%Y%m%d%H%M%S'))
+        The coordinator notifies no listeners while polls keep failing, but the
+        poll statistics matter most during an outage.
+        """
+        self.data = {**(self.data or {}), **self._poll_stats_data()}
+        for key in DIAGNOSTIC_KEYS:
+            for update_callback in self._key_listeners.get(key, ()):
+                update_callback()
 
-        return (date_time_obj)
+    async def _async_probe(self) -> bool:
+        """Return True if the inverter answers a single register read."""
+        result = await self._read_holding_registers(
+            unit=self.device_id, address=PROBE_ADDRESS, count=1)
+        return not result.isError() and len(result.registers) == 1
 
     async def _async_update_data(self) -> dict:
-        realtime_data = {}
-        try:
-            """Read inverter info"""
-            self.inverter_data = await self.hass.async_add_executor_job(
-                self.read_modbus_inverter_data
+        if not self.breaker.allow_request():
+            raise UpdateFailed(
+                f"Inverter is unreachable, next attempt in {self.breaker.retry_in:.0f} s"
             )
+
+        start = time.monotonic()
+        data = {}
+        try:
+            if self.breaker.state == BREAKER_HALF_OPEN and not await self._async_probe():
+                raise ConnectionException("Inverter did not answer the probe")
+
+            """Read inverter info, it resets the registers skipped so far"""
+            if self._inverter_data_outdated():
+                await self._async_refresh_inverter_data()
+
             """Read realtime data"""
-            realtime_data = await self.hass.async_add_executor_job(
-                self.read_modbus_r6_realtime_data
-            )
+            poll_groups = self._due_poll_groups() or frozenset({POLL_GROUP_FAST})
+            realtime_data = await self.read_modbus_r6_realtime_data(poll_groups)
+            if realtime_data is not None:
+                self._data_updated = dt_util.utcnow()
+                now = time.monotonic()
+                self._last_poll.update(dict.fromkeys(poll_groups, now))
+                data = {**self.data, **realtime_data}
+                DERIVED_METRICS.compute(data)
+                self._detect_string_anomalies(realtime_data)
+                data.update(self.string_anomalies.states())
+                self._update_clock_drift(realtime_data.get("time"))
+                if self.rollup is not None:
+                    self.rollup.add(realtime_data, now)
 
-        except (BrokenPipeError, ConnectionResetError, ConnectionException) as conerr:
-            _LOGGER.error(
-                "Reading realtime data failed! Inverter is unreachable.")
+        except (
+            BrokenPipeError,
+            ConnectionResetError,
+            ConnectionException,
+            ModbusIOException,
+        ) as conerr:
             _LOGGER.debug("Connection error: %s", conerr)
 
-        self.close()
-        return {**realtime_data}
+        scan_interval = self._next_scan_interval(self.data, data)
+        if scan_interval != self.update_interval.total_seconds():
+            _LOGGER.debug("Scan interval changed to %s s", scan_interval)
+            self.update_interval = timedelta(seconds=scan_interval)
+        if data:
+            self.breaker.record_success()
+            self._grow_read_limit()
+            if self._inverter_data_updated is not None:
+                self._store.async_delay_save(self._data_to_store, SNAPSHOT_SAVE_DELAY)
+        else:
+            """Read all poll groups once the inverter answers again"""
+            self._last_poll.clear()
+            self.breaker.record_failure()
+        if self._close_after_poll:
+            """Other inverters may share the connection"""
+            await self._connection.async_close_when_idle()
+        if self._frame_recorder is not None:
+            try:
+                await self.hass.async_add_executor_job(
+                    self._frame_recorder.write, self._frame_recorder.take()
+                )
+            except OSError as err:
+                """Losing frames must not fail the poll"""
+                _LOGGER.warning("Writing the frame capture failed: %s", err)
+        self.poll_stats["success"].add(1 if data else 0)
+        self.poll_stats["pollduration"].add(time.monotonic() - start)
+        _LOGGER.debug("Connection stats: %s", self._connection.stats)
+        if not data:
+            self._async_publish_poll_stats()
+            """Logged by the coordinator once, when the inverter goes away"""
+            raise UpdateFailed("Reading realtime data failed! Inverter is unreachable.")
+        return {**data, **self._poll_stats_data()}
 
-    def read_modbus_inverter_data(self) -> dict:
+    async def async_probe_capabilities(self) -> dict:
+        """Probe the capabilities of the inverter over the hub connection."""
+        return await async_probe_inverter(self._connection, self.device_id)
+
+    async def read_modbus_inverter_data(self) -> dict:
         """Read data about inverter."""
-        inverter_data = self._read_holding_registers(
-            unit=1, address=0x8F00, count=29)
+        inverter_data = await self._read_holding_registers(
+            unit=self.device_id, address=INVERTER_DATA_ADDRESS, count=INVERTER_DATA_COUNT)
 
-        if inverter_data.isError() or len(inverter_data.registers) != 29:
+        if inverter_data.isError() or len(inverter_data.registers) != INVERTER_DATA_COUNT:
             return {}
 
-        registers = inverter_data.registers
-        data = {
-            "type": registers[0],
-            "subtype": round(registers[1] * 0.001, 3),
-            "commproversion": round(registers[2] * 0.001, 3),
-            "sn": ''.join(chr(registers[i] >> 8) + chr(registers[i] & 0xFF) for i in range(3, 13)).rstrip('\x00') if registers[3] != 0x00 else STATE_UNAVAILABLE,
-            "pc": ''.join(chr(registers[i] >> 8) + chr(registers[i] & 0xFF) for i in range(13, 23)).rstrip('\x00') if registers[13] != 0x00 else STATE_UNAVAILABLE,
-            "dv": f"{round(registers[23] * 0.001, 3):.3f}" if registers[23] != 0xFFFF else STATE_UNAVAILABLE,
-            "mcv": f"{round(registers[24] * 0.001, 3):.3f}" if registers[24] != 0xFFFF else STATE_UNAVAILABLE,
-            "scv": f"{round(registers[25] * 0.001, 3):.3f}" if registers[25] != 0xFFFF else STATE_UNAVAILABLE,
-            "disphwversion": f"{round(registers[26] * 0.001, 3):.3f}" if registers[26] != 0xFFFF else STATE_UNAVAILABLE,
-            "ctrlhwversion": f"{round(registers[27] * 0.001, 3):.3f}" if registers[27] != 0xFFFF else STATE_UNAVAILABLE,
-            "powerhwversion": f"{round(registers[28] * 0.001, 3):.3f}" if registers[28] != 0xFFFF else STATE_UNAVAILABLE,
-        }
+        return INVERTER_DATA_DECODER.decode(inverter_data.registers)
 
-        return data
+    async def _async_read_block(self, address: int, count: int) -> int | None:
+        """Read a range into the realtime frame, return None or why it failed.
 
-    def read_modbus_r6_realtime_data(self) -> dict:
-        """Read realtime data from inverter."""
-        realtime_data = self._read_holding_registers(
-            unit=1, address=0x6000, count=99)
+        A failure is the Modbus exception code of the reply, or READ_FAILED
+        for a short or otherwise broken reply.
+        """
+        result = await self._read_holding_registers(
+            unit=self.device_id, address=address, count=count)
+        if result.isError() or len(result.registers) != count:
+            return getattr(result, "exception_code", READ_FAILED) or READ_FAILED
 
-        if realtime_data.isError() or len(realtime_data.registers) != 99:
-            return {}
+        offset = address - REALTIME_DATA_ADDRESS
+        self._registers[offset:offset + count] = result.registers
+        if self._oversize_failures and count >= self._oversize_count:
+            self._oversize_failures = 0
+        if self._register_failures:
+            for register in range(address, address + count):
+                self._register_failures.pop(register, None)
+        return None
 
-        registers = realtime_data.registers
-        data = {}
+    async def _read_realtime_registers(
+        self, address: int, count: int, split_timeouts: bool = True
+    ) -> list[tuple[int, int]]:
+        """Read a range into the realtime frame, splitting it when the read fails.
+
+        Returns the (address, count) ranges that could not be read. A timed
+        out read is split once only, or not at all without split_timeouts,
+        so a dead inverter is not probed register by register.
+        """
+        try:
+            error = await self._async_read_block(address, count)
+        except ModbusIOException:
+            if count == 1 or not split_timeouts:
+                raise
+            error = READ_TIMEOUT
+        return await self._split_failed_read(address, count, error)
+
+    async def _split_failed_read(
+        self, address: int, count: int, error: int | None
+    ) -> list[tuple[int, int]]:
+        """Find the readable parts of a range whose read failed with error.
+
+        Both halves are read first. When both succeed the block may exceed
+        the PDU size of the gateway. When both fail the inverter rather than
+        the range is the problem, unless both requests were refused as
+        illegal, and splitting further would only cost requests. Busy and
+        gateway errors say nothing about the range, so it is not split at all.
+        """
+        if error is None:
+            return []
+        if count == 1:
+            self._register_failed(address, error)
+            return [(address, count)]
+        if error in MODBUS_TRANSIENT_EXCEPTIONS:
+            return [(address, count)]
+
+        half = (count + 1) // 2
+        halves = ((address, half), (address + half, count - half))
+        errors = [await self._async_read_block(start, size) for start, size in halves]
+        if errors == [None, None]:
+            self._read_too_large(count)
+            return []
+        if None not in errors and not MODBUS_REQUEST_EXCEPTIONS.issuperset(errors):
+            return [(address, count)]
+        return [
+            failed
+            for (start, size), half_error in zip(halves, errors)
+            for failed in await self._split_failed_read(start, size, half_error)
+        ]
 
-        data["time"] = self.parse_datetime(registers[0:4])
-        data["totalenergy"] = round(
-            (registers[4] << 16 | registers[5]) * 0.01, 2)
-        data["yearenergy"] = round(
-            (registers[6] << 16 | registers[7]) * 0.01, 2)
-        data["monthenergy"] = round(
-            (registers[8] << 16 | registers[9]) * 0.01, 2)
-        data["todayenergy"] = round(
-            (registers[10] << 16 | registers[11]) * 0.01, 2)
-        data["totalhour"] = round(
-            (registers[12] << 16 | registers[13]) * 0.1, 1)
-        data["todayhour"] = round(registers[14] * 0.1, 1)
-
-        data["errorcount"] = registers[15]
-        data["errorsn"] = registers[16]
-        data["settingdatasn"] = registers[17]
-        # data["reserved"] = registers[18]
-        mpvmode = registers[19]
-        data["mpvmode"] = STATE_UNAVAILABLE if mpvmode < 1 or mpvmode > 3 else DEVICE_STATUSSES.get(
-            mpvmode)
-        faultMsg0 = registers[20] << 16 | registers[21]
-        faultMsg1 = registers[22] << 16 | registers[23]
-        faultMsg2 = registers[24] << 16 | registers[25]
-        faultMsg = []
-        faultMsg.extend(
-            self.translate_fault_code_to_messages(
-                faultMsg0, FAULT_MESSAGES[0].items())
+    def _register_failed(self, register: int, error: int) -> None:
+        """Skip a register the inverter refuses or that keeps failing."""
+        if error in MODBUS_TRANSIENT_EXCEPTIONS:
+            return
+        failures = self._register_failures.get(register, 0) + 1
+        self._register_failures[register] = failures
+        if error != MODBUS_ILLEGAL_ADDRESS and failures < REGISTER_FAILURE_LIMIT:
+            return
+
+        """Skipped until the next inverter info refresh"""
+        _LOGGER.warning("Register 0x%04X is unreadable, skipping it", register)
+        self._unreadable_registers.add(register)
+        del self._register_failures[register]
+
+    def _read_too_large(self, count: int) -> None:
+        """Halve the block size once reads of count registers keep failing."""
+        self._oversize_count = (
+            min(count, self._oversize_count) if self._oversize_failures else count
         )
-        faultMsg.extend(
-            self.translate_fault_code_to_messages(
-                faultMsg1, FAULT_MESSAGES[1].items())
+        self._oversize_failures += 1
+        self._limited_polls = 0
+        if self._oversize_failures < READ_LIMIT_FAILURES:
+            return
+
+        self._oversize_failures = 0
+        half = (self._oversize_count + 1) // 2
+        if half < self._connection.max_read_count:
+            _LOGGER.info("Reading at most %s registers per request", half)
+            self._connection.max_read_count = half
+
+    def _grow_read_limit(self) -> None:
+        """Try a lowered block size doubled again after a run of good polls."""
+        max_read_count = self._connection.max_read_count
+        if max_read_count >= MAX_READ_COUNT:
+            return
+        self._limited_polls += 1
+        if self._limited_polls < READ_LIMIT_RECOVERY_POLLS:
+            return
+
+        self._limited_polls = 0
+        self._connection.max_read_count = min(max_read_count * 2, MAX_READ_COUNT)
+        _LOGGER.debug(
+            "Trying reads of %s registers again", self._connection.max_read_count
+        )
+
+    async def read_modbus_r6_realtime_data(
+        self, poll_groups: frozenset[str] = frozenset(POLL_GROUPS)
+    ) -> dict | None:
+        """Read realtime data of the enabled entities in the given poll groups."""
+        decoder = realtime_data_decoder(
+            frozenset(
+                description.key
+                for description in REALTIME_DATA_DECODER.descriptions
+                if (
+                    description.key in ALWAYS_READ_KEYS
+                    or description.poll_group in poll_groups
+                    and description.key in self._enabled_keys
+                )
+                and self._unreadable_registers.isdisjoint(
+                    range(description.address, description.address + description.count)
+                )
+            )
         )
-        faultMsg.extend(
-            self.translate_fault_code_to_messages(
-                faultMsg2, FAULT_MESSAGES[2].items())
+        reads = plan_reads(
+            decoder.descriptions,
+            self._read_request_cost,
+            self._connection.max_read_count,
+            self._unreadable_registers,
         )
+        failed: list[tuple[int, int]] = []
+        for address, count in reads:
+            failed.extend(await self._read_realtime_registers(address, count))
+        if sum(count for _, count in failed) == sum(count for _, count in reads):
+            return None
+
+        start = time.monotonic()
+        data = decoder.decode(self._registers)
+        if failed:
+            """Keep the previous values of the fields that could not be read"""
+            _LOGGER.debug("Reading %s failed", failed)
+            failed_registers = {
+                register
+                for address, count in failed
+                for register in range(address, address + count)
+            }
+            for description in decoder.descriptions:
+                if not failed_registers.isdisjoint(
+                    range(description.address, description.address + description.count)
+                ):
+                    data.pop(description.key, None)
+        if "faultmsg" not in data:
+            self.poll_stats["decodetime"].add(time.monotonic() - start)
+            return data
+
+        faults = translate_fault_words(data["faultmsg"])
         # status value can hold max 255 chars in HA
-        data["faultmsg"] = ", ".join(faultMsg).strip()[0:254]
-        if faultMsg:
-            _LOGGER.error("Fault message: " + ", ".join(faultMsg).strip())
-        data["conntime"] = registers[26]
-
-        data["energy"] = round((registers[27] << 16 | registers[28]) * 0.01, 2)
-        data["power"] = (registers[29] << 16 | registers[30])
-        data["qpower"] = self.convert_to_signed32(
-            (registers[31] << 16 | registers[32]))
-        data["pf"] = round(self.convert_to_signed16(registers[33]) * 0.001, 3)
-
-        data["l1volt"] = round(registers[34] * 0.1, 1)
-        data["l1curr"] = round(registers[35] * 0.01, 2)
-        data["l1freq"] = round(registers[36] * 0.01, 2)
-        data["l1dci"] = self.convert_to_signed16(registers[37])
-        data["l1power"] = registers[38]
-        data["l1pf"] = round(
-            self.convert_to_signed16(registers[39]) * 0.001, 3)
-        data["l2volt"] = round(registers[40] * 0.1, 1)
-        data["l2curr"] = round(registers[41] * 0.01, 2)
-        data["l2freq"] = round(registers[42] * 0.01, 2)
-        data["l2dci"] = self.convert_to_signed16(registers[43])
-        data["l2power"] = registers[44]
-        data["l2pf"] = round(
-            self.convert_to_signed16(registers[45]) * 0.001, 3)
-        data["l3volt"] = round(registers[46] * 0.1, 1)
-        data["l3curr"] = round(registers[47] * 0.01, 2)
-        data["l3freq"] = round(registers[48] * 0.01, 2)
-        data["l3dci"] = self.convert_to_signed16(registers[49])
-        data["l3power"] = registers[50]
-        data["l3pf"] = round(
-            self.convert_to_signed16(registers[51]) * 0.001, 3)
-        data["nevolt"] = round(registers[52] * 0.1, 1)
-        data["gfci"] = self.convert_to_signed16(registers[53])
-        data["busvolt"] = round(registers[54] * 0.1, 1)
-        data["busvoltm"] = round(registers[55] * 0.1, 1)
-
-        data["invtempc1"] = round(
-            self.convert_to_signed16(registers[56]) * 0.1, 1)
-        data["invtempcl1"] = round(
-            self.convert_to_signed16(registers[57]) * 0.1, 1)
-        data["invtempcl2"] = round(
-            self.convert_to_signed16(registers[58]) * 0.1, 1)
-        data["invtempcl3"] = round(
-            self.convert_to_signed16(registers[59]) * 0.1, 1)
-        data["invtempccavity"] = round(
-            self.convert_to_signed16(registers[60]) * 0.1, 1)
-        # data["pvtempc1"] = round(self.convert_to_signed16(registers[61]) * 0.1, 1)
-        # data["pvtempc2"] = round(self.convert_to_signed16(registers[62]) * 0.1, 1)
-        # data["pvtempc3"] = round(self.convert_to_signed16(registers[63]) * 0.1, 1)
-        # data["pvtempc4"] = round(self.convert_to_signed16(registers[64]) * 0.1, 1)
-
-        data["iso1"] = registers[65]
-        data["iso2"] = registers[66]
-        data["iso3"] = registers[67]
-        data["iso4"] = registers[68]
-
-        data["pv1volt"] = round(
-            registers[69] * 0.1, 1) if registers[69] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv1curr"] = round(
-            registers[70] * 0.01, 2) if registers[70] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv1power"] = registers[71] if registers[71] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv2volt"] = round(
-            registers[72] * 0.1, 1) if registers[72] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv2curr"] = round(
-            registers[73] * 0.01, 2) if registers[73] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv2power"] = registers[74] if registers[74] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv3volt"] = round(
-            registers[75] * 0.1, 1) if registers[75] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv3curr"] = round(
-            registers[76] * 0.01, 2) if registers[76] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv3power"] = registers[77] if registers[77] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv4volt"] = round(
-            registers[78] * 0.1, 1) if registers[78] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv4curr"] = round(
-            registers[79] * 0.01, 2) if registers[79] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv4power"] = registers[80] if registers[80] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv5volt"] = round(
-            registers[81] * 0.1, 1) if registers[81] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv5curr"] = round(
-            registers[82] * 0.01, 2) if registers[82] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv5power"] = registers[83] if registers[83] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv6volt"] = round(
-            registers[84] * 0.1, 1) if registers[84] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv6curr"] = round(
-            registers[85] * 0.01, 2) if registers[85] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv6power"] = registers[86] if registers[86] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv1strcurr1"] = round(
-            registers[87] * 0.01, 2) if registers[87] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv1strcurr2"] = round(
-            registers[88] * 0.01, 2) if registers[88] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv2strcurr1"] = round(
-            registers[89] * 0.01, 2) if registers[89] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv2strcurr2"] = round(
-            registers[90] * 0.01, 2) if registers[90] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv3strcurr1"] = round(
-            registers[91] * 0.01, 2) if registers[91] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv3strcurr2"] = round(
-            registers[92] * 0.01, 2) if registers[92] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv4strcurr1"] = round(
-            registers[93] * 0.01, 2) if registers[93] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv4strcurr2"] = round(
-            registers[94] * 0.01, 2) if registers[94] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv5strcurr1"] = round(
-            registers[95] * 0.01, 2) if registers[95] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv5strcurr2"] = round(
-            registers[96] * 0.01, 2) if registers[96] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv6strcurr1"] = round(
-            registers[97] * 0.01, 2) if registers[97] != 0xFFFF else STATE_UNAVAILABLE
-        data["pv6strcurr2"] = round(
-            registers[98] * 0.01, 2) if registers[98] != 0xFFFF else STATE_UNAVAILABLE
+        data["faultmsg"] = ", ".join(message for _, message in faults)[0:254]
+        data["faultcodes"] = [code for code, _ in faults]
+        self._log_fault_transitions(dict(faults))
+        self.poll_stats["decodetime"].add(time.monotonic() - start)
 
         return data
 
-    def translate_fault_code_to_messages(
-        self, fault_code: int, fault_messages: list
-    ) -> list:
-        """Translate faultcodes to readable messages."""
-        messages = []
-        if not fault_code:
-            return messages
+    def _detect_string_anomalies(self, data: dict) -> None:
+        """Feed the string currents to the detector and report drifting strings."""
+        for key, anomalous in self.string_anomalies.add(data):
+            ratio = self.string_anomalies.ratio(key)
+            if anomalous:
+                _LOGGER.warning(
+                    "String %s of %s carries %.0f%% of the mean current of its PV input",
+                    key,
+                    self.name,
+                    ratio * 100,
+                )
+            else:
+                _LOGGER.info("String %s of %s recovered", key, self.name)
+            self.hass.bus.async_fire(
+                EVENT_STRING_ANOMALY,
+                {
+                    "name": self.name,
+                    "string": key,
+                    "anomalous": anomalous,
+                    "ratio": round(ratio, 3),
+                },
+            )
 
-        for code, mesg in fault_messages:
-            if fault_code & code:
-                messages.append(mesg)
+    def _log_fault_transitions(self, faults: dict[int, str]) -> None:
+        """Log faults when they are set and when they are cleared."""
+        active_faults = self._active_faults
+        self._active_faults = faults
 
-        return messages
+        raised = [
+            message for code, message in faults.items() if code not in active_faults
+        ]
+        cleared = [
+            message for code, message in active_faults.items() if code not in faults
+        ]
+        if raised:
+            _LOGGER.error("Fault message: %s", ", ".join(raised))
+        if cleared:
+            _LOGGER.info("Fault cleared: %s", ", ".join(cleared))
@@ -0,0 +1,37 @@
+"""Read planner for SAJ R6 Inverter Modbus."""
+
+from collections.abc import Iterable
+
+from .const import SajModbusSensorEntityDescription
+
+
+def plan_reads(
+    descriptions: Iterable[SajModbusSensorEntityDescription],
+    request_cost: int,
+    max_count: int,
+    unreadable: frozenset[int] | set[int] = frozenset(),
+) -> list[tuple[int, int]]:
+    """Return the cheapest (address, count) reads covering all descriptions.
+
+    The cost model counts one unit per register transferred and request_cost
+    units per read request. Neighbouring ranges are therefore merged when
+    the unused registers between them cost no more than an extra request,
+    as long as the merged read does not exceed max_count registers and the
+    registers between them are not known to be unreadable.
+    """
+    reads: list[list[int]] = []
+    for start, end in sorted(
+        (description.address, description.address + description.count)
+        for description in descriptions
+    ):
+        if (
+            reads
+            and start - reads[-1][1] <= request_cost
+            and end - reads[-1][0] <= max_count
+            and unreadable.isdisjoint(range(reads[-1][1], start))
+        ):
+            reads[-1][1] = max(reads[-1][1], end)
+        else:
+            reads.append([start, end])
+
+    return [(start, end - start) for start, end in reads]
@@ -0,0 +1,144 @@
+"""Hourly statistics rollups for SAJ R6 Inverter Modbus."""
+
+from array import array
+from collections.abc import Iterable
+from datetime import datetime
+import math
+import time
+
+from homeassistant.components.sensor import UNIT_CONVERTERS
+from homeassistant.core import HomeAssistant
+from homeassistant.util import slugify
+
+from .const import DOMAIN, SajModbusSensorEntityDescription
+
+
+class SajStatisticsRollup:
+    """Accumulate min, max and mean of high rate measurements per period.
+
+    Every key has a fixed slot in preallocated arrays, so adding a poll is a
+    handful of float operations per key and no per-sample storage. The scan
+    interval adapts to the inverter, so the mean weights every sample by the
+    time since the previous one.
+    """
+
+    def __init__(
+        self, name: str, descriptions: Iterable[SajModbusSensorEntityDescription]
+    ):
+        """Initialize the accumulators."""
+        self.name = name
+        self.descriptions = list(descriptions)
+        self.keys = frozenset(description.key for description in self.descriptions)
+        size = len(self.descriptions)
+        self._count = array("L", [0] * size)
+        self._weight = array("d", [0.0] * size)
+        self._sum = array("d", [0.0] * size)
+        self._min = array("d", [math.inf] * size)
+        self._max = array("d", [-math.inf] * size)
+        self._period_start = -math.inf
+        self._last_sample: float | None = None
+
+    def add(self, data: dict, now: float | None = None) -> None:
+        """Add the values of one poll at monotonic time now."""
+        if now is None:
+            now = time.monotonic()
+        # A sample stands for the time since the previous one, within the period.
+        weight = (
+            now - max(self._last_sample, self._period_start)
+            if self._last_sample is not None
+            else 0.0
+        )
+        self._last_sample = now
+        for index, description in enumerate(self.descriptions):
+            value = data.get(description.key)
+            if not isinstance(value, (int, float)):
+                continue
+            self._count[index] += 1
+            self._weight[index] += weight
+            self._sum[index] += weight * value
+            if value < self._min[index]:
+                self._min[index] = value
+            if value > self._max[index]:
+                self._max[index] = value
+
+    def rollups(self) -> dict[str, tuple[float, float, float]]:
+        """Return (min, max, mean) per key of the period."""
+        return {
+            description.key: (
+                self._min[index],
+                self._max[index],
+                # The very first sample has no weight yet, it is the only one.
+                self._sum[index] / self._weight[index]
+                if self._weight[index]
+                else self._min[index],
+            )
+            for index, description in enumerate(self.descriptions)
+            if self._count[index]
+        }
+
+    def reset(self, now: float | None = None) -> None:
+        """Start a new period at monotonic time now."""
+        for index in range(len(self.descriptions)):
+            self._count[index] = 0
+            self._weight[index] = 0.0
+            self._sum[index] = 0.0
+            self._min[index] = math.inf
+            self._max[index] = -math.inf
+        self._period_start = time.monotonic() if now is None else now
+
+    def statistic_id(self, key: str) -> str:
+        """Return the external statistic ID of a key."""
+        return f"{DOMAIN}:{slugify(self.name)}_{key}"
+
+    @staticmethod
+    def unit_class(description: SajModbusSensorEntityDescription) -> str | None:
+        """Return the unit class of the statistics of a key, None if not convertible."""
+        converter = UNIT_CONVERTERS.get(description.device_class)
+        if (
+            converter is None
+            or description.native_unit_of_measurement not in converter.VALID_UNITS
+        ):
+            return None
+        return converter.UNIT_CLASS
+
+    def async_import(self, hass: HomeAssistant, start: datetime) -> None:
+        """Import the period starting at start as one batch of hourly statistics.
+
+        The period is only reset once it is imported, so a failed import is
+        retried with the next period.
+        """
+        # Only load the recorder when the rollups are actually used.
+        from homeassistant.components.recorder import models
+        from homeassistant.components.recorder.models import (
+            StatisticData,
+            StatisticMetaData,
+        )
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        rollups = self.rollups()
+        for description in self.descriptions:
+            if description.key not in rollups:
+                continue
+            minimum, maximum, mean = rollups[description.key]
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{self.name} {description.name}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(description.key),
+                unit_of_measurement=description.native_unit_of_measurement,
+            )
+            # Home Assistant 2025.4 replaced has_mean by mean_type.
+            if "mean_type" in StatisticMetaData.__annotations__:
+                metadata["mean_type"] = models.StatisticMeanType.ARITHMETIC
+            # Home Assistant 2025.10 requires the unit class of the unit.
+            if "unit_class" in StatisticMetaData.__annotations__:
+                metadata["unit_class"] = self.unit_class(description)
+            async_add_external_statistics(
+                hass,
+                metadata,
+                [StatisticData(start=start, min=minimum, max=maximum, mean=mean)],
+            )
+        self.reset()
@@ -4,15 +4,20 @@ from __future__ import annotations
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorEntity
 import logging
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from abc import ABC, abstractmethod
 
 from homeassistant.const import CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    ATTR_MANUFACTURER,
+    FAULT_SENSOR_TYPES,
     TOTAL_SENSOR_TYPES,
     DAY_SENSOR_TYPES,
+    DERIVED_SENSOR_TYPES,
+    DIAGNOSTIC_SENSOR_TYPES,
     MONTH_SENSOR_TYPES,
     YEAR_SENSOR_TYPES,
     DOMAIN,
@@ -25,18 +30,18 @@ from .hub import SAJModbusHub
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up entry for hub."""
-    hub_name = entry.data[CONF_NAME]
-    hub = hass.data[DOMAIN][hub_name]["hub"]
-
-    device_data = hub.inverter_data
-    device_info = {
-        "identifiers": {(DOMAIN, hub_name)},
-        "name": hub_name,
-        "manufacturer": ATTR_MANUFACTURER,
-        "sw_version": device_data["dv"],
-        "hw_version": device_data["mcv"],
-        "serial_number": device_data["sn"],
-    }
+    entities = []
+    for hub in hass.data[DOMAIN][entry.data[CONF_NAME]]["hubs"]:
+        entities.extend(_async_hub_entities(hub))
+
+    async_add_entities(entities)
+    return True
+
+
+def _async_hub_entities(hub: SAJModbusHub) -> list[SajSensor]:
+    """Create the entities of the inverter polled by the hub."""
+    hub_name = hub.name
+    device_info = hub.device_info
 
     entities = []
     for sensor_description in SENSOR_TYPES.values():
@@ -47,6 +52,30 @@ async def async_setup_entry(hass, entry, async_add_entities):
             sensor_description,
         )
         entities.append(sensor)
+    for sensor_description in DERIVED_SENSOR_TYPES.values():
+        sensor = SajSensor(
+            hub_name,
+            hub,
+            device_info,
+            sensor_description,
+        )
+        entities.append(sensor)
+    for sensor_description in FAULT_SENSOR_TYPES.values():
+        sensor = SajFaultSensor(
+            hub_name,
+            hub,
+            device_info,
+            sensor_description,
+        )
+        entities.append(sensor)
+    for sensor_description in DIAGNOSTIC_SENSOR_TYPES.values():
+        sensor = SajDiagnosticSensor(
+            hub_name,
+            hub,
+            device_info,
+            sensor_description,
+        )
+        entities.append(sensor)
     for sensor_description in TOTAL_SENSOR_TYPES.values():
         sensor = SajTotalSensor(
             hub_name,
@@ -80,8 +109,11 @@ async def async_setup_entry(hass, entry, async_add_entities):
         )
         entities.append(sensor)
 
-    async_add_entities(entities)
-    return True
+    return [
+        entity
+        for entity in entities
+        if entity.entity_description.key not in hub.absent_keys
+    ]
 
 
 class SajSensor(CoordinatorEntity, SensorEntity):
@@ -95,63 +127,77 @@ class SajSensor(CoordinatorEntity, SensorEntity):
         description: SajModbusSensorEntityDescription,
     ):
         """Initialize the sensor."""
-        self._platform_name = platform_name
+        self._attr_name = f"{platform_name} {description.name}"
+        self._attr_unique_id = f"{platform_name}_{description.key}"
         self._attr_device_info = device_info
         self.entity_description: SajModbusSensorEntityDescription = description
+        if hub.rollup is not None and description.key in hub.rollup.keys:
+            """Statistics are imported by the hub, do not compile them from states"""
+            self._attr_state_class = None
 
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
-    @property
-    def device_info(self):
-        return self._attr_device_info
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state."""
+        await super().async_added_to_hass()
+        self._update_from_data(self.coordinator.data)
 
-    @property
-    def name(self):
-        """Return the name."""
-        return f"{self._platform_name} {self.entity_description.name}"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the state once per coordinator update."""
+        self._update_from_data(self.coordinator.data)
+        super()._handle_coordinator_update()
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return unique ID for sensor."""
-        return f"{self._platform_name}_{self.entity_description.key}"
+    def _update_from_data(self, data: dict) -> None:
+        """Update the state attributes from the coordinator data."""
+        self._attr_native_value = data.get(self.entity_description.key)
 
-    @property
-    def native_value(self):
-        """Return the native value of the sensor."""
-        return self.coordinator.data.get(self.entity_description.key, None)
 
+class SajFaultSensor(SajSensor):
+    """Representation of a SAJ Modbus fault sensor."""
 
-class SajTotalSensor(SajSensor):
-    """Representation of a SAJ Modbus total sensor."""
+    async def async_added_to_hass(self) -> None:
+        """Also listen for changes of the active fault codes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update, "faultcodes")
+        )
 
-    def __init__(
-        self,
-        platform_name: str,
-        hub: SAJModbusHub,
-        device_info,
-        description: SajModbusSensorEntityDescription,
-    ):
-        """Initialize the sensor."""
-        self._last_value = None
+    def _update_from_data(self, data: dict) -> None:
+        """Update the fault message and the active fault codes."""
+        super()._update_from_data(data)
+        self._attr_extra_state_attributes = {"fault_codes": data.get("faultcodes", [])}
 
-        super().__init__(platform_name=platform_name, hub=hub,
-                         device_info=device_info, description=description)
+
+class SajDiagnosticSensor(SajSensor):
+    """Representation of a SAJ Modbus poll statistics sensor."""
 
     @property
-    def native_value(self):
-        """Return the value of the sensor."""
-        # Return last known value if current value is missing.
-        key = self.entity_description.key
-        value = None
+    def available(self) -> bool:
+        """Return True, the statistics are updated while polls fail."""
+        return True
+
+    def _update_from_data(self, data: dict) -> None:
+        """Update the statistic and its percentiles in ms."""
+        super()._update_from_data(data)
+        stats = self.coordinator.poll_stats.get(self.entity_description.key)
+        if stats is None or not len(stats):
+            self._attr_extra_state_attributes = None
+            return
+        self._attr_extra_state_attributes = {
+            name: round(value * 1000, 1) for name, value in stats.summary().items()
+        }
 
-        if self.coordinator.data.get(key):
-            value = self.coordinator.data.get(key)
 
-        if value is not None:
-            self._last_value = value
-            return value
+class SajTotalSensor(SajSensor):
+    """Representation of a SAJ Modbus total sensor."""
 
-        return self._last_value
+    def _update_from_data(self, data: dict) -> None:
+        """Update the value of the sensor."""
+        # Keep last known value if current value is missing.
+        value = data.get(self.entity_description.key)
+        if value:
+            self._attr_native_value = value
 
 
 class SajDatetimeSensor(SajSensor, ABC):
@@ -165,36 +211,75 @@ class SajDatetimeSensor(SajSensor, ABC):
         description: SajModbusSensorEntityDescription,
     ):
         """Initialize the sensor."""
-        self._last_value = None
-        self._last_datetime = None
+        self._unsub_reset: CALLBACK_TYPE | None = None
+        self._next_period_start: date | None = None
+        # Total of the ended period and the start of the new one, until the
+        # inverter counts from the start of the new period as well.
+        self._ended_total: float | None = None
+        self._period_start: date | None = None
 
         super().__init__(platform_name=platform_name, hub=hub,
                          device_info=device_info, description=description)
 
     @abstractmethod
-    def _same(self, dt1: datetime, dt2: datetime) -> bool:
-        pass
-
-    @property
-    def native_value(self):
-        """Return the value of the sensor."""
-        # Return last known value if current value is missing.
-        # Reset to 0 if current value is missing and current datetime is not same as last.
-        now = datetime.now()
-        key = self.entity_description.key
-        value = None
-
-        if self.coordinator.data.get(key):
-            value = self.coordinator.data.get(key)
-
-        if value is not None:
-            self._last_datetime = now
-            self._last_value = value
-            return value
-        elif not self._same(self._last_datetime, now):
-            self._last_value = 0
+    def _next_period(self, today: date) -> date:
+        """Return the first day of the next period."""
+
+    async def async_added_to_hass(self) -> None:
+        """Schedule the reset at the end of the period."""
+        await super().async_added_to_hass()
+        self._async_schedule_reset()
+        self.async_on_remove(self._async_cancel_reset)
+
+    @callback
+    def _async_schedule_reset(self) -> None:
+        """Schedule the reset at the start of the next period."""
+        # Periods follow the inverter clock when configured, so the inverter
+        # and the sensor start counting from 0 at the same moment.
+        offset = self.coordinator.period_offset
+        today = (dt_util.now() + offset).date()
+        self._next_period_start = self._next_period(today)
+        self._unsub_reset = async_track_point_in_time(
+            self.hass,
+            self._async_reset,
+            dt_util.start_of_local_day(self._next_period_start) - offset,
+        )
 
-        return self._last_value
+    @callback
+    def _async_cancel_reset(self) -> None:
+        """Cancel the scheduled reset."""
+        if self._unsub_reset is not None:
+            self._unsub_reset()
+            self._unsub_reset = None
+
+    @callback
+    def _async_reset(self, now: datetime) -> None:
+        """Reset the value at the start of a period."""
+        # The inverter keeps reporting the total of the ended period until
+        # its own counter is reset, e.g. while its clock runs late.
+        if isinstance(self._attr_native_value, (int, float)) and self._attr_native_value > 0:
+            self._ended_total = self._attr_native_value
+            self._period_start = self._next_period_start
+        self._attr_native_value = 0
+        self.async_write_ha_state()
+        self._async_schedule_reset()
+
+    def _inverter_reset(self, value, inverter_time: datetime | None) -> bool:
+        """Return True once the inverter counts from the start of the new period."""
+        if isinstance(inverter_time, datetime) and inverter_time.date() >= self._period_start:
+            return True
+        return isinstance(value, (int, float)) and value < self._ended_total
+
+    def _update_from_data(self, data: dict) -> None:
+        """Update the value of the sensor."""
+        value = data.get(self.entity_description.key)
+        if self._ended_total is not None:
+            if not self._inverter_reset(value, data.get("time")):
+                return
+            self._ended_total = None
+        # Keep last known value if current value is missing.
+        if value or self._attr_native_value is None:
+            self._attr_native_value = value
 
 
 class SajDaySensor(SajDatetimeSensor):
@@ -211,8 +296,8 @@ class SajDaySensor(SajDatetimeSensor):
         super().__init__(platform_name=platform_name, hub=hub,
                          device_info=device_info, description=description)
 
-    def _same(self, dt1: datetime, dt2: datetime) -> bool:
-        return dt1.date() == dt2.date()
+    def _next_period(self, today: date) -> date:
+        return today + timedelta(days=1)
 
 
 class SajMonthSensor(SajDatetimeSensor):
@@ -229,8 +314,8 @@ class SajMonthSensor(SajDatetimeSensor):
         super().__init__(platform_name=platform_name, hub=hub,
                          device_info=device_info, description=description)
 
-    def _same(self, dt1: datetime, dt2: datetime) -> bool:
-        return dt1.month == dt2.month and dt1.year == dt2.year
+    def _next_period(self, today: date) -> date:
+        return date(today.year + today.month // 12, today.month % 12 + 1, 1)
 
 
 class SajYearSensor(SajDatetimeSensor):
@@ -247,5 +332,5 @@ class SajYearSensor(SajDatetimeSensor):
         super().__init__(platform_name=platform_name, hub=hub,
                          device_info=device_info, description=description)
 
-    def _same(self, dt1: datetime, dt2: datetime) -> bool:
-        return dt1.year == dt2.year
+    def _next_period(self, today: date) -> date:
+        return date(today.year + 1, 1, 1)
@@ -0,0 +1,61 @@
+"""Rolling poll statistics for SAJ R6 Inverter Modbus."""
+
+from bisect import bisect_left
+from collections import deque
+
+
+class RollingStats:
+    """Keep the last samples of a metric and report percentiles over them."""
+
+    def __init__(self, size: int):
+        """Initialize the window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest one when the window is full."""
+        self._samples.append(value)
+
+    def mean(self) -> float | None:
+        """Return the mean of the window."""
+        if not self._samples:
+            return None
+        return sum(self._samples) / len(self._samples)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile of the window."""
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+    def summary(self) -> dict[str, float | None]:
+        """Return the usual percentiles of the window."""
+        return {
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.percentile(100),
+        }
+
+
+class LatencyHistogram:
+    """Count latencies in fixed buckets."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        """Initialize the buckets, bounds are upper limits in seconds."""
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+
+    def add(self, value: float) -> None:
+        """Count a latency."""
+        self._counts[bisect_left(self._bounds, value)] += 1
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the bucket counts keyed by upper limit in ms."""
+        labels = [f"<={bound * 1000:g}ms" for bound in self._bounds]
+        labels.append(f">{self._bounds[-1] * 1000:g}ms")
+        return dict(zip(labels, self._counts))
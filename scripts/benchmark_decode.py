@@ -0,0 +1,135 @@
+"""Decode time per register frame, against git revisions.
+
+Decodes realtime (0x6000) and inverter info (0x8F00) frames of a simulated
+inverter with the hand-written parsing of a base revision, the decoder of
+the revision that introduced the declarative register map and the decoder
+of this tree:
+
+    python scripts/benchmark_decode.py --base <revision> --register-map <revision>
+
+Reports the best of --repeat runs in microseconds per frame, without the
+Modbus read. Then reports the throughput of decoding the realtime frames
+one by one and all at once with decode_frames, through struct and, when it
+is installed, NumPy.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import importlib
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from benchmark_hub import load_revision
+from saj_simulator import SimulatedInverter
+
+from custom_components.saj_r6_modbus import decoder, hub as current
+
+
+def frames(count: int) -> tuple[list[list[int]], list[int]]:
+    """Return realtime frames over a day and the inverter info frame."""
+    inverter = SimulatedInverter(seed=1)
+    start = datetime(2026, 6, 21)
+    realtime = []
+    for index in range(count):
+        inverter.now = start + timedelta(seconds=index * 86400 // count)
+        realtime.append(inverter.realtime_registers())
+    return realtime, inverter.inverter_registers()
+
+
+def hand_written(revision: str) -> tuple[Callable, Callable]:
+    """Return the realtime and inverter info parsing of the base revision."""
+    base = importlib.import_module(f"{load_revision(revision).__name__}.hub")
+    # The parsing is part of the read methods, serve them the frame instead.
+    hub = object.__new__(base.SAJModbusHub)
+    response = SimpleNamespace(registers=None, isError=lambda: False)
+    hub._read_holding_registers = lambda unit, address, count: response
+
+    def decode(method: Callable) -> Callable:
+        def decode_frame(registers: list[int]) -> dict:
+            response.registers = registers
+            return method()
+
+        return decode_frame
+
+    return decode(hub.read_modbus_r6_realtime_data), decode(hub.read_modbus_inverter_data)
+
+
+def decoders(revision: str) -> tuple[Callable, Callable]:
+    """Return the block decoders of a revision with the declarative register map."""
+    hub = importlib.import_module(f"{load_revision(revision).__name__}.hub")
+    return hub.REALTIME_DATA_DECODER.decode, hub.INVERTER_DATA_DECODER.decode
+
+
+def per_frame(decode: Callable, registers: list[list[int]], repeat: int) -> float:
+    """Return the best time per frame in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for frame in registers:
+            decode(frame)
+        best = min(best, (time.perf_counter() - start) / len(registers))
+    return best
+
+
+def frames_per_second(decode: Callable, registers: list[list[int]], repeat: int) -> float:
+    """Return the best throughput of decoding all frames in one call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(registers)
+        best = min(best, time.perf_counter() - start)
+    return len(registers) / best
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", required=True,
+                        help="git revision with the hand-written parsing")
+    parser.add_argument("--register-map", required=True,
+                        help="git revision that introduced the declarative register map")
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    realtime, inverter_info = frames(args.frames)
+    implementations = {
+        f"{args.base} hand-written": hand_written(args.base),
+        f"{args.register_map} register map": decoders(args.register_map),
+        "current": (current.REALTIME_DATA_DECODER.decode, current.INVERTER_DATA_DECODER.decode),
+    }
+    print(f"{'':28} {'realtime':>10} {'inverter info':>14}  us per frame")
+    for label, (decode_realtime, decode_inverter_info) in implementations.items():
+        print(
+            f"{label:28} "
+            f"{per_frame(decode_realtime, realtime, args.repeat) * 1e6:10.1f} "
+            f"{per_frame(decode_inverter_info, [inverter_info] * args.frames, args.repeat) * 1e6:14.1f}"
+        )
+
+    realtime_decoder = current.REALTIME_DATA_DECODER
+    throughput = {
+        "decode per frame": frames_per_second(
+            lambda registers: [realtime_decoder.decode(frame) for frame in registers],
+            realtime,
+            args.repeat,
+        ),
+    }
+    with patch.object(decoder, "np", None):
+        throughput["decode_frames struct"] = frames_per_second(
+            realtime_decoder.decode_frames, realtime, args.repeat)
+    if decoder.np is not None:
+        throughput["decode_frames NumPy"] = frames_per_second(
+            realtime_decoder.decode_frames, realtime, args.repeat)
+    print(f"\n{args.frames} realtime frames, frames/s")
+    for label, frames_per_s in throughput.items():
+        print(f"{label:28} {frames_per_s:10.0f}")
+    if decoder.np is None:
+        print(f"{'decode_frames NumPy':28} NumPy is not installed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""State write cost per sensor entity, against git revisions.
+
+Creates the sensor entities of one inverter with the sensor platform of a
+base revision, of the revision that precomputed the entity attributes and
+of this tree, feeds them realtime data of a simulated inverter and times
+the coordinator update of every entity, i.e. computing its state and
+writing it to the state machine:
+
+    python scripts/benchmark_entities.py --base <revision> --after <revision>
+
+Reports the best of --repeat runs in microseconds per entity update.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import importlib
+import logging
+import time
+from types import ModuleType
+
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.helpers import entity as entity_helper
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from benchmark_hub import home_assistant, load_revision
+from saj_simulator import SimulatedInverter
+
+import custom_components.saj_r6_modbus as current
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def realtime_data(package: ModuleType, updates: int) -> list[dict]:
+    """Return the decoded realtime data of successive polls."""
+    hub = importlib.import_module(f"{package.__name__}.hub")
+    # Every PV input in use, the sensors of absent inputs would be unavailable.
+    inverter = SimulatedInverter(pv_inputs=6, seed=1)
+    # Midday, the day sensors of the base revision fail on a first total of 0.
+    start = datetime(2026, 6, 21, 12)
+    polls = []
+    for index in range(updates):
+        inverter.now = start + timedelta(minutes=index)
+        polls.append(hub.REALTIME_DATA_DECODER.decode(inverter.realtime_registers()))
+    return polls
+
+
+async def benchmark(package: ModuleType, updates: int, repeat: int) -> tuple[int, float]:
+    """Return the number of entities and the best time per entity update."""
+    hub_module = importlib.import_module(f"{package.__name__}.hub")
+    connection = importlib.import_module(f"{package.__name__}.connection")
+    sensor = importlib.import_module(f"{package.__name__}.sensor")
+    polls = realtime_data(package, updates)
+
+    async with home_assistant() as hass:
+        entity_helper.async_setup(hass)
+        hub = hub_module.SAJModbusHub(
+            hass, "SAJ", connection.SAJModbusConnection("127.0.0.1", 502), 1, 60)
+        hub.inverter_data = {"dv": "1.000", "mcv": "1.000", "sn": "R6S2153J2301E00001"}
+        hub.data = polls[0]
+        platform = EntityPlatform(
+            hass=hass,
+            logger=_LOGGER,
+            domain=SENSOR_DOMAIN,
+            platform_name=package.DOMAIN,
+            platform=None,
+            scan_interval=timedelta(seconds=60),
+            entity_namespace=None,
+        )
+        entities = sensor._async_hub_entities(hub)
+        for entity in entities:
+            # Time every sensor, including the ones disabled by default.
+            entity._attr_entity_registry_enabled_default = True
+        await platform.async_add_entities(entities)
+
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for data in polls:
+                hub.data = data
+                for entity in entities:
+                    entity._handle_coordinator_update()
+            best = min(best, (time.perf_counter() - start) / (len(polls) * len(entities)))
+        hub.close()
+    return len(entities), best
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", required=True,
+                        help="git revision to compare with, before the precomputed attributes")
+    parser.add_argument("--after", required=True,
+                        help="git revision that precomputed the attributes")
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, package in (
+        (args.base, load_revision(args.base)),
+        (args.after, load_revision(args.after)),
+        ("current", current),
+    ):
+        entities, per_entity = asyncio.run(benchmark(package, args.updates, args.repeat))
+        print(f"{label:10} {entities} entities  {per_entity * 1e6:6.1f} us per entity update")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""End-to-end poll benchmark of SAJModbusHub against simulated inverters.
+
+Starts the simulator in a subprocess, so its CPU time is not counted, and
+polls N inverters from one Home Assistant instance:
+
+    python scripts/benchmark_hub.py --inverters 1 8 32 --polls 50
+
+Reports per inverter count the poll latency, decode time and listener
+dispatch time percentiles in ms, and the CPU time per poll.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import atexit
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import importlib
+from pathlib import Path
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from types import ModuleType
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr, entity_registry as er  # noqa: E402
+
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection  # noqa: E402
+from custom_components.saj_r6_modbus.hub import (  # noqa: E402
+    REALTIME_DATA_DECODER,
+    SAJModbusHub,
+)
+from custom_components.saj_r6_modbus.stats import RollingStats  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+SIMULATOR = Path(__file__).with_name("saj_simulator.py")
+INTEGRATION = "custom_components/saj_r6_modbus"
+
+
+def load_revision(revision: str) -> ModuleType:
+    """Import the integration as of a git revision, to compare against it."""
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", "-C", str(ROOT), *args], check=True, capture_output=True, text=True
+        ).stdout
+
+    revision = git("rev-parse", "--short", revision).strip()
+    directory = Path(tempfile.mkdtemp())
+    atexit.register(shutil.rmtree, directory, True)
+    package = directory / f"saj_r6_modbus_{revision}"
+    package.mkdir()
+    for path in git("ls-tree", "--name-only", revision, f"{INTEGRATION}/").split():
+        if path.endswith(".py"):
+            (package / Path(path).name).write_text(git("show", f"{revision}:{path}"))
+    sys.path.insert(0, str(directory))
+    return importlib.import_module(package.name)
+
+
+def free_port() -> int:
+    """Return a TCP port nobody listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def simulator(device_ids: list[int], *args: str) -> AsyncIterator[int]:
+    """Run the simulator in a subprocess, yield its port."""
+    port = free_port()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(SIMULATOR),
+        "--port",
+        str(port),
+        "--device-ids",
+        *map(str, device_ids),
+        *args,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(100):
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                await asyncio.sleep(0.1)
+                continue
+            writer.close()
+            break
+        yield port
+    finally:
+        process.terminate()
+        await process.wait()
+
+
+@asynccontextmanager
+async def home_assistant() -> AsyncIterator[HomeAssistant]:
+    """Yield a bare Home Assistant instance with the registries the hub uses."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        try:
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+
+def create_hubs(
+    hass: HomeAssistant, port: int, device_ids: list[int], shared: bool
+) -> list[SAJModbusHub]:
+    """Return one hub per device ID, with a listener per realtime field."""
+    connection = SAJModbusConnection("127.0.0.1", port)
+    hubs = []
+    for device_id in device_ids:
+        if not shared and hubs:
+            connection = SAJModbusConnection("127.0.0.1", port)
+        hub = SAJModbusHub(hass, f"SAJ {device_id}", connection, device_id, 60)
+        for description in REALTIME_DATA_DECODER.descriptions:
+            # Stands in for the entity state write of the field.
+            hub.async_add_listener(
+                lambda hub=hub, key=description.key: hub.data.get(key), description.key
+            )
+        hubs.append(hub)
+    return hubs
+
+
+def milliseconds(stats: RollingStats) -> str:
+    """Return the percentiles of a metric in ms."""
+    return " ".join(
+        f"{name}={value * 1000:7.3f}" for name, value in stats.summary().items()
+    )
+
+
+async def benchmark(inverters: int, polls: int, shared: bool, latency: float) -> None:
+    """Poll the inverters and print the statistics."""
+    device_ids = list(range(1, inverters + 1))
+    async with simulator(device_ids, "--latency", str(latency)) as port, home_assistant() as hass:
+        hubs = create_hubs(hass, port, device_ids, shared)
+        size = polls * inverters
+        poll = RollingStats(size)
+        for hub in hubs:
+            hub.poll_stats = {key: RollingStats(size) for key in hub.poll_stats}
+            # Warm up the connection and the inverter info cache.
+            await hub.async_refresh()
+        for hub in hubs:
+            for stats in hub.poll_stats.values():
+                stats._samples.clear()
+
+        cpu = time.process_time()
+        for _ in range(polls):
+            for hub in hubs:
+                # Every poll reads all poll groups.
+                hub._last_poll.clear()
+
+            async def timed_refresh(hub: SAJModbusHub) -> None:
+                start = time.perf_counter()
+                await hub.async_refresh()
+                poll.add(time.perf_counter() - start)
+
+            await asyncio.gather(*(timed_refresh(hub) for hub in hubs))
+        cpu = (time.process_time() - cpu) / size
+
+        decode = RollingStats(size)
+        dispatch = RollingStats(size)
+        for hub in hubs:
+            for value in hub.poll_stats["decodetime"]._samples:
+                decode.add(value)
+            for value in hub.poll_stats["dispatchtime"]._samples:
+                dispatch.add(value)
+            hub.close()
+
+        print(f"{inverters} inverter(s), {polls} polls, {'shared' if shared else 'own'} connection")
+        print(f"  poll      {milliseconds(poll)}")
+        print(f"  decode    {milliseconds(decode)}")
+        print(f"  dispatch  {milliseconds(dispatch)}")
+        print(f"  cpu/poll  {cpu * 1000:7.3f} ms")
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inverters", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="simulated gateway latency per request in seconds")
+    parser.add_argument("--shared", action="store_true",
+                        help="poll all inverters over one connection")
+    args = parser.parse_args()
+    for inverters in args.inverters:
+        asyncio.run(benchmark(inverters, args.polls, args.shared, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Database rows and write time per inverter-day with and without rollups.
+
+Compares three ways to keep the history of the high rate sensors in
+ROLLUP_DESCRIPTIONS for one inverter-day:
+
+- states: the recorder stores every state and compiles 5 minute and hourly
+  statistics from them (rollups off)
+- rollups: the hub imports hourly statistics, the sensors are excluded from
+  the recorder as the README suggests
+- rollups+states: the hub imports hourly statistics, the states are still
+  recorded
+
+    python scripts/benchmark_rollup.py --scan-interval 60
+
+Every poll is counted as a state change, so the state rows are an upper
+bound. The rows are written with the recorder schema to a SQLite database,
+committing when the recorder would, which needs the recorder requirements
+(SQLAlchemy); without them only the rows and the rollup cost are reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from importlib.util import find_spec
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from saj_simulator import SimulatedInverter  # noqa: E402
+
+from custom_components.saj_r6_modbus.const import DEFAULT_SCAN_INTERVAL  # noqa: E402
+from custom_components.saj_r6_modbus.hub import (  # noqa: E402
+    REALTIME_DATA_DECODER,
+    ROLLUP_DESCRIPTIONS,
+)
+from custom_components.saj_r6_modbus.rollup import SajStatisticsRollup  # noqa: E402
+
+DAY = 86400
+SHORT_TERM_PERIOD = 300
+HOUR = 3600
+# Seconds between the commits of the recorder, its default commit_interval.
+COMMIT_INTERVAL = 5
+MODES = ("states", "rollups", "rollups+states")
+
+
+def day_of_data(scan_interval: int) -> list[tuple[float, dict]]:
+    """Return the decoded realtime data of every poll of one day."""
+    start = datetime(2026, 6, 21)
+    inverter = SimulatedInverter(seed=1)
+    polls = []
+    for offset in range(0, DAY, scan_interval):
+        inverter.now = start + timedelta(seconds=offset)
+        polls.append((offset, REALTIME_DATA_DECODER.decode(inverter.realtime_registers())))
+    return polls
+
+
+def rollup_cost(polls: list[tuple[float, dict]]) -> float:
+    """Return the time rollup.add takes per poll in seconds."""
+    rollup = SajStatisticsRollup("SAJ", ROLLUP_DESCRIPTIONS)
+    hour = 0
+    start = time.perf_counter()
+    for offset, data in polls:
+        if offset // HOUR != hour:
+            hour = offset // HOUR
+            rollup.rollups()
+            rollup.reset(offset)
+        rollup.add(data, offset)
+    return (time.perf_counter() - start) / len(polls)
+
+
+def rows(mode: str, polls: int) -> dict[str, int]:
+    """Return the rows per table the mode writes in one inverter-day."""
+    keys = len(ROLLUP_DESCRIPTIONS)
+    return {
+        "states": keys * polls if mode != "rollups" else 0,
+        "statistics_short_term": keys * DAY // SHORT_TERM_PERIOD if mode == "states" else 0,
+        "statistics": keys * DAY // HOUR,
+    }
+
+
+def write_time(mode: str, scan_interval: int) -> float:
+    """Write the rows of the mode to a SQLite database, return the seconds."""
+    # Imported here, the recorder requirements are optional for this script.
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        States,
+        StatesMeta,
+        Statistics,
+        StatisticsMeta,
+        StatisticsShortTerm,
+    )
+
+    start_ts = datetime(2026, 6, 21, tzinfo=timezone.utc).timestamp()
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/home-assistant_v2.db")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.saj_{description.key}")
+                for description in ROLLUP_DESCRIPTIONS
+            ]
+            statistics_meta = [
+                StatisticsMeta(
+                    statistic_id=f"sensor.saj_{description.key}",
+                    source="recorder",
+                    unit_of_measurement=description.native_unit_of_measurement,
+                    has_mean=True,
+                    has_sum=False,
+                    name=None,
+                )
+                for description in ROLLUP_DESCRIPTIONS
+            ]
+            session.add_all(states_meta + statistics_meta)
+            session.commit()
+
+            started = time.perf_counter()
+            last_commit = -COMMIT_INTERVAL
+            for offset in range(0, DAY, scan_interval):
+                if mode != "rollups":
+                    session.add_all(
+                        States(
+                            metadata_id=meta.metadata_id,
+                            state=str(offset),
+                            last_updated_ts=start_ts + offset,
+                            last_changed_ts=start_ts + offset,
+                        )
+                        for meta in states_meta
+                    )
+                periods = [(HOUR, Statistics)]
+                if mode == "states":
+                    periods.append((SHORT_TERM_PERIOD, StatisticsShortTerm))
+                for period, table in periods:
+                    end = (offset + scan_interval) // period * period
+                    if end <= offset:
+                        continue
+                    # The period that ended before the next poll is compiled.
+                    session.add_all(
+                        table(
+                            metadata_id=meta.id,
+                            start_ts=start_ts + end - period,
+                            mean=1.0,
+                            min=0.0,
+                            max=2.0,
+                        )
+                        for meta in statistics_meta
+                    )
+                if offset - last_commit >= COMMIT_INTERVAL:
+                    session.commit()
+                    last_commit = offset
+            session.commit()
+            elapsed = time.perf_counter() - started
+        engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scan-interval", type=int, default=DEFAULT_SCAN_INTERVAL)
+    args = parser.parse_args()
+
+    polls = day_of_data(args.scan_interval)
+    print(
+        f"{len(ROLLUP_DESCRIPTIONS)} rollup sensors, {len(polls)} polls per day, "
+        f"rollup.add {rollup_cost(polls) * 1e6:.1f} us per poll"
+    )
+    recorder = find_spec("sqlalchemy") is not None
+    for mode in MODES:
+        counts = rows(mode, len(polls))
+        line = f"  {mode:15} rows {sum(counts.values()):7d} " + " ".join(
+            f"{table}={count}" for table, count in counts.items()
+        )
+        if recorder:
+            line += f"  write {write_time(mode, args.scan_interval) * 1000:8.1f} ms"
+        print(line)
+    if not recorder:
+        print("  install the recorder requirements (SQLAlchemy) to measure the write time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Config entry setup time with a sleeping inverter, against a git revision.
+
+Sets up one config entry of the integration as of a base revision and of
+this tree, each in a fresh Home Assistant instance in its own process,
+against a gateway that accepts connections but never answers, like a
+gateway whose inverter sleeps:
+
+    python scripts/benchmark_startup.py --base <revision>
+
+Reports how long setting up the entry takes, the state it ends in, and how
+long importing the integration takes and whether that runs in the
+executor, off the event loop.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import json
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+INTEGRATION = "custom_components/saj_r6_modbus"
+DOMAIN = "saj_r6_modbus"
+
+
+@asynccontextmanager
+async def silent_gateway() -> AsyncIterator[int]:
+    """Accept connections on a free port and never answer, yield the port."""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    async with server:
+        yield server.sockets[0].getsockname()[1]
+
+
+def config_dir(revision: str | None) -> Path:
+    """Return a config directory with the integration of a revision, None for this tree."""
+    directory = Path(tempfile.mkdtemp())
+    target = directory / INTEGRATION
+    if revision is None:
+        shutil.copytree(ROOT / INTEGRATION, target, ignore=shutil.ignore_patterns("__pycache__"))
+        return directory
+    archive = subprocess.run(
+        ["git", "-C", str(ROOT), "archive", revision, INTEGRATION],
+        check=True,
+        capture_output=True,
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", str(directory)], input=archive, check=True)
+    return directory
+
+
+async def setup_entry(directory: str, port: int) -> dict:
+    """Set up one config entry in a bare Home Assistant, return the timings."""
+    sys.path.insert(0, directory)
+    # Importing the loader first is a circular import.
+    from homeassistant.core import HomeAssistant
+    from homeassistant import loader
+    from homeassistant.config_entries import ConfigEntries, ConfigEntry
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity as entity_helper,
+        entity_registry as er,
+        translation,
+    )
+
+    hass = HomeAssistant(directory)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    translation.async_setup(hass)
+    entity_helper.async_setup(hass)
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+
+    integration = await loader.async_get_integration(hass, DOMAIN)
+    start = time.perf_counter()
+    await integration.async_get_component()
+    imported = time.perf_counter() - start
+
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="SAJ",
+        data={
+            "name": "SAJ",
+            "host": "127.0.0.1",
+            "port": port,
+            "scan_interval": 60,
+            "device_ids": [1],
+        },
+        source="user",
+    )
+    start = time.perf_counter()
+    await hass.config_entries.async_add(entry)
+    setup = time.perf_counter() - start
+    state = entry.state.value
+    await hass.async_stop(force=True)
+    return {
+        "setup": setup,
+        "state": state,
+        "import": imported,
+        "import_executor": integration.import_executor,
+    }
+
+
+async def benchmark(label: str, revision: str | None) -> None:
+    """Set up the entry of a revision in a subprocess and print the timings."""
+    directory = config_dir(revision)
+    try:
+        async with silent_gateway() as port:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                __file__,
+                "--setup",
+                str(directory),
+                str(port),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await process.communicate()
+    finally:
+        shutil.rmtree(directory, True)
+    result = json.loads(stdout.splitlines()[-1])
+    where = "executor" if result["import_executor"] else "event loop"
+    print(
+        f"{label:10} setup {result['setup']:8.3f} s ({result['state']}), "
+        f"import {result['import']:6.3f} s in the {where}"
+    )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    if sys.argv[1:2] == ["--setup"]:
+        print(json.dumps(asyncio.run(setup_entry(sys.argv[2], int(sys.argv[3])))))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", required=True,
+                        help="git revision to compare with, before the background first poll")
+    args = parser.parse_args()
+    for label, revision in ((args.base, args.base), ("current", None)):
+        asyncio.run(benchmark(label, revision))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Event loop latency and executor use of polling, against a git revision.
+
+Polls N simulated inverters with the hub of this tree and with the hub of a
+base revision, e.g. the one before the async Modbus client, which read
+through the synchronous pymodbus client in executor jobs:
+
+    python scripts/benchmark_transport.py --base <revision> --inverters 1 8 32
+
+A ticker task sleeps 10 ms at a time while the inverters are polled; how
+late it wakes up is the event loop latency. Every job submitted to the
+default executor is counted, with the most jobs running at once and the
+number of executor threads that ran them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import importlib
+import inspect
+import threading
+import time
+from types import ModuleType
+
+from homeassistant.core import HomeAssistant
+
+from benchmark_hub import home_assistant, load_revision, milliseconds, simulator
+
+import custom_components.saj_r6_modbus as current
+from custom_components.saj_r6_modbus.stats import RollingStats
+
+TICK = 0.01
+
+
+def create_hubs(
+    package: ModuleType, hass: HomeAssistant, port: int, device_ids: list[int]
+) -> list:
+    """Return one hub per device ID, each with its own connection."""
+    hub = importlib.import_module(f"{package.__name__}.hub")
+    if "connection" not in inspect.signature(hub.SAJModbusHub).parameters:
+        # One config entry per inverter, these hubs always read device ID 1.
+        return [
+            hub.SAJModbusHub(hass, f"SAJ {device_id}", "127.0.0.1", port, 60)
+            for device_id in device_ids
+        ]
+    connection = importlib.import_module(f"{package.__name__}.connection")
+    return [
+        hub.SAJModbusHub(
+            hass,
+            f"SAJ {device_id}",
+            connection.SAJModbusConnection("127.0.0.1", port),
+            device_id,
+            60,
+        )
+        for device_id in device_ids
+    ]
+
+
+class ExecutorJobs:
+    """Count the jobs the event loop submits to its default executor."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Wrap run_in_executor of the loop."""
+        self.submitted = 0
+        self.running = 0
+        self.peak = 0
+        self.threads: set[int] = set()
+        self._lock = threading.Lock()
+        self._run_in_executor = loop.run_in_executor
+        loop.run_in_executor = self._submit
+
+    def reset(self) -> None:
+        """Start counting from 0."""
+        self.submitted = self.peak = 0
+        self.threads.clear()
+
+    def _submit(self, executor, func: Callable, *args):
+        self.submitted += 1
+
+        def job():
+            with self._lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            self.threads.add(threading.get_ident())
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        return self._run_in_executor(executor, job)
+
+
+async def measure(hubs: list, polls: int) -> tuple[RollingStats, RollingStats]:
+    """Poll all hubs polls times, return the poll times and the loop lag."""
+    lag = RollingStats(100000)
+    poll = RollingStats(polls * len(hubs))
+    running = True
+
+    async def ticker() -> None:
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lag.add(time.perf_counter() - start - TICK)
+
+    async def timed_refresh(hub) -> None:
+        start = time.perf_counter()
+        await hub.async_refresh()
+        poll.add(time.perf_counter() - start)
+
+    task = asyncio.create_task(ticker())
+    for _ in range(polls):
+        for hub in hubs:
+            if hasattr(hub, "_last_poll"):
+                # Every poll reads all poll groups.
+                hub._last_poll.clear()
+        await asyncio.gather(*(timed_refresh(hub) for hub in hubs))
+    running = False
+    await task
+    return poll, lag
+
+
+async def benchmark(
+    label: str,
+    package: ModuleType,
+    inverters: int,
+    polls: int,
+    latency: float,
+) -> None:
+    """Poll the inverters with the hubs of package and print the statistics."""
+    jobs = ExecutorJobs(asyncio.get_running_loop())
+    device_ids = list(range(1, inverters + 1))
+    async with simulator(device_ids, "--latency", str(latency)) as port, home_assistant() as hass:
+        hubs = create_hubs(package, hass, port, device_ids)
+        # Warm up the connections and the executor.
+        await asyncio.gather(*(hub.async_refresh() for hub in hubs))
+        jobs.reset()
+        poll, lag = await measure(hubs, polls)
+        for hub in hubs:
+            hub.close()
+
+    print(
+        f"{label:8} {inverters:2} inverter(s), {jobs.submitted / (polls * inverters):.1f} "
+        f"executor jobs per poll, {jobs.peak} at once on {len(jobs.threads)} thread(s)"
+    )
+    print(f"  poll      {milliseconds(poll)}")
+    print(f"  loop lag  {milliseconds(lag)}")
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", required=True, help="git revision to compare with")
+    parser.add_argument("--inverters", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="simulated gateway latency per request in seconds")
+    args = parser.parse_args()
+
+    base = load_revision(args.base)
+    for inverters in args.inverters:
+        for label, package in ((args.base, base), ("current", current)):
+            asyncio.run(benchmark(label, package, inverters, args.polls, args.latency))
+
+
+if __name__ == "__main__":
+    main()
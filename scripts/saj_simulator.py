@@ -0,0 +1,382 @@
+"""Modbus TCP simulator of SAJ R6 inverters, for tests and benchmarks.
+
+Serves the realtime (0x6000) and inverter info (0x8F00) holding register
+blocks of one or more inverters behind a simulated Modbus TCP gateway. The
+values follow a clear-sky day; unpopulated PV inputs and strings read as the
+0xFFFF sentinel. Gateway faults can be injected: latency, dropped
+connections, short reads, a maximum PDU size, busy replies, illegal
+addresses and a sleeping inverter.
+
+Run it standalone and point the integration at it:
+
+    python scripts/saj_simulator.py --port 5020 --device-ids 1 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+import math
+from pathlib import Path
+import random
+import struct
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.saj_r6_modbus.hub import (  # noqa: E402
+    INVERTER_DATA_DECODER,
+    REALTIME_DATA_DECODER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+READ_HOLDING_REGISTERS = 0x03
+
+ILLEGAL_DATA_ADDRESS = 0x02
+ILLEGAL_DATA_VALUE = 0x03
+DEVICE_BUSY = 0x06
+GATEWAY_PATH_UNAVAILABLE = 0x0A
+GATEWAY_TARGET_NO_RESPONSE = 0x0B
+
+MBAP_HEADER = struct.Struct(">HHHB")
+READ_REQUEST = struct.Struct(">BHH")
+
+SENTINEL = 0xFFFF
+DESCRIPTIONS = {
+    description.key: description
+    for description in (
+        *REALTIME_DATA_DECODER.descriptions,
+        *INVERTER_DATA_DECODER.descriptions,
+    )
+}
+
+
+def encode(key: str, value: float) -> list[int]:
+    """Return the registers holding a value of a field."""
+    description = DESCRIPTIONS[key]
+    raw = round(value / description.scale)
+    bits = 16 * description.count
+    raw &= (1 << bits) - 1
+    return [raw >> 16 & 0xFFFF, raw & 0xFFFF] if description.count == 2 else [raw]
+
+
+def encode_string(value: str, count: int) -> list[int]:
+    """Return the registers holding an ASCII string, zero padded."""
+    data = value.encode("ascii").ljust(count * 2, b"\x00")[:count * 2]
+    return list(struct.unpack(f">{count}H", data))
+
+
+@dataclass
+class SimulatedInverter:
+    """Register map of one SAJ R6 inverter.
+
+    Set fault_bits to (word, bit) pairs to raise faults, or mode to force the
+    operating mode (1 Wait, 2 Grid connected, 3 Fault).
+    """
+
+    device_id: int = 1
+    serial_number: str = "R6S2153J2301E00001"
+    rated_power: int = 15000
+    pv_inputs: int = 2
+    strings: int = 2
+    fault_bits: set[tuple[int, int]] = field(default_factory=set)
+    mode: int | None = None
+    now: datetime | None = None
+    noise: float = 0.01
+    seed: int | None = None
+
+    def __post_init__(self):
+        """Initialize the random generator of the measurement noise."""
+        self._random = random.Random(self.seed)
+
+    def realtime_registers(self) -> list[int]:
+        """Return the current realtime block."""
+        now = self.now or datetime.now()
+        hour = now.hour + now.minute / 60 + now.second / 3600
+        irradiance = max(0.0, math.sin(math.pi * (hour - 6) / 12))
+        irradiance *= 1 + self._random.uniform(-self.noise, self.noise)
+        mode = self.mode or (2 if irradiance > 0.02 else 1)
+        producing = mode == 2
+        power = round(self.rated_power * irradiance) if producing else 0
+
+        values: dict[str, float] = {
+            "totalenergy": 52341.27,
+            "yearenergy": 8123.45,
+            "monthenergy": 912.33,
+            "todayenergy": round(self.rated_power * 6 * irradiance / 1000, 2),
+            "totalhour": 18234.5,
+            "todayhour": round(max(0.0, hour - 6), 1),
+            "errorcount": len(self.fault_bits),
+            "errorsn": 0,
+            "settingdatasn": 0,
+            "mpvmode": mode,
+            "conntime": 0 if producing else 60,
+            "energy": round(self.rated_power * 6 * irradiance / 1000, 2),
+            "power": power,
+            "qpower": -round(power * 0.02),
+            "pf": 1.0 if producing else 0,
+            "nevolt": 0.3,
+            "gfci": 2,
+            "busvolt": 650.0 if producing else 0,
+            "busvoltm": 325.0 if producing else 0,
+            "invtempc1": 25 + 20 * irradiance,
+            "invtempcl1": 24 + 18 * irradiance,
+            "invtempcl2": 24 + 18 * irradiance,
+            "invtempcl3": 24 + 18 * irradiance,
+            "invtempccavity": 22 + 12 * irradiance,
+            "iso1": 2000,
+            "iso2": 2000,
+            "iso3": 2000,
+            "iso4": 2000,
+        }
+        for phase in (1, 2, 3):
+            volt = 230 + self._random.uniform(-2, 2)
+            values |= {
+                f"l{phase}volt": volt,
+                f"l{phase}curr": power / 3 / volt,
+                f"l{phase}freq": 50 + self._random.uniform(-0.02, 0.02),
+                f"l{phase}dci": 5,
+                f"l{phase}power": round(power / 3),
+                f"l{phase}pf": 1.0 if producing else 0,
+            }
+        dc_power = power / 0.97
+        for index in range(1, self.pv_inputs + 1):
+            volt = 600 * (0.8 + 0.2 * irradiance) if irradiance > 0 else 0
+            current = dc_power / self.pv_inputs / volt if volt else 0
+            values |= {
+                f"pv{index}volt": volt,
+                f"pv{index}curr": current,
+                f"pv{index}power": round(dc_power / self.pv_inputs),
+            }
+            for string in range(1, self.strings + 1):
+                values[f"pv{index}strcurr{string}"] = current / self.strings
+
+        registers = [0] * REALTIME_DATA_DECODER.count
+        for description in REALTIME_DATA_DECODER.descriptions:
+            offset = description.address - REALTIME_DATA_DECODER.address
+            if description.key in values:
+                encoded = encode(description.key, values[description.key])
+            elif description.sentinel is not None:
+                encoded = [SENTINEL] * description.count
+            else:
+                continue
+            registers[offset:offset + description.count] = encoded
+
+        registers[0:4] = [
+            now.year,
+            now.month << 8 | now.day,
+            now.hour << 8 | now.minute,
+            now.second << 8,
+        ]
+        offset = DESCRIPTIONS["faultmsg"].address - REALTIME_DATA_DECODER.address
+        for word, bit in self.fault_bits:
+            registers[offset + word * 2 + (0 if bit >= 16 else 1)] |= 1 << bit % 16
+        return registers
+
+    def inverter_registers(self) -> list[int]:
+        """Return the inverter info block."""
+        registers = [0] * INVERTER_DATA_DECODER.count
+        registers[0:3] = [0x0001, 1, 1000]
+        registers[3:13] = encode_string(self.serial_number, 10)
+        registers[13:23] = encode_string("R6-15K-T2-32", 10)
+        registers[23:29] = [1010, 1020, 1030, 1000, 1000, 1000]
+        return registers
+
+    def read(self, address: int, count: int) -> list[int] | None:
+        """Return the registers of a range, None if it leaves the map."""
+        for base, block in (
+            (REALTIME_DATA_DECODER.address, self.realtime_registers),
+            (INVERTER_DATA_DECODER.address, self.inverter_registers),
+        ):
+            registers = block()
+            if base <= address and address + count <= base + len(registers):
+                return registers[address - base:address - base + count]
+        return None
+
+
+class SimulatedGateway:
+    """Modbus TCP server forwarding reads to the simulated inverters.
+
+    Only function 0x03 (read holding registers) is served. Faults are
+    injected per request, in this order:
+
+    asleep          every request fails with exception 0x0B, like an
+                    RS485 gateway whose inverter went to sleep
+    drop_rate       chance the connection is closed without a reply
+    busy_every      every nth request fails with exception 0x06
+    max_read_count  larger reads fail with exception 0x03
+    illegal         registers answered with exception 0x02
+    short_read_rate chance a reply holds half the requested registers
+    latency         delay before every reply, in seconds
+    """
+
+    def __init__(
+        self,
+        inverters: Iterable[SimulatedInverter],
+        *,
+        latency: float = 0.0,
+        drop_rate: float = 0.0,
+        short_read_rate: float = 0.0,
+        max_read_count: int = 125,
+        busy_every: int = 0,
+        illegal: Iterable[int] = (),
+        asleep: bool = False,
+        seed: int | None = None,
+    ):
+        """Initialize the gateway."""
+        self.inverters = {inverter.device_id: inverter for inverter in inverters}
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.short_read_rate = short_read_rate
+        self.max_read_count = max_read_count
+        self.busy_every = busy_every
+        self.illegal = set(illegal)
+        self.asleep = asleep
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+        self._clients: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+        self.requests: list[tuple[int, int, int]] = []
+        self.connections = 0
+
+    @property
+    def port(self) -> int:
+        """Return the port the gateway listens on."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening, return the port."""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self.port
+
+    async def close(self) -> None:
+        """Stop listening and drop the client connections."""
+        self._server.close()
+        for writer in self._clients:
+            writer.close()
+        await asyncio.gather(*self._clients.values(), return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def __aenter__(self) -> SimulatedGateway:
+        """Start the gateway on a free port."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the gateway."""
+        await self.close()
+
+    def _respond(self, unit: int, address: int, count: int) -> tuple[list[int] | None, int]:
+        """Return the registers or the exception code answering a read."""
+        self.requests.append((unit, address, count))
+        if self.asleep:
+            return None, GATEWAY_TARGET_NO_RESPONSE
+        if self.busy_every and len(self.requests) % self.busy_every == 0:
+            return None, DEVICE_BUSY
+        if count > self.max_read_count:
+            return None, ILLEGAL_DATA_VALUE
+        inverter = self.inverters.get(unit)
+        if inverter is None:
+            return None, GATEWAY_PATH_UNAVAILABLE
+        if not self.illegal.isdisjoint(range(address, address + count)):
+            return None, ILLEGAL_DATA_ADDRESS
+        registers = inverter.read(address, count)
+        if registers is None:
+            return None, ILLEGAL_DATA_ADDRESS
+        if self._random.random() < self.short_read_rate:
+            registers = registers[:count // 2]
+        return registers, 0
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve the requests of one client connection."""
+        self.connections += 1
+        self._clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                header = await reader.readexactly(MBAP_HEADER.size)
+                transaction, protocol, length, unit = MBAP_HEADER.unpack(header)
+                pdu = await reader.readexactly(length - 1)
+                if self._random.random() < self.drop_rate:
+                    break
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                function = pdu[0]
+                if function != READ_HOLDING_REGISTERS:
+                    response = bytes((function | 0x80, 0x01))
+                else:
+                    _, address, count = READ_REQUEST.unpack(pdu[:READ_REQUEST.size])
+                    registers, exception = self._respond(unit, address, count)
+                    if exception:
+                        response = bytes((function | 0x80, exception))
+                    else:
+                        response = struct.pack(
+                            f">BB{len(registers)}H",
+                            function,
+                            len(registers) * 2,
+                            *registers,
+                        )
+                writer.write(
+                    MBAP_HEADER.pack(transaction, protocol, len(response) + 1, unit)
+                    + response
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run the gateway until interrupted."""
+    gateway = SimulatedGateway(
+        [
+            SimulatedInverter(
+                device_id, serial_number=f"R6S2153J2301E{device_id:05}",
+                pv_inputs=args.pv_inputs,
+            )
+            for device_id in args.device_ids
+        ],
+        latency=args.latency,
+        drop_rate=args.drop_rate,
+        short_read_rate=args.short_read_rate,
+        max_read_count=args.max_read_count,
+        busy_every=args.busy_every,
+        asleep=args.asleep,
+    )
+    port = await gateway.start(args.host, args.port)
+    _LOGGER.info("Simulating device IDs %s on %s:%s", args.device_ids, args.host, port)
+    await asyncio.Event().wait()
+
+
+def main() -> None:
+    """Parse the arguments and serve."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--device-ids", type=int, nargs="+", default=[1])
+    parser.add_argument("--pv-inputs", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--short-read-rate", type=float, default=0.0)
+    parser.add_argument("--max-read-count", type=int, default=125)
+    parser.add_argument("--busy-every", type=int, default=0)
+    parser.add_argument("--asleep", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Helpers of the SAJ R6 Inverter Modbus tests."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+import functools
+import tempfile
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection
+from custom_components.saj_r6_modbus.hub import SAJModbusHub
+from saj_simulator import SimulatedGateway, SimulatedInverter
+
+
+def async_test(
+    test: Callable[..., Coroutine[Any, Any, None]],
+) -> Callable[..., None]:
+    """Run a coroutine test function in an event loop of its own."""
+
+    @functools.wraps(test)
+    def run(*args, **kwargs) -> None:
+        asyncio.run(test(*args, **kwargs))
+
+    return run
+
+
+@asynccontextmanager
+async def async_test_home_assistant() -> AsyncIterator[HomeAssistant]:
+    """Yield a bare Home Assistant instance with the registries the hub uses."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        try:
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+
+@asynccontextmanager
+async def async_polling_hub(
+    **gateway_options,
+) -> AsyncIterator[tuple[SAJModbusHub, SimulatedGateway]]:
+    """Yield a hub polling a simulated inverter behind a gateway."""
+    gateway = SimulatedGateway([SimulatedInverter(seed=1)], seed=1, **gateway_options)
+    async with gateway, async_test_home_assistant() as hass:
+        connection = SAJModbusConnection("127.0.0.1", gateway.port)
+        hub = SAJModbusHub(hass, "SAJ", connection, 1, 60)
+        try:
+            yield hub, gateway
+        finally:
+            hub.close()
+
+
+async def async_poll(hub: SAJModbusHub) -> dict | None:
+    """Poll all registers once, return the data or None if the poll failed."""
+    hub._last_poll.clear()
+    try:
+        return await hub._async_update_data()
+    except UpdateFailed:
+        return None
@@ -0,0 +1,7 @@
+"""Test configuration of SAJ R6 Inverter Modbus."""
+
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT), str(ROOT / "scripts")]
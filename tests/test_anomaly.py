@@ -0,0 +1,79 @@
+"""String current anomaly detection."""
+
+from homeassistant.const import STATE_UNAVAILABLE
+
+from custom_components.saj_r6_modbus.anomaly import SajStringAnomalyDetector
+
+
+def detector() -> SajStringAnomalyDetector:
+    """Return a detector of one PV input that learns in 3 samples."""
+    return SajStringAnomalyDetector(
+        [("pv1strcurr1", "pv1strcurr2")],
+        alpha=0.5,
+        threshold=0.2,
+        min_current=0.5,
+        min_samples=3,
+    )
+
+
+def sample(strings: SajStringAnomalyDetector, current1, current2) -> list[tuple[str, bool]]:
+    """Add the string currents of one poll."""
+    return strings.add({"pv1strcurr1": current1, "pv1strcurr2": current2})
+
+
+def test_no_state_while_learning() -> None:
+    """The strings have no state and no ratio until min_samples polls with current."""
+    strings = detector()
+    for _ in range(2):
+        assert sample(strings, 5.0, 3.0) == []
+    assert strings.states() == {"pv1strcurr1anomaly": None, "pv1strcurr2anomaly": None}
+    assert strings.ratio("pv1strcurr2") is None
+
+    # The string was anomalous from the start, it is reported once learned.
+    assert sample(strings, 5.0, 3.0) == [("pv1strcurr2", True)]
+    assert strings.states() == {"pv1strcurr1anomaly": False, "pv1strcurr2anomaly": True}
+    assert 0.75 < strings.ratio("pv1strcurr2") < 0.8
+
+
+def test_threshold_crossing_with_hysteresis() -> None:
+    """A string turns anomalous below 1 - threshold and recovers above 1 - threshold / 2."""
+    strings = detector()
+    for _ in range(3):
+        assert sample(strings, 4.0, 4.0) == []
+    assert strings.states()["pv1strcurr2anomaly"] is False
+
+    # The ratio of a string at half its sibling is 2/3.
+    assert sample(strings, 4.0, 2.0) == []
+    assert sample(strings, 4.0, 2.0) == [("pv1strcurr2", True)]
+    # Ratio 0.9 leaves the EWMA between both limits.
+    for _ in range(2):
+        assert sample(strings, 4.0, 3.27) == []
+    assert 0.8 < strings.ratio("pv1strcurr2") < 0.9
+    assert strings.states()["pv1strcurr2anomaly"] is True
+    assert sample(strings, 4.0, 4.0) == [("pv1strcurr2", False)]
+
+
+def test_night_keeps_the_learned_state() -> None:
+    """Polls without current neither move the EWMA nor reset it, the state survives the night."""
+    strings = detector()
+    for _ in range(3):
+        sample(strings, 5.0, 3.0)
+    ratio = strings.ratio("pv1strcurr2")
+    states = strings.states()
+
+    for current1, current2 in ((0.3, 0.1), (0.0, 0.0), (STATE_UNAVAILABLE, STATE_UNAVAILABLE)):
+        assert sample(strings, current1, current2) == []
+    assert strings.ratio("pv1strcurr2") == ratio
+    assert strings.states() == states
+
+    # In the morning the detector continues from the learned ratio.
+    assert sample(strings, 5.0, 5.0) == []
+    assert strings.ratio("pv1strcurr2") > ratio
+
+
+def test_unconnected_string_is_not_anomalous() -> None:
+    """A string that never carried current is not compared with its sibling."""
+    strings = detector()
+    for _ in range(5):
+        assert sample(strings, 5.0, 0.0) == []
+    assert strings.states() == {"pv1strcurr1anomaly": None, "pv1strcurr2anomaly": None}
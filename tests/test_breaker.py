@@ -0,0 +1,113 @@
+"""Circuit breaker of the polls."""
+
+from unittest.mock import patch
+
+from custom_components.saj_r6_modbus import breaker
+from custom_components.saj_r6_modbus.breaker import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CircuitBreaker,
+)
+
+
+class Clock:
+    """Monotonic clock moved by the test."""
+
+    def __init__(self) -> None:
+        """Start at 1000 s."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def open_breaker(circuit: CircuitBreaker, failures: int = 3) -> None:
+    """Record failed polls."""
+    for _ in range(failures):
+        circuit.record_failure()
+
+
+def test_opens_after_the_failure_threshold() -> None:
+    """The breaker stays closed below the threshold and blocks polls once open."""
+    clock = Clock()
+    circuit = CircuitBreaker(3, 30, 600)
+    with patch.object(breaker.time, "monotonic", clock):
+        open_breaker(circuit, 2)
+        assert circuit.state == BREAKER_CLOSED
+        assert circuit.allow_request()
+        circuit.record_failure()
+        assert circuit.state == BREAKER_OPEN
+        assert circuit.open_count == 1
+        assert not circuit.allow_request()
+        assert 15 <= circuit.retry_in <= 30
+
+
+def test_half_open_after_the_backoff() -> None:
+    """Once the delay has passed one probe is let through."""
+    clock = Clock()
+    circuit = CircuitBreaker(3, 30, 600)
+    with patch.object(breaker.time, "monotonic", clock), patch.object(
+        breaker.random, "uniform", lambda low, high: high
+    ):
+        open_breaker(circuit)
+        clock.now += 29.9
+        assert not circuit.allow_request()
+        clock.now += 0.1
+        assert circuit.allow_request()
+        assert circuit.state == BREAKER_HALF_OPEN
+        assert circuit.retry_in == 0
+
+
+def test_failed_probe_doubles_the_backoff_up_to_the_cap() -> None:
+    """Every failed probe reopens the breaker with a doubled delay, at most backoff_max."""
+    clock = Clock()
+    circuit = CircuitBreaker(3, 30, 200)
+    delays = []
+    with patch.object(breaker.time, "monotonic", clock), patch.object(
+        breaker.random, "uniform", lambda low, high: high
+    ):
+        open_breaker(circuit)
+        for _ in range(5):
+            delays.append(circuit.retry_in)
+            clock.now += circuit.retry_in
+            assert circuit.allow_request()
+            circuit.record_failure()
+            assert circuit.state == BREAKER_OPEN
+    assert delays == [30, 60, 120, 200, 200]
+    assert circuit.open_count == 6
+
+
+def test_backoff_is_jittered_down_to_half() -> None:
+    """The delay is drawn between half the backoff and the backoff."""
+    circuit = CircuitBreaker(1, 30, 600)
+    with patch.object(breaker.random, "uniform", return_value=20) as uniform:
+        circuit.record_failure()
+    uniform.assert_called_once_with(15, 30)
+
+
+def test_success_closes_and_resets_the_backoff() -> None:
+    """A successful probe closes the breaker, the next opening starts from the initial delay."""
+    clock = Clock()
+    circuit = CircuitBreaker(3, 30, 600)
+    with patch.object(breaker.time, "monotonic", clock), patch.object(
+        breaker.random, "uniform", lambda low, high: high
+    ):
+        open_breaker(circuit)
+        clock.now += circuit.retry_in
+        circuit.allow_request()
+        circuit.record_failure()
+        assert circuit.retry_in == 60
+
+        clock.now += circuit.retry_in
+        assert circuit.allow_request()
+        circuit.record_success()
+        assert circuit.state == BREAKER_CLOSED
+        assert circuit.failure_count == 0
+        assert circuit.allow_request()
+
+        open_breaker(circuit, 2)
+        assert circuit.state == BREAKER_CLOSED
+        circuit.record_failure()
+        assert circuit.retry_in == 30
@@ -0,0 +1,23 @@
+"""Frame capture file."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from custom_components.saj_r6_modbus.capture import SajFrameRecorder, read_capture
+
+
+def test_concurrent_writes_rotate(tmp_path) -> None:
+    """Hubs writing the shared capture from executor threads do not race rotations."""
+    path = str(tmp_path / "frames")
+    # Every write rotates the capture.
+    recorder = SajFrameRecorder(path, 1)
+    buffers = []
+    for index in range(2000):
+        recorder.record(index % 4 + 1, 0x6000, [index] * 10)
+        buffers.append(recorder.take())
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(recorder.write, buffers))
+
+    frames = list(read_capture(path))
+    assert frames
+    assert all(frame.registers == [frame.registers[0]] * 10 for frame in frames)
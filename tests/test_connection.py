@@ -0,0 +1,49 @@
+"""Shared Modbus TCP connection against a simulated gateway."""
+
+import asyncio
+
+from pymodbus.exceptions import ConnectionException
+import pytest
+
+from common import async_test
+
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection
+from saj_simulator import SimulatedGateway, SimulatedInverter
+
+
+@async_test
+async def test_close_when_idle_waits_for_requests() -> None:
+    """Closing after a poll neither breaks nor drops requests of other inverters."""
+    gateway = SimulatedGateway([SimulatedInverter(1), SimulatedInverter(2)], latency=0.05)
+    async with gateway:
+        connection = SAJModbusConnection("127.0.0.1", gateway.port)
+        in_flight = asyncio.create_task(
+            connection.read_holding_registers(1, 0x6000, 10))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(
+            connection.read_holding_registers(2, 0x6000, 10))
+        await asyncio.sleep(0)
+
+        await connection.async_close_when_idle()
+        assert not (await in_flight).isError()
+        assert not (await queued).isError()
+        assert not connection.connected
+        assert gateway.connections == 1
+
+
+@async_test
+async def test_only_successful_connects_are_counted() -> None:
+    """Failed connection attempts do not count as (re)connects."""
+    gateway = SimulatedGateway([SimulatedInverter(1)])
+    async with gateway:
+        port = gateway.port
+        connection = SAJModbusConnection("127.0.0.1", port)
+        assert not (await connection.read_holding_registers(1, 0x6000, 10)).isError()
+        assert connection.connect_count == 1
+        connection.close()
+
+    # Nothing listens on the port anymore.
+    connection = SAJModbusConnection("127.0.0.1", port)
+    with pytest.raises(ConnectionException):
+        await connection.read_holding_registers(1, 0x6000, 10)
+    assert connection.connect_count == 0
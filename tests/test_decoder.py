@@ -0,0 +1,27 @@
+"""Register block decoder."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from saj_simulator import SimulatedInverter
+
+from custom_components.saj_r6_modbus import decoder
+from custom_components.saj_r6_modbus.hub import REALTIME_DATA_DECODER
+
+
+def test_decode_frames_matches_decode() -> None:
+    """Decoding many frames at once gives the columns of the frames decoded one by one."""
+    inverter = SimulatedInverter(seed=1)
+    frames = []
+    for hour in range(24):
+        inverter.now = datetime(2026, 6, 21) + timedelta(hours=hour)
+        frames.append(inverter.realtime_registers())
+    # Sentinels and extremes of every register.
+    frames.append([0xFFFF] * REALTIME_DATA_DECODER.count)
+    frames.append([0x8000] * REALTIME_DATA_DECODER.count)
+
+    with patch.object(decoder, "np", None):
+        columns = REALTIME_DATA_DECODER.decode_frames(frames)
+
+    rows = [REALTIME_DATA_DECODER.decode(frame) for frame in frames]
+    assert columns == {key: [row[key] for row in rows] for key in rows[0]}
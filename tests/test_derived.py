@@ -0,0 +1,62 @@
+"""Derived PV metrics."""
+
+from datetime import datetime
+
+from homeassistant.const import STATE_UNAVAILABLE
+
+from saj_simulator import SimulatedInverter
+
+from custom_components.saj_r6_modbus.const import DERIVED_SENSOR_TYPES
+from custom_components.saj_r6_modbus.derived import SajDerivedMetrics
+from custom_components.saj_r6_modbus.hub import DERIVED_METRICS, REALTIME_DATA_DECODER
+
+
+def decoded(inverter: SimulatedInverter) -> dict:
+    """Return the decoded realtime data of a simulated inverter with its metrics."""
+    data = REALTIME_DATA_DECODER.decode(inverter.realtime_registers())
+    DERIVED_METRICS.compute(data)
+    return data
+
+
+def test_metrics_are_computed_after_their_dependencies() -> None:
+    """The efficiency uses the PV total power of the same poll, whatever the declaration order."""
+    metrics = SajDerivedMetrics(reversed(list(DERIVED_SENSOR_TYPES.values())))
+    data = {"power": 2850, "pv1power": 1800, "pv2power": 1200}
+    metrics.compute(data)
+    assert data["dcpower"] == 3000
+    assert data["efficiency"] == 95.0
+
+
+def test_dependencies_are_the_decoded_fields() -> None:
+    """Metrics computed from other metrics depend on the decoded fields of those."""
+    assert DERIVED_METRICS.dependencies({"efficiency"}) == frozenset(
+        {"power", *(f"pv{index}power" for index in range(1, 7))})
+    assert DERIVED_METRICS.dependencies({"pv1strimbalance", "power"}) == frozenset(
+        {"pv1strcurr1", "pv1strcurr2"})
+
+
+def test_no_division_by_zero_at_night() -> None:
+    """Without PV power or string currents the ratios are unknown."""
+    data = decoded(SimulatedInverter(now=datetime(2026, 6, 21, 1), seed=1))
+    assert data["dcpower"] == 0
+    assert data["efficiency"] is None
+    assert data["pv1strimbalance"] is None
+
+
+def test_inputs_reading_the_sentinel_are_left_out() -> None:
+    """Unused PV inputs read 0xFFFF, the totals are computed from the inputs in use."""
+    data = decoded(SimulatedInverter(
+        pv_inputs=2, now=datetime(2026, 6, 21, 12), noise=0, seed=1))
+    assert data["pv3power"] == STATE_UNAVAILABLE
+    assert data["pv3strcurr1"] == STATE_UNAVAILABLE
+    assert data["dcpower"] == data["pv1power"] + data["pv2power"] > 0
+    assert data["efficiency"] == round(data["power"] / data["dcpower"] * 100, 1)
+    assert data["pv1strimbalance"] is not None
+    assert data["pv3strimbalance"] is None
+
+
+def test_no_metric_without_any_input() -> None:
+    """An inverter with every PV input reading the sentinel has no PV total power."""
+    data = decoded(SimulatedInverter(pv_inputs=0, now=datetime(2026, 6, 21, 12), seed=1))
+    assert data["dcpower"] is None
+    assert data["efficiency"] is None
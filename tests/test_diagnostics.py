@@ -0,0 +1,24 @@
+"""Diagnostics of the recorded frames."""
+
+from common import async_poll, async_polling_hub, async_test
+
+from custom_components.saj_r6_modbus.const import INVERTER_DATA_ADDRESS
+from custom_components.saj_r6_modbus.diagnostics import _redact_frame
+from custom_components.saj_r6_modbus.hub import INVERTER_DATA_DECODER
+
+
+@async_test
+async def test_frames_do_not_leak_the_serial_number() -> None:
+    """The serial number is zeroed in the raw inverter info frame."""
+    async with async_polling_hub() as (hub, _):
+        assert await async_poll(hub)
+        frames = [
+            _redact_frame(frame)
+            for frame in hub.frames.frames()
+            if frame.address == INVERTER_DATA_ADDRESS
+        ]
+        assert frames
+        inverter_data = INVERTER_DATA_DECODER.decode(frames[0]["registers"])
+        assert inverter_data["sn"] != hub.inverter_data["sn"]
+        assert not any(frames[0]["registers"][3:13])
+        assert inverter_data["dv"] == hub.inverter_data["dv"]
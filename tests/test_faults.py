@@ -0,0 +1,66 @@
+"""Fault word decoding and the fault message sensor."""
+
+from common import async_test, async_test_home_assistant
+
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection
+from custom_components.saj_r6_modbus.const import FAULT_MESSAGES, FAULT_SENSOR_TYPES
+from custom_components.saj_r6_modbus.decoder import FAULT_TABLES, translate_fault_words
+from custom_components.saj_r6_modbus.hub import SAJModbusHub
+from custom_components.saj_r6_modbus.sensor import SajFaultSensor
+
+NO_FAULTS = (0,) * len(FAULT_MESSAGES)
+
+
+def test_fault_tables_cover_every_byte() -> None:
+    """Each fault word has a 256 entry table per byte, a zero byte has no faults."""
+    assert len(FAULT_TABLES) == 4 * len(FAULT_MESSAGES)
+    assert all(len(table) == 256 and table[0] == () for table in FAULT_TABLES)
+    assert FAULT_TABLES[0][0x80] == ((81, "Code 81: Lost Communication D<->C"),)
+
+
+def test_fault_words_translate_every_bit_in_order() -> None:
+    """Faults of several bits and bytes keep the order of the fault messages."""
+    words = (0x80000000 | 0x00080000 | 0x00000100, *NO_FAULTS[1:])
+
+    assert translate_fault_words(words) == (
+        (81, "Code 81: Lost Communication D<->C"),
+        (48, "Code 48: Master Fan4 Error"),
+        (38, "Code 38: Master HWBus Voltage High"),
+    )
+
+
+def test_unknown_fault_bits_are_ignored() -> None:
+    """Bits without a fault message translate to nothing."""
+    assert translate_fault_words((0x40000000, *NO_FAULTS[1:])) == ()
+    assert translate_fault_words((0x40000000 | 0x00010000, *NO_FAULTS[1:])) == (
+        (45, "Code 45: Master Fan1 Error"),
+    )
+
+
+def test_fault_words_are_cached() -> None:
+    """The same fault words are only translated once."""
+    translate_fault_words.cache_clear()
+    words = (0x00020000, *NO_FAULTS[1:])
+
+    faults = translate_fault_words(words)
+    assert translate_fault_words(words) is faults
+    assert translate_fault_words.cache_info().hits == 1
+    assert translate_fault_words.cache_info().misses == 1
+
+
+@async_test
+async def test_fault_sensor_follows_the_fault_codes() -> None:
+    """The fault codes attribute is updated when only the codes change."""
+    async with async_test_home_assistant() as hass:
+        hub = SAJModbusHub(hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60)
+        sensor = SajFaultSensor(hub.name, hub, hub.device_info, FAULT_SENSOR_TYPES["FaultMSG"])
+        sensor.hass = hass
+        sensor.entity_id = "sensor.saj_fault_message"
+        hub.data = {"faultmsg": "Code 45: Master Fan1 Error", "faultcodes": [45]}
+        await sensor.async_added_to_hass()
+        hub.async_update_listeners()
+
+        hub.data = {"faultmsg": "Code 45: Master Fan1 Error", "faultcodes": [45, 46]}
+        hub.async_update_listeners()
+        assert sensor.extra_state_attributes == {"fault_codes": [45, 46]}
+        hub.close()
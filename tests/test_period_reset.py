@@ -0,0 +1,59 @@
+"""Scheduled reset of the day, month and year totals."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from common import async_test, async_test_home_assistant
+
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection
+from custom_components.saj_r6_modbus.const import DAY_SENSOR_TYPES
+from custom_components.saj_r6_modbus.hub import SAJModbusHub
+from custom_components.saj_r6_modbus.sensor import SajDaySensor
+
+
+async def async_day_sensor(hass) -> SajDaySensor:
+    """Return the day total sensor of a hub, with its reset scheduled at midnight."""
+    hub = SAJModbusHub(hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60)
+    sensor = SajDaySensor(hub.name, hub, hub.device_info, DAY_SENSOR_TYPES["TodayEnergy"])
+    sensor.hass = hass
+    sensor.entity_id = "sensor.saj_current_day_output"
+    evening = datetime(2026, 6, 21, 23, 55, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    with patch.object(dt_util, "now", return_value=evening):
+        sensor._async_schedule_reset()
+    sensor._update_from_data({"todayenergy": 31.2, "time": evening.replace(tzinfo=None)})
+    sensor._async_reset(evening.replace(day=22, hour=0, minute=0))
+    assert sensor.native_value == 0
+    return sensor
+
+
+@async_test
+async def test_late_inverter_total_is_not_written_back() -> None:
+    """The total of the ended day is ignored until the inverter clock passes midnight."""
+    async with async_test_home_assistant() as hass:
+        sensor = await async_day_sensor(hass)
+        # The inverter clock runs 3 minutes late.
+        sensor._update_from_data({"todayenergy": 31.2, "time": datetime(2026, 6, 21, 23, 57)})
+        assert sensor.native_value == 0
+        sensor._update_from_data({"todayenergy": 31.3, "time": datetime(2026, 6, 21, 23, 59)})
+        assert sensor.native_value == 0
+        sensor._update_from_data({"todayenergy": 0, "time": datetime(2026, 6, 22, 0, 0)})
+        assert sensor.native_value == 0
+        sensor._update_from_data({"todayenergy": 0.1, "time": datetime(2026, 6, 22, 6, 0)})
+        assert sensor.native_value == 0.1
+        sensor._async_cancel_reset()
+
+
+@async_test
+async def test_total_below_the_ended_total_is_the_new_period() -> None:
+    """Without the inverter time, a total below the ended one starts the new period."""
+    async with async_test_home_assistant() as hass:
+        sensor = await async_day_sensor(hass)
+        sensor._update_from_data({"todayenergy": 31.2})
+        assert sensor.native_value == 0
+        sensor._update_from_data({"todayenergy": 0.2})
+        assert sensor.native_value == 0.2
+        sensor._update_from_data({"todayenergy": 0.4})
+        assert sensor.native_value == 0.4
+        sensor._async_cancel_reset()
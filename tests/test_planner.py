@@ -0,0 +1,107 @@
+"""Read planner."""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import entity_registry as er
+import pytest
+
+from common import async_poll, async_polling_hub, async_test
+
+from custom_components.saj_r6_modbus.const import (
+    DEFAULT_READ_REQUEST_COST,
+    DOMAIN,
+    MAX_READ_COUNT,
+    REALTIME_DATA_ADDRESS,
+    SajModbusSensorEntityDescription,
+)
+from custom_components.saj_r6_modbus.hub import REALTIME_DATA_DECODER
+from custom_components.saj_r6_modbus.planner import plan_reads
+
+
+def fields(*ranges: tuple[int, int]) -> list[SajModbusSensorEntityDescription]:
+    """Return descriptions of fields at (address, count)."""
+    return [
+        SajModbusSensorEntityDescription(key=f"field{address}", address=address, count=count)
+        for address, count in ranges
+    ]
+
+
+@pytest.mark.parametrize(
+    ("ranges", "request_cost", "max_count", "unreadable", "reads"),
+    [
+        # A gap cheaper than a request is read along.
+        ([(0, 1), (2, 1)], 2, 125, (), [(0, 3)]),
+        ([(0, 1), (4, 1)], 3, 125, (), [(0, 5)]),
+        # A gap costlier than a request is skipped.
+        ([(0, 1), (5, 1)], 3, 125, (), [(0, 1), (5, 1)]),
+        ([(0, 2), (40, 2), (41, 1), (90, 1)], 24, 125, (), [(0, 2), (40, 2), (90, 1)]),
+        # Adjacent and overlapping fields, in any order.
+        ([(4, 2), (0, 2), (2, 2), (1, 1)], 0, 125, (), [(0, 6)]),
+        # No read is longer than the maximum count.
+        ([(0, 2), (2, 2), (4, 2)], 0, 4, (), [(0, 4), (4, 2)]),
+        ([(0, 1), (3, 2)], 24, 4, (), [(0, 1), (3, 2)]),
+        ([(0, 1), (3, 2)], 24, 5, (), [(0, 5)]),
+        # Unreadable registers in a gap are not read along.
+        ([(0, 1), (2, 1)], 24, 125, (1,), [(0, 1), (2, 1)]),
+        ([(0, 1), (2, 1)], 24, 125, (5,), [(0, 3)]),
+        ([], 24, 125, (), []),
+    ],
+)
+def test_plan_reads(ranges, request_cost, max_count, unreadable, reads) -> None:
+    """The planner merges across small gaps and splits across large gaps and long reads."""
+    assert plan_reads(fields(*ranges), request_cost, max_count, frozenset(unreadable)) == reads
+
+
+@pytest.mark.parametrize("max_count", [MAX_READ_COUNT, 40, 16])
+def test_plan_covers_the_realtime_block(max_count: int) -> None:
+    """The reads of every realtime field cover each field within the maximum count."""
+    descriptions = REALTIME_DATA_DECODER.descriptions
+    reads = plan_reads(descriptions, DEFAULT_READ_REQUEST_COST, max_count)
+    assert all(count <= max_count for _, count in reads)
+    for description in descriptions:
+        assert any(
+            address <= description.address
+            and description.address + description.count <= address + count
+            for address, count in reads
+        )
+
+
+def realtime_registers(gateway) -> int:
+    """Return the number of realtime registers requested."""
+    return sum(
+        count
+        for _, address, count in gateway.requests
+        if REALTIME_DATA_ADDRESS <= address < REALTIME_DATA_ADDRESS + 0x100
+    )
+
+
+@async_test
+async def test_disabled_entities_shrink_the_plan() -> None:
+    """Registers only read for disabled entities drop out of the polls."""
+    async with async_polling_hub() as (hub, gateway):
+        hub.config_entry = ConfigEntry(
+            version=1, minor_version=1, domain=DOMAIN, title="SAJ", data={}, source="user")
+        registry = er.async_get(hub.hass)
+        entity_ids = {
+            description.key: registry.async_get_or_create(
+                "sensor",
+                DOMAIN,
+                f"{hub.name}_{description.key}",
+                config_entry=hub.config_entry,
+            ).entity_id
+            for description in REALTIME_DATA_DECODER.descriptions
+        }
+        remove_listener = hub.async_track_enabled_entities()
+        assert await async_poll(hub)
+        read_all = realtime_registers(gateway)
+
+        # Every entity but the AC output power.
+        for key, entity_id in entity_ids.items():
+            if key != "power":
+                registry.async_update_entity(
+                    entity_id, disabled_by=er.RegistryEntryDisabler.USER)
+        await hub.hass.async_block_till_done()
+        gateway.requests.clear()
+        data = await async_poll(hub)
+        assert isinstance(data["power"], int)
+        assert 0 < realtime_registers(gateway) < read_all
+        remove_listener()
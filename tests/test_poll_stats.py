@@ -0,0 +1,26 @@
+"""Poll statistics published while the inverter is unreachable."""
+
+from common import async_polling_hub, async_test
+
+
+@async_test
+async def test_poll_stats_are_published_during_an_outage() -> None:
+    """Failed polls update the diagnostic sensors, and only them."""
+    async with async_polling_hub() as (hub, gateway):
+        updates = {"successrate": 0, "power": 0}
+        for key in updates:
+            hub.async_add_listener(
+                lambda key=key: updates.__setitem__(key, updates[key] + 1), key)
+        await hub.async_refresh()
+        assert hub.last_update_success
+        assert hub.data["successrate"] == 100
+
+        gateway.asleep = True
+        updates = dict.fromkeys(updates, 0)
+        for _ in range(2):
+            hub._last_poll.clear()
+            await hub.async_refresh()
+        assert not hub.last_update_success
+        assert hub.data["successrate"] < 50
+        # The second failure is not dispatched by the coordinator.
+        assert updates == {"successrate": 3, "power": 1}
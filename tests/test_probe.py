@@ -0,0 +1,56 @@
+"""Capability probe at setup."""
+
+from unittest.mock import AsyncMock, Mock
+
+from pymodbus.exceptions import ModbusException
+
+from common import async_test
+
+from custom_components.saj_r6_modbus import async_probe_hubs
+from custom_components.saj_r6_modbus.config_flow import async_probe_capabilities
+from custom_components.saj_r6_modbus.const import CONF_CAPABILITIES
+from saj_simulator import SimulatedGateway, SimulatedInverter
+
+
+@async_test
+async def test_profiles_of_the_devices_that_answered() -> None:
+    """A device that fails the probe is left out, the others keep their profile."""
+    gateway = SimulatedGateway([SimulatedInverter(1, pv_inputs=1)])
+    async with gateway:
+        capabilities = await async_probe_capabilities("127.0.0.1", gateway.port, [1, 2])
+
+    assert list(capabilities) == ["1"]
+    assert "pv1volt" not in capabilities["1"]["absent_keys"]
+    assert "pv2volt" in capabilities["1"]["absent_keys"]
+
+
+@async_test
+async def test_sleeping_inverter_is_not_profiled() -> None:
+    """Nothing is stored for an inverter that does not answer."""
+    async with SimulatedGateway([SimulatedInverter(1)], asleep=True) as gateway:
+        assert await async_probe_capabilities("127.0.0.1", gateway.port, [1]) == {}
+
+
+@async_test
+async def test_inverter_without_pv_readings_is_not_profiled() -> None:
+    """All PV inputs reading the sentinel, e.g. at night, mark none of them absent."""
+    async with SimulatedGateway([SimulatedInverter(1, pv_inputs=0)]) as gateway:
+        assert await async_probe_capabilities("127.0.0.1", gateway.port, [1]) == {}
+
+
+@async_test
+async def test_probe_again_keeps_the_profiles_of_failed_devices() -> None:
+    """Only the profiles of devices that answered are stored."""
+    stored = {"absent_keys": [], "unreadable_registers": [], "max_read_count": 64}
+    probed = {"absent_keys": ["pv2volt"], "unreadable_registers": [], "max_read_count": 125}
+    entry = Mock(data={CONF_CAPABILITIES: {"1": stored}})
+    hass = Mock()
+    hubs = [
+        Mock(device_id=1, async_probe_capabilities=AsyncMock(side_effect=ModbusException("asleep"))),
+        Mock(device_id=2, async_probe_capabilities=AsyncMock(return_value=probed)),
+    ]
+
+    assert await async_probe_hubs(hass, entry, hubs)
+    hass.config_entries.async_update_entry.assert_called_once_with(
+        entry, data={CONF_CAPABILITIES: {"1": stored, "2": probed}}
+    )
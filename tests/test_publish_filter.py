@@ -0,0 +1,89 @@
+"""Publish filter of the keyed listeners."""
+
+from unittest.mock import patch
+
+from common import async_test, async_test_home_assistant
+
+from custom_components.saj_r6_modbus import hub as hub_module
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection
+from custom_components.saj_r6_modbus.hub import SAJModbusHub
+
+
+def listen(hub: SAJModbusHub, *keys: str | None) -> dict[str | None, int]:
+    """Count the updates of a listener per key."""
+    updates = dict.fromkeys(keys, 0)
+    for key in keys:
+        hub.async_add_listener(
+            lambda key=key: updates.__setitem__(key, updates[key] + 1), key)
+    return updates
+
+
+def publish(hub: SAJModbusHub, now: float, **data) -> None:
+    """Update the listeners with the data of a poll at a monotonic time."""
+    hub.data = {**hub.data, **data}
+    # Only the listener update sees the clock, the event loop keeps its own.
+    with patch.object(hub_module.time, "monotonic", return_value=now):
+        hub.async_update_listeners()
+
+
+@async_test
+async def test_changes_within_the_deadband_are_suppressed() -> None:
+    """Power moving by less than 5 W or 1 % keeps its listeners quiet."""
+    async with async_test_home_assistant() as hass:
+        hub = SAJModbusHub(hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60)
+        hub.data = {"power": 1000, "mpvmode": "Normal"}
+        # The first update publishes every key.
+        publish(hub, 0)
+        updates = listen(hub, "power")
+
+        publish(hub, 60, power=1008)
+        publish(hub, 120, power=990)
+        assert updates == {"power": 0}
+        assert hub.publishes_suppressed == 2
+
+        publish(hub, 180, power=1011)
+        assert updates == {"power": 1}
+        # The deadband is measured from the last published value.
+        publish(hub, 240, power=1002)
+        assert updates == {"power": 1}
+
+
+@async_test
+async def test_heartbeat_publishes_a_suppressed_change() -> None:
+    """A change within the deadband is published once the heartbeat has passed."""
+    async with async_test_home_assistant() as hass:
+        hub = SAJModbusHub(hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60)
+        hub.data = {"power": 1000}
+        publish(hub, 0)
+        updates = listen(hub, "power")
+
+        publish(hub, 299, power=1001)
+        assert updates == {"power": 0}
+        publish(hub, 300, power=1002)
+        assert updates == {"power": 1}
+        # An unchanged value needs no heartbeat.
+        publish(hub, 900, power=1002)
+        assert updates == {"power": 1}
+
+
+@async_test
+async def test_only_listeners_of_changed_keys_are_updated() -> None:
+    """Keyed listeners follow their key, listeners without a key every poll."""
+    async with async_test_home_assistant() as hass:
+        hub = SAJModbusHub(hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60)
+        hub.data = {"power": 1000, "mpvmode": "Normal", "faultcodes": []}
+        publish(hub, 0)
+        updates = listen(hub, "power", "mpvmode", "faultcodes", None)
+
+        publish(hub, 60, mpvmode="Fault")
+        assert updates == {"power": 0, "mpvmode": 1, "faultcodes": 0, None: 1}
+        assert hub.listeners_updated == 2
+        assert hub.listeners_skipped == 2
+
+        publish(hub, 120, faultcodes=["Grid overvoltage"], power=2000)
+        assert updates == {"power": 1, "mpvmode": 1, "faultcodes": 1, None: 2}
+
+        # A key missing from the data changes to None.
+        hub.data = {key: value for key, value in hub.data.items() if key != "mpvmode"}
+        publish(hub, 180)
+        assert updates == {"power": 1, "mpvmode": 2, "faultcodes": 1, None: 3}
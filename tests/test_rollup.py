@@ -0,0 +1,154 @@
+"""Hourly statistics rollups."""
+
+from datetime import datetime, timezone
+from enum import Enum
+import sys
+from types import ModuleType
+from typing import TypedDict
+from unittest.mock import Mock, patch
+
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+
+from custom_components.saj_r6_modbus.hub import ROLLUP_DESCRIPTIONS
+from custom_components.saj_r6_modbus.rollup import SajStatisticsRollup
+
+
+def test_mean_is_time_weighted() -> None:
+    """A sample counts for the time since the previous one, not once per poll."""
+    rollup = SajStatisticsRollup("SAJ", ROLLUP_DESCRIPTIONS)
+    rollup.add({"power": 1000}, 0)
+    rollup.add({"power": 4000}, 10)
+    rollup.add({"power": 1000}, 310)
+
+    assert rollup.rollups()["power"] == (1000, 4000, pytest.approx(1096.8, abs=0.1))
+
+
+def test_period_starts_at_reset() -> None:
+    """The first sample of a period only stands for the time since the reset."""
+    rollup = SajStatisticsRollup("SAJ", ROLLUP_DESCRIPTIONS)
+    rollup.add({"power": 1000}, 0)
+    rollup.reset(250)
+    rollup.add({"power": 4000}, 300)
+    rollup.add({"power": 1000}, 350)
+
+    assert rollup.rollups()["power"] == (1000, 4000, 2500)
+
+
+def test_single_sample_is_the_mean() -> None:
+    """The first sample of a rollup has no weight yet."""
+    rollup = SajStatisticsRollup("SAJ", ROLLUP_DESCRIPTIONS)
+    rollup.add({"power": 1000}, 0)
+
+    assert rollup.rollups()["power"] == (1000, 1000, 1000)
+
+
+class StatisticMeanType(Enum):
+    """Mean types of the recorder since Home Assistant 2025.4."""
+
+    NONE = 0
+    ARITHMETIC = 1
+    CIRCULAR = 2
+
+
+class StatisticData(TypedDict, total=False):
+    """Statistic data of the recorder."""
+
+    start: datetime
+    mean: float
+    min: float
+    max: float
+
+
+class StatisticMetaData(TypedDict):
+    """Statistic metadata of the recorder as of Home Assistant 2025.10."""
+
+    has_mean: bool
+    mean_type: StatisticMeanType
+    has_sum: bool
+    name: str | None
+    source: str
+    statistic_id: str
+    unit_class: str | None
+    unit_of_measurement: str | None
+
+
+class LegacyStatisticMetaData(TypedDict):
+    """Statistic metadata of the recorder before Home Assistant 2025.4."""
+
+    has_mean: bool
+    has_sum: bool
+    name: str | None
+    source: str
+    statistic_id: str
+    unit_of_measurement: str | None
+
+
+def recorder_modules(metadata: type) -> dict[str, ModuleType]:
+    """Return stand-ins of the recorder modules the rollups import.
+
+    The recorder needs SQLAlchemy, which the tests do not install.
+    """
+    recorder = ModuleType("homeassistant.components.recorder")
+    models = ModuleType("homeassistant.components.recorder.models")
+    models.StatisticData = StatisticData
+    models.StatisticMetaData = metadata
+    if "mean_type" in metadata.__annotations__:
+        models.StatisticMeanType = StatisticMeanType
+    statistics = ModuleType("homeassistant.components.recorder.statistics")
+    statistics.async_add_external_statistics = Mock()
+    recorder.models = models
+    recorder.statistics = statistics
+    return {module.__name__: module for module in (recorder, models, statistics)}
+
+
+def test_failed_import_keeps_the_period() -> None:
+    """The accumulators are only reset once the statistics are imported."""
+    modules = recorder_modules(StatisticMetaData)
+    statistics = modules["homeassistant.components.recorder.statistics"]
+    rollup = SajStatisticsRollup("SAJ", ROLLUP_DESCRIPTIONS)
+    rollup.add({"power": 1000}, 0)
+    start = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+    with patch.dict(sys.modules, modules):
+        statistics.async_add_external_statistics.side_effect = HomeAssistantError
+        with pytest.raises(HomeAssistantError):
+            rollup.async_import(Mock(), start)
+        assert "power" in rollup.rollups()
+
+        statistics.async_add_external_statistics.side_effect = None
+        rollup.async_import(Mock(), start)
+    add_statistics = statistics.async_add_external_statistics
+    assert add_statistics.call_args.args[2][0]["start"] == start
+    assert not rollup.rollups()
+
+
+@pytest.mark.parametrize(
+    ("metadata", "expected"),
+    [
+        (
+            StatisticMetaData,
+            {"mean_type": StatisticMeanType.ARITHMETIC, "unit_class": "power"},
+        ),
+        (LegacyStatisticMetaData, {}),
+    ],
+)
+def test_metadata_matches_the_recorder(metadata: type, expected: dict) -> None:
+    """The metadata has the keys of the recorder version it is imported into."""
+    modules = recorder_modules(metadata)
+    rollup = SajStatisticsRollup("SAJ", ROLLUP_DESCRIPTIONS)
+    rollup.add({"power": 1000}, 0)
+
+    with patch.dict(sys.modules, modules):
+        rollup.async_import(Mock(), datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+    add_statistics = modules[
+        "homeassistant.components.recorder.statistics"].async_add_external_statistics
+    assert add_statistics.call_args.args[1] == {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "SAJ The inverter outputs active power",
+        "source": "saj_r6_modbus",
+        "statistic_id": "saj_r6_modbus:saj_power",
+        "unit_of_measurement": "W",
+        **expected,
+    }
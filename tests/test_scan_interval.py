@@ -0,0 +1,27 @@
+"""Adaptive scan interval."""
+
+from common import async_test, async_test_home_assistant
+
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection
+from custom_components.saj_r6_modbus.hub import SAJModbusHub
+
+
+@async_test
+async def test_only_waiting_or_dark_inverters_poll_slowly() -> None:
+    """A faulted inverter keeps the normal scan interval, a waiting one slows down."""
+    async with async_test_home_assistant() as hass:
+        hub = SAJModbusHub(
+            hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60,
+            min_scan_interval=5, max_scan_interval=300,
+        )
+        fault = {"mpvmode": "Fault", "power": 0, "dcpower": 0}
+        assert hub._next_scan_interval(fault, fault) == 300
+        fault = {"mpvmode": "Fault", "power": 0, "dcpower": 2000}
+        assert hub._next_scan_interval(fault, fault) == 60
+        assert hub._next_scan_interval(fault, {}) == 60
+        wait = {"mpvmode": "Wait", "power": 0, "dcpower": 120}
+        assert hub._next_scan_interval(wait, wait) == 300
+        assert hub._next_scan_interval(wait, {}) == 300
+        producing = {"mpvmode": "Grid connected", "power": 5000, "dcpower": 5200}
+        assert hub._next_scan_interval(producing, producing) == 60
+        hub.close()
@@ -0,0 +1,57 @@
+"""Snapshot of the last realtime data restored at startup."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from common import async_test, async_test_home_assistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from custom_components.saj_r6_modbus.connection import SAJModbusConnection
+from custom_components.saj_r6_modbus.const import DOMAIN
+from custom_components.saj_r6_modbus.hub import SAJModbusHub
+
+SERIAL_NUMBER = "R6S2153J2301E00001"
+DATA = {
+    "power": 5000,
+    "todayenergy": 12.5,
+    "monthenergy": 250.0,
+    "yearenergy": 3000.0,
+    "totalenergy": 45000.0,
+}
+
+
+async def async_restored_data(data_updated: datetime) -> dict:
+    """Save a snapshot of DATA polled at the given time and restore it."""
+    device = dr.DeviceEntry(identifiers={(DOMAIN, "SAJ")}, serial_number=SERIAL_NUMBER)
+    async with async_test_home_assistant() as hass:
+        hub = SAJModbusHub(hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60)
+        hub.inverter_data = {"sn": SERIAL_NUMBER}
+        hub._inverter_data_updated = dt_util.utcnow()
+        hub._data_updated = data_updated
+        hub.data = {**DATA, "pollduration": 0.1}
+        await hub._store.async_save(hub._data_to_store())
+
+        restored = SAJModbusHub(hass, "SAJ", SAJModbusConnection("127.0.0.1", 502), 1, 60)
+        with patch.object(dr.DeviceRegistry, "async_get_device", return_value=device):
+            await restored.async_restore_snapshot()
+        return restored.data
+
+
+@async_test
+async def test_snapshot_restores_current_period() -> None:
+    """Totals of the running periods are restored, diagnostics are not stored."""
+    data = await async_restored_data(dt_util.utcnow())
+    assert data == DATA
+
+
+@async_test
+async def test_snapshot_drops_ended_periods() -> None:
+    """Totals counted in a period that has ended are not restored."""
+    yesterday = dt_util.start_of_local_day() - timedelta(minutes=1)
+    data = await async_restored_data(yesterday)
+    assert "todayenergy" not in data
+    assert data["totalenergy"] == DATA["totalenergy"]
+
+    data = await async_restored_data(dt_util.utcnow() - timedelta(days=400))
+    assert data.keys() == {"power", "totalenergy"}
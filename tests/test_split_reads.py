@@ -0,0 +1,87 @@
+"""Split reads of the realtime block against a simulated gateway."""
+
+from common import async_poll, async_polling_hub, async_test
+
+from custom_components.saj_r6_modbus.const import (
+    MAX_READ_COUNT,
+    READ_LIMIT_FAILURES,
+    READ_LIMIT_RECOVERY_POLLS,
+    REALTIME_DATA_ADDRESS,
+)
+
+
+def realtime_requests(gateway) -> list[tuple[int, int, int]]:
+    """Return the requests of the realtime block."""
+    return [
+        request
+        for request in gateway.requests
+        if REALTIME_DATA_ADDRESS <= request[1] < REALTIME_DATA_ADDRESS + 0x100
+    ]
+
+
+@async_test
+async def test_pdu_limit_is_learned() -> None:
+    """Every poll is complete, and repeated oversize reads lower the block size."""
+    async with async_polling_hub(max_read_count=40) as (hub, gateway):
+        for _ in range(READ_LIMIT_FAILURES):
+            data = await async_poll(hub)
+            assert isinstance(data["power"], int)
+            assert isinstance(data["pv1strcurr2"], float)
+        assert hub._connection.max_read_count <= 40
+        assert not hub._unreadable_registers
+
+        gateway.requests.clear()
+        assert await async_poll(hub)
+        assert all(count <= 40 for _, _, count in gateway.requests)
+
+
+@async_test
+async def test_read_limit_grows_back() -> None:
+    """A lowered block size is tried doubled after a run of good polls."""
+    async with async_polling_hub(max_read_count=40) as (hub, gateway):
+        for _ in range(READ_LIMIT_FAILURES):
+            await async_poll(hub)
+        lowered = hub._connection.max_read_count
+        gateway.max_read_count = MAX_READ_COUNT
+        for _ in range(READ_LIMIT_RECOVERY_POLLS):
+            assert await async_poll(hub)
+        assert hub._connection.max_read_count == min(lowered * 2, MAX_READ_COUNT)
+
+
+@async_test
+async def test_busy_replies_do_not_shrink_reads() -> None:
+    """Occasional busy replies neither lower the block size nor skip registers."""
+    async with async_polling_hub(busy_every=7) as (hub, gateway):
+        for _ in range(30):
+            await async_poll(hub)
+        assert hub._connection.max_read_count == MAX_READ_COUNT
+        assert not hub._unreadable_registers
+
+
+@async_test
+async def test_sleeping_inverter_is_not_bisected() -> None:
+    """Gateway errors fail the poll without splitting the reads."""
+    async with async_polling_hub(asleep=True) as (hub, gateway):
+        assert await async_poll(hub) is None
+        assert len(realtime_requests(gateway)) == 1
+        assert hub._connection.max_read_count == MAX_READ_COUNT
+        assert not hub._unreadable_registers
+
+
+@async_test
+async def test_illegal_register_is_skipped() -> None:
+    """Only the register refused as illegal address is skipped."""
+    async with async_polling_hub(illegal={0x6020}) as (hub, gateway):
+        data = await async_poll(hub)
+        assert "qpower" not in data
+        assert isinstance(data["power"], int)
+        assert isinstance(data["l1volt"], float)
+        assert hub._unreadable_registers == {0x6020}
+        assert hub._connection.max_read_count == MAX_READ_COUNT
+
+        gateway.requests.clear()
+        assert await async_poll(hub)
+        assert all(
+            not address <= 0x6020 < address + count
+            for _, address, count in gateway.requests
+        )